@@ -0,0 +1,551 @@
+"""Throughput benchmarks
+
+Run from the repository root, optionally selecting benchmarks by name:
+
+    python test/benchmark.py [name ...]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from glob import glob
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import wavedrom
+
+files = sorted(glob(os.path.join(os.path.dirname(__file__), "files", "*.json")))
+benchmarks = {}
+
+
+def benchmark(func):
+    benchmarks[func.__name__] = func
+    return func
+
+
+def report(name, seconds, count, unit="diagrams"):
+    print("  {:<24} {:9.3f} ms  {:10.1f} {}/s".format(name, seconds * 1000, count / seconds, unit))
+
+
+def best(stmt, repeat=3, number=1):
+    return min(timeit.repeat(stmt, repeat=repeat, number=number)) / number
+
+
+@benchmark
+def render_many(copies=5):
+    """render_many() against a loop over render() on the test corpus"""
+    sources = [open(f).read() for f in files] * copies
+    report("render() loop", best(lambda: [wavedrom.render(s) for s in sources]), len(sources))
+    report("render_many()", best(lambda: wavedrom.render_many(sources)), len(sources))
+
+
+@benchmark
+def parse(copies=20):
+    """Parsing the test corpus: YAML round-trip against wavedrom.wavejson"""
+    import json
+    import yaml
+    from wavedrom import wavejson
+
+    sources = [open(f).read() for f in files] * copies
+    report(
+        "yaml + json round-trip",
+        best(lambda: [json.loads(json.dumps(yaml.load(s, Loader=yaml.FullLoader))) for s in sources]),
+        len(sources),
+    )
+    report("wavejson.loads()", best(lambda: [wavejson.loads(s) for s in sources]), len(sources))
+    relaxed = [s for s in sources if s.lstrip().startswith("{signal")]
+    report("  relaxed sources only", best(lambda: [wavejson.loads(s) for s in relaxed]), len(relaxed))
+
+
+def wide_diagram(lanes=16, cycles=2000):
+    waves = ["p", "01", "x=x=", "1.0.", "=.=.=.|."]
+    return {
+        "signal": [
+            {
+                "name": "lane{}".format(i),
+                "wave": (waves[i % len(waves)] * cycles)[:cycles],
+                "data": ["d{}".format(j) for j in range(cycles)],
+            }
+            for i in range(lanes)
+        ]
+    }
+
+
+@benchmark
+def backend(lanes=16, cycles=2000):
+    """Rendering and serializing a wide diagram with each SVG backend"""
+    source = wide_diagram(lanes, cycles)
+    for name in ["svgwrite", "text"]:
+        report(
+            name,
+            best(lambda: wavedrom.render(source, backend=name).tostring()),
+            lanes * cycles,
+            "cycles",
+        )
+
+
+@benchmark
+def validate(lanes=1000, cycles=32):
+    """Rendering a 1000 lane diagram with and without svgwrite validation"""
+    source = wide_diagram(lanes, cycles)
+    for name, options in [
+        ("svgwrite", {}),
+        ("svgwrite, no validation", {"validate": False}),
+        ("text", {"backend": "text"}),
+    ]:
+        report(
+            name,
+            best(lambda: wavedrom.render(source, **options).tostring()),
+            lanes,
+            "lanes",
+        )
+
+
+@benchmark
+def stream(cycles=64):
+    """Peak memory of writing a drawing against streaming it, by lane count"""
+    import tracemalloc
+    from wavedrom.waveform import WaveDrom
+
+    for lanes in [100, 400, 1600]:
+        source = wide_diagram(lanes, cycles)
+        for name, write in [
+            ("drawing", lambda out: wavedrom.render(source, backend="text").write(out)),
+            ("stream", lambda out: WaveDrom("text").write_waveform(out, 0, source)),
+        ]:
+            tracemalloc.start()
+            start = timeit.default_timer()
+            write(NullWriter())
+            seconds = timeit.default_timer() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print("  {:>5} lanes {:<8} {:9.2f} MB peak {:9.3f} s".format(lanes, name, peak / 2**20, seconds))
+
+
+@benchmark
+def merge_bricks(cycles=10000):
+    """SVG size of long, mostly idle lanes with and without merged brick runs"""
+    import re
+
+    idle = "0" + "." * (cycles - 2) + "1"
+    bus = ("=" + "." * 99) * (cycles // 100)
+    source = {"signal": [{"name": "idle", "wave": idle}, {"name": "bus", "wave": bus}], "config": {"hscale": 4}}
+    for name, options in [("one use per brick", {}), ("merge_bricks", {"merge_bricks": True})]:
+        seconds = best(lambda: wavedrom.render(source, backend="text", **options).tostring())
+        svg = wavedrom.render(source, backend="text", **options).tostring()
+        lanes = re.findall(r'<g id="wavelane_draw_.*?</g>', svg)
+        print(
+            "  {:<20} {:9.3f} ms {:9.1f} kB SVG, lanes {:8.1f} kB in {:6} elements".format(
+                name,
+                seconds * 1000,
+                len(svg) / 1000,
+                sum(map(len, lanes)) / 1000,
+                sum(l.count("<") for l in lanes),
+            )
+        )
+
+
+@benchmark
+def prune_defs():
+    """SVG size of the waveforms in the test corpus with all or only referenced skin defs"""
+    sources = [wavedrom.parse(open(f).read()) for f in files]
+    sources = [s for s in sources if s.get("signal")]
+    full = sum(len(wavedrom.render(s, backend="text").tostring()) for s in sources)
+    pruned = sum(len(wavedrom.render(s, backend="text", prune_defs=True).tostring()) for s in sources)
+    print("  {} waveforms".format(len(sources)))
+    print("  {:<20} {:9.1f} kB".format("all defs", full / 1000))
+    print("  {:<20} {:9.1f} kB  ({:.0%} smaller)".format("prune_defs", pruned / 1000, 1 - pruned / full))
+
+
+@benchmark
+def parse_wave_lane(length=100000):
+    """WaveDrom.parse_wave_lane() on 100k character waves, checked against the brick regressions"""
+    from wavedrom.waveform import WaveDrom
+    from brick_regressions import all as regressions
+
+    def parse(wave, hscale=1, period=1, phase=0):
+        w = WaveDrom()
+        w.lane.hscale = hscale
+        w.lane.period = period
+        w.lane.phase = phase
+        return w.parse_wave_lane(wave, period * hscale - 1)
+
+    for test in regressions:
+        assert parse(test.wave, test.hscale, test.period, test.phase) == test.expected, test
+
+    waves = {
+        "clock": "p" + "." * (length - 1),
+        "toggling": ("01" * length)[:length],
+        "mixed": ("0.1..x=.=3|4.hlHL" * length)[:length],
+        "subcycle": ("0<1.0>=<.x>" * length)[:length],
+    }
+    for name, wave in waves.items():
+        for hscale in [1, 4]:
+            report(
+                "{} hscale {}".format(name, hscale),
+                best(lambda: parse(wave, hscale)),
+                length,
+                "chars",
+            )
+
+
+@benchmark
+def cache(copies=5):
+    """Rendering the test corpus through an empty and a filled RenderCache"""
+    import tempfile
+
+    sources = [open(f).read() for f in files] * copies
+    report("render()", best(lambda: [wavedrom.render(s).tostring() for s in sources]), len(sources))
+    with tempfile.TemporaryDirectory() as directory:
+        cache = wavedrom.RenderCache(directory)
+
+        def render_cold():
+            cache.clear()
+            return [cache.render(s).tostring() for s in sources[: len(files)]]
+
+        report("cache misses", best(render_cold), len(files))
+        report("cache hits", best(lambda: [cache.render(s).tostring() for s in sources]), len(sources))
+
+
+@benchmark
+def lane_cache(lanes=500, cycles=500):
+    """Parsing and rendering lanes that repeat a few patterns, with and without the lane cache"""
+    from wavedrom.waveform import LaneCache, WaveDrom
+
+    source = wide_diagram(lanes, cycles)
+    for name, cache in [("no lane cache", None), ("lane cache", LaneCache())]:
+        WaveDrom.lane_cache = cache
+        w = WaveDrom(backend="text")
+        w.lane.hscale = 1
+        report("{}: parse".format(name), best(lambda: w.parse_wave_lanes(source["signal"])), lanes, "lanes")
+        report("{}: render".format(name), best(lambda: wavedrom.render(source, backend="text")), lanes, "lanes")
+    WaveDrom.lane_cache = wavedrom.waveform.lane_cache
+
+
+@benchmark
+def text_width(count=10000):
+    """Widths of 10k lane names: a Python loop over the table against FontMetrics"""
+    import random
+    from wavedrom.metrics import FontMetrics, char_widths
+
+    rng = random.Random(0)
+    prefixes = ["clk", "rst_n", "data", "addr", "valid", "ready", "axi_awaddr", "irq"]
+    # Lane names repeat across diagrams, about 1000 distinct names
+    distinct = ["{}_{}".format(rng.choice(prefixes), rng.randrange(count // 80)) for _ in range(count // 10)]
+    names = [rng.choice(distinct) for _ in range(count)]
+
+    def loop():
+        # The table was a list literal built on every call
+        widths = []
+        for n in names:
+            table = list(char_widths)
+            widths.append(sum([table[ord(c)] if ord(c) < len(table) else 114 for c in n]) * 11 / 100)
+        return widths
+
+    report("list and python loop", best(loop), count, "names")
+    m = FontMetrics(char_widths)
+    report("FontMetrics, uncached", best(lambda: [m.gen_units(n) * 11 / 100 for n in names]), count, "names")
+    report("FontMetrics, memoized", best(lambda: [m.width(n) for n in names]), count, "names")
+
+
+def assign_tree(depth, gates="&|^"):
+    """A balanced assign tree of 2**depth leaves"""
+
+    def tree(d, n):
+        if d == 0:
+            return "in{}".format(n)
+        return [gates[d % len(gates)], tree(d - 1, 2 * n), tree(d - 1, 2 * n + 1)]
+
+    return {"assign": [["out", tree(depth, 0)]]}
+
+
+@benchmark
+def assign_grid():
+    """Rendering assign trees of increasing depth, the grid used to be one rect per dot"""
+    for depth in range(2, 11, 2):
+        source = assign_tree(depth)
+        seconds = best(lambda: wavedrom.render(source).tostring())
+        size = len(wavedrom.render(source).tostring())
+        print("  depth {:2} {:5} leaves {:9.3f} ms {:9.1f} kB".format(depth, 2**depth, seconds * 1000, size / 1000))
+
+
+@benchmark
+def assign_layout():
+    """Layout and text backend rendering of assign trees with up to 100k leaves and 10k deep chains"""
+    from wavedrom.assign import Assign
+
+    for depth in [10, 14, 17]:
+        source = assign_tree(depth)
+        layout = best(lambda: Assign().layout(source["assign"]))
+        render = best(lambda: wavedrom.render(source, backend="text").tostring(), repeat=1)
+        print("  {:6} leaves layout {:9.3f} ms render {:9.3f} s".format(2**depth, layout * 1000, render))
+    for depth in [1000, 10000]:
+        tree = "a"
+        for _ in range(depth):
+            tree = ["~", tree]
+        source = {"assign": [["out", tree]]}
+        render = best(lambda: wavedrom.render(source, backend="text").tostring(), repeat=1)
+        print("  {:6} deep chain render {:9.3f} s".format(depth, render))
+
+
+@benchmark
+def assign_shared(consumers=64):
+    """A 256 leaf subexpression feeding 64 gates, duplicated in every tree against shared"""
+    shared = assign_tree(8)["assign"][0][1]
+    for name, source in [
+        ("duplicated", {"assign": [["o{}".format(i), ["&", shared, "i{}".format(i)]] for i in range(consumers)]}),
+        (
+            "shared",
+            {
+                "assign": [["o{}".format(i), ["&", "s", "i{}".format(i)]] for i in range(consumers)],
+                "shared": {"s": shared},
+            },
+        ),
+    ]:
+        seconds = best(lambda: wavedrom.render(source, backend="text").tostring())
+        size = len(wavedrom.render(source, backend="text").tostring())
+        print("  {:<12} {:9.3f} ms {:9.1f} kB".format(name, seconds * 1000, size / 1000))
+
+
+def register_map(count=2000, seed=0):
+    """`count` random 32 bit registers of 1 to 16 bit fields"""
+    import random
+
+    rng = random.Random(seed)
+    registers = []
+    for r in range(count):
+        fields = []
+        bits = 0
+        while bits < 32:
+            field = {"bits": min(32 - bits, rng.choice([1, 1, 2, 3, 4, 8, 16]))}
+            if rng.random() < 0.8:
+                field["name"] = "F{}_{}".format(r, bits)
+                field["attr"] = rng.choice(["RW", "RO", "W1C"])
+            fields.append(field)
+            bits += field["bits"]
+        registers.append({"reg": fields, "config": {"lanes": rng.choice([1, 2, 4])}})
+    return registers
+
+
+@benchmark
+def register_map_render(count=2000):
+    """Rendering a map of 2000 registers, and single registers of many one bit fields"""
+    registers = register_map(count)
+    report("render() loop", best(lambda: [wavedrom.render(r, backend="text") for r in registers]), count, "registers")
+    report("render_register_map()", best(lambda: wavedrom.render_register_map(registers, backend="text")), count, "registers")
+    for bits in [256, 1024]:
+        source = {"reg": [{"name": str(i), "bits": 1} for i in range(bits)], "config": {"bits": bits, "lanes": bits // 16}}
+        report("{} bits, {} lanes".format(bits, bits // 16), best(lambda: wavedrom.render(source, backend="text")), 1, "registers")
+
+
+@benchmark
+def register_map_document():
+    """Peak memory of rendering register maps as separate drawings against one streamed document"""
+    import tracemalloc
+
+    for count in [100, 400, 1600]:
+        registers = [dict(r, name="REG{}".format(i)) for i, r in enumerate(register_map(count))]
+        for name, write in [
+            ("drawings", lambda out: [d.write(out) for d in wavedrom.render_register_map(registers, backend="text")]),
+            ("document", lambda out: wavedrom.write_register_map(registers, out, backend="text")),
+        ]:
+            tracemalloc.start()
+            start = timeit.default_timer()
+            write(NullWriter())
+            seconds = timeit.default_timer() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print("  {:>5} registers {:<9} {:9.2f} MB peak {:9.3f} s".format(count, name, peak / 2**20, seconds))
+
+
+@benchmark
+def import_time(repeat=10):
+    """Wall time of importing wavedrom and rendering a first diagram in a new interpreter"""
+    import subprocess
+
+    def run(code):
+        return best(lambda: subprocess.run([sys.executable, "-c", code], check=True), repeat=repeat)
+
+    source = "{signal: [{wave: '01'}]}"
+    report("python -c pass", run("pass"), 1, "runs")
+    report("import wavedrom", run("import wavedrom"), 1, "runs")
+    for backend in ["text", "svgwrite"]:
+        code = "import wavedrom; wavedrom.render({!r}, backend={!r}).tostring()".format(source, backend)
+        report("render, " + backend, run(code), 1, "runs")
+
+
+@benchmark
+def serve(count=50):
+    """Rendering the test corpus with one process per diagram against the render server"""
+    import io
+    import json
+    import subprocess
+    import tempfile
+    from wavedrom.server import Server
+
+    sources = [open(f).read() for f in files]
+
+    def processes():
+        with tempfile.TemporaryDirectory() as directory:
+            for i, f in enumerate(files[:count]):
+                svg = os.path.join(directory, "{}.svg".format(i))
+                subprocess.run([sys.executable, "-c", "import wavedrom; wavedrom.main()", "-i", f, "-s", svg], check=True)
+
+    report("process per diagram", best(processes, repeat=1), min(count, len(files)))
+    requests = "".join(json.dumps({"id": i, "source": s}) + "\n" for i, s in enumerate(sources))
+    for jobs in [1, 4]:
+        server = Server(jobs)
+        server.serve_stdio(io.StringIO(requests), io.StringIO())  # start the workers
+        report(
+            "server, {} jobs".format(jobs),
+            best(lambda: server.serve_stdio(io.StringIO(requests), io.StringIO())),
+            len(sources),
+        )
+        server.close()
+
+
+def write_dump(f, cycles, buses=8):
+    """A dump of a clock and `buses` 16 bit counters"""
+    ids = [chr(34 + i) for i in range(buses)]
+    f.write("$timescale 1ns $end\n$scope module top $end\n$var wire 1 ! clk $end\n")
+    for i, id in enumerate(ids):
+        f.write("$var wire 16 {} bus{} [15:0] $end\n".format(id, i))
+    f.write("$upscope $end\n$enddefinitions $end\n")
+    for cycle in range(cycles):
+        f.write("#{}\n1!\n".format(10 * cycle))
+        f.write("".join("b{:b} {}\n".format((cycle >> i) & 0xFFFF, id) for i, id in enumerate(ids)))
+        f.write("#{}\n0!\n".format(10 * cycle + 5))
+
+
+@benchmark
+def hbounds(window=100):
+    """Rendering a window of long waveforms with config.hbounds"""
+    for cycles in [10000, 100000, 1000000]:
+        n = cycles // 9
+        source = {
+            "signal": [
+                {"wave": "0.1=.x2.|" * n, "data": list(range(2 * n)), "label": "a." * n, "node": ".a" * n},
+                {"wave": "p" + "." * (9 * n - 1)},
+            ],
+            "head": {"tick": 0},
+            "config": {"hbounds": [cycles // 2, cycles // 2 + window]},
+        }
+        seconds = best(lambda: wavedrom.render(source, backend="text").tostring(), repeat=1)
+        report("{} cycles".format(cycles), seconds, 1)
+
+
+@benchmark
+def tiles(cycles=20000, tile=500):
+    """A long waveform as one SVG against tiles of a few hundred cycles"""
+    n = cycles // 9
+    source = {
+        "signal": [
+            {"name": "a", "wave": "0.1=.x2.|" * n, "data": list(range(2 * n))},
+            {"name": "clk", "wave": "p" + "." * (9 * n - 1)},
+        ],
+        "head": {"tick": 0},
+    }
+    report("one SVG", best(lambda: wavedrom.render(source, backend="text").tostring(), repeat=1), 1)
+    count = len(wavedrom.render_tiles(source, tile, backend="text"))
+    for jobs in [1, 4]:
+        seconds = best(lambda: wavedrom.render_tiles(source, tile, jobs, backend="text"), repeat=1)
+        report("tiles, {} jobs".format(jobs), seconds, count, "tiles")
+
+
+@benchmark
+def target_width(width=1000):
+    """Long waveforms at full width against narrowed to a target width"""
+    for cycles in [10000, 100000]:
+        n = cycles // 9
+        source = {
+            "signal": [
+                {"name": "a", "wave": "0.1=.x2.|" * n, "data": list(range(2 * n))},
+                {"name": "b", "wave": "0" + "." * (cycles // 2) + "1" + "." * (cycles // 2)},
+                {"name": "clk", "wave": "p" + "." * (9 * n - 1)},
+            ],
+            "head": {"tick": 0},
+        }
+        for options in [{}, {"target_width": width}]:
+            svg = wavedrom.render(source, backend="text", **options).tostring()
+            seconds = best(lambda: wavedrom.render(source, backend="text", **options).tostring(), repeat=1)
+            name = "{} cycles, {}".format(cycles, "target width" if options else "full")
+            report(name, seconds, 1)
+            print("  {:<24} {:9.0f} kB".format("", len(svg) / 1000))
+
+
+@benchmark
+def vcd(cycles=200000):
+    """Converting a value change dump to WaveJSON, whole and a window at the start"""
+    import tempfile
+    import tracemalloc
+    from wavedrom.vcd import to_wavejson
+
+    with tempfile.NamedTemporaryFile("w", suffix=".vcd") as f:
+        write_dump(f, cycles)
+        f.flush()
+        print("  {} cycles, {:.1f} MB".format(cycles, os.path.getsize(f.name) / 2**20))
+        for name, options in [
+            ("all cycles", {}),
+            ("cycles 0-1000", {"end": 1000}),
+        ]:
+
+            def convert():
+                with open(f.name) as dump:
+                    to_wavejson(dump, ["bus0", "bus5"], clock="clk", **options)
+
+            seconds = best(convert, repeat=1)
+            tracemalloc.start()
+            convert()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print("  {:<24} {:9.3f} s {:9.2f} MB peak".format(name, seconds, peak / 2**20))
+
+
+@benchmark
+def vcd_index(cycles=1000000, window=200):
+    """Reading a window from the middle of a long dump by streaming against an index"""
+    import tempfile
+    from wavedrom.vcd import TraceIndex, to_wavejson
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sim.vcd")
+        index_path = os.path.join(directory, "sim.idx")
+        with open(path, "w") as f:
+            write_dump(f, cycles, buses=2)
+        start = cycles // 2
+        print("  {} cycles, {:.1f} MB, cycles {}-{}".format(cycles, os.path.getsize(path) / 2**20, start, start + window))
+
+        def stream():
+            with open(path) as f:
+                return to_wavejson(f, ["bus0"], clock="clk", start=start, end=start + window)
+
+        report("stream", best(stream, repeat=1), 1, "windows")
+        report("build index", best(lambda: TraceIndex.load(path, index_path, clock="clk").close(), repeat=1), 1, "indexes")
+        print("  index file {:.2f} MB".format(os.path.getsize(index_path) / 2**20))
+        report("load index", best(lambda: TraceIndex.load(path, index_path, clock="clk").close()), 1, "indexes")
+        index = TraceIndex.load(path, index_path, clock="clk")
+        assert index.window(["bus0"], start, start + window) == stream()
+        report("indexed window", best(lambda: index.window(["bus0"], start, start + window), number=10), 1, "windows")
+        index.close()
+
+
+class NullWriter(object):
+    def write(self, text):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    args = parser.parse_args()
+    for name in args.names:
+        if name not in benchmarks:
+            parser.error("unknown benchmark {}, choose from {}".format(name, ", ".join(sorted(benchmarks))))
+    for name in args.names or sorted(benchmarks):
+        print("{}: {}".format(name, benchmarks[name].__doc__))
+        benchmarks[name]()
+
+
+if __name__ == "__main__":
+    main()
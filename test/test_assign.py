@@ -0,0 +1,126 @@
+import re
+
+import pytest
+
+import wavedrom
+
+
+def test_assign_grid():
+    svg = wavedrom.render(open("test/files/assign_xor.json").read()).tostring()
+    # One dot in the pattern, one rect filled with it
+    assert svg.count('class="grid"') == 1
+    assert svg.count('fill="url(#grid_0)"') == 1
+    width, height = map(int, re.search(r'viewBox="0 0 (\d+) (\d+)"', svg).groups())
+    grid = re.search(r'<rect fill="url\(#grid_0\)" height="(\d+)" width="(\d+)"', svg)
+    # The dots cover the whole drawing
+    assert int(grid.group(2)) == width
+    assert int(grid.group(1)) >= height
+
+
+def chain(depth):
+    """An assign tree of `depth` nested gates"""
+    tree = "a"
+    for i in range(depth):
+        tree = ["~", tree]
+    return {"assign": [["out", tree]]}
+
+
+def balanced(depth, n=0):
+    if depth == 0:
+        return "in{}".format(n)
+    return ["&|"[depth % 2], balanced(depth - 1, 2 * n), balanced(depth - 1, 2 * n + 1)]
+
+
+def test_assign_layout():
+    a = wavedrom.assign.Assign()
+    source = {"assign": [["out", ["|", ["&", ["~", "a"], "b"], "c"]], ["o2", "d"]]}
+    roots, y, xmax = a.layout(source["assign"])
+    out, o2 = roots
+    assert (out.name, out.x, out.y) == ("out", 0, 4)
+    gate = out.children[0]
+    assert (gate.name, gate.x, gate.y) == ("|", 1, 4)
+    assert [(c.name, c.x, c.y) for c in gate.children] == [("&", 2, 3), ("c", 2, 6)]
+    assert [(c.name, c.x, c.y) for c in gate.children[0].children] == [("~", 3, 2), ("b", 3, 4)]
+    assert gate.children[1].children is None
+    assert (o2.y, o2.children[0].y) == (8, 8)
+    assert (y, xmax) == (10, 3)
+    # The source is left alone
+    assert source["assign"][0] == ["out", ["|", ["&", ["~", "a"], "b"], "c"]]
+
+
+@pytest.mark.parametrize("backend", ["text", "svgwrite"])
+def test_assign_deep_chain(backend):
+    depth = 5000
+    roots, y, xmax = wavedrom.assign.Assign().layout(chain(depth)["assign"])
+    assert xmax == depth
+    svg = wavedrom.render(chain(depth), backend=backend).tostring()
+    assert svg.count('class="gate"') == depth
+
+
+def test_assign_many_leaves():
+    depth = 17
+    roots, y, xmax = wavedrom.assign.Assign().layout([["out", balanced(depth)]])
+    assert (y, xmax) == (2 + 2 * 2**depth, depth)
+    # The root gate is centered on all inputs
+    assert roots[0].y == 2**depth + 1
+
+
+def test_assign_trees():
+    svg = wavedrom.render(open("test/files/assign_binary2gray.json").read()).tostring()
+    # Every tree is drawn, not only the last
+    assert [n for n in ["g0", "g1", "g2", "g3"] if "<title>{}</title>".format(n) in svg] == ["g0", "g1", "g2", "g3"]
+    assert svg.count('class="gate"') == 4
+
+
+def test_assign_shared():
+    source = {
+        "assign": [["o1", ["|", "t", "c"]], ["o2", ["&", ["^", "t", "d"], "e"]]],
+        "shared": {"t": ["&", "a", "b"]},
+    }
+    roots, y, xmax = wavedrom.assign.Assign().layout(source["assign"], shared=source["shared"])
+    o1, o2, t = roots
+    assert t.name == "t"
+    # Laid out once below the trees, in the column of the deepest reference
+    expr = t.children[0]
+    assert (expr.name, expr.x, expr.y) == ("&", 3, 13)
+    assert [(c.name, c.y) for c in expr.children] == [("a", 12), ("b", 14)]
+    refs = [o1.children[0].children[0], o2.children[0].children[0].children[0]]
+    assert [r.name for r in refs] == ["t", "t"]
+    assert all(r.ref is t for r in refs)
+    assert o2.children[0].children[1].ref is None
+
+    svg = wavedrom.render(source).tostring()
+    assert svg.count("<title>&amp;</title>") == 2
+    assert svg.count("<title>t</title>") == 2
+    # All trees are drawn
+    assert "<title>o1</title>" in svg and "<title>o2</title>" in svg
+
+
+def test_assign_shared_fanout():
+    # A subexpression feeding many gates is drawn once
+    n = 200
+    source = {
+        "assign": [["o{}".format(i), ["&", "s", "i{}".format(i)]] for i in range(n)],
+        "shared": {"s": balanced(6), "u": ["~", "s"]},
+    }
+    svg = wavedrom.render(source, backend="text").tostring()
+    assert svg.count('class="gate"') == n + 2**6 - 1 + 1
+    assert svg.count("<title>s</title>") == n + 1
+
+
+def test_assign_shared_nested():
+    source = {
+        "assign": [["out", ["|", "x", "y"]]],
+        "shared": {"y": ["~", "x"], "x": ["&", "a", "b"]},
+    }
+    roots, y, xmax = wavedrom.assign.Assign().layout(source["assign"], shared=source["shared"])
+    out, sy, sx = roots
+    assert (sy.name, sx.name) == ("y", "x")
+    # x is used by y, so it is placed left of it
+    assert sx.children[0].x > sy.children[0].x
+
+
+def test_assign_shared_cycle():
+    source = {"assign": [["out", "x"]], "shared": {"x": ["~", "y"], "y": ["~", "x"]}}
+    with pytest.raises(ValueError, match="x, y"):
+        wavedrom.render(source)
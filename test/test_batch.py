@@ -0,0 +1,61 @@
+import os
+import shutil
+import sys
+from glob import glob
+
+import pytest
+
+import wavedrom
+
+files = sorted(glob("test/files/tutorial_*.json"))
+
+
+def test_render_files(tmpdir):
+    for f in files:
+        shutil.copy(f, str(tmpdir))
+    tmpdir.join("broken.json").write('{"signal": [')
+
+    results = wavedrom.render_files([str(tmpdir)], jobs=2)
+
+    sources = sorted(glob(os.path.join(str(tmpdir), "*.json")))
+    assert [r.source for r in results] == sources
+    for r in results:
+        if r.source.endswith("broken.json"):
+            assert r.error
+            assert not os.path.exists(r.output)
+        else:
+            assert r.error is None
+            expected = wavedrom.render(open(r.source).read()).tostring()
+            assert expected in open(r.output).read()
+
+
+@pytest.mark.parametrize("option", [["--svg", "out.svg"], ["--stream"], ["--tile", "10"]])
+def test_main_rejects(tmpdir, monkeypatch, capsys, option):
+    for f in files[:2]:
+        shutil.copy(f, str(tmpdir))
+    out = tmpdir.join("out.svg")
+    out.write("keep")
+    monkeypatch.chdir(tmpdir)
+    monkeypatch.setattr(sys, "argv", ["wavedrompy", "-i", str(tmpdir)] + option)
+    with pytest.raises(SystemExit):
+        wavedrom.main()
+    assert "{} cannot be used with multiple inputs".format(option[0]) in capsys.readouterr().err
+    # Neither rendered nor truncated
+    assert out.read() == "keep"
+    assert not glob(str(tmpdir.join("tutorial_*.svg")))
+
+
+def test_main_missing_input(tmpdir, monkeypatch):
+    out = tmpdir.join("out.svg")
+    out.write("keep")
+    monkeypatch.setattr(sys, "argv", ["wavedrompy", "-i", str(tmpdir.join("missing.json")), "-s", str(out)])
+    with pytest.raises(OSError):
+        wavedrom.main()
+    assert out.read() == "keep"
+
+
+def test_main_single(tmpdir, monkeypatch):
+    out = tmpdir.join("out.svg")
+    monkeypatch.setattr(sys, "argv", ["wavedrompy", "-i", files[0], "-s", str(out)])
+    wavedrom.main()
+    assert wavedrom.render(open(files[0]).read()).tostring() in out.read()
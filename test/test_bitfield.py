@@ -0,0 +1,101 @@
+import io
+import xml.dom.minidom
+
+import wavedrom
+from wavedrom.bitfield import BitField, Options
+
+source = {
+    "reg": [
+        {"name": "IPO", "bits": 8, "attr": "RO"},
+        {"bits": 7},
+        {"name": "BRK", "bits": 5, "attr": "RW", "type": 4},
+        {"name": "CPK", "bits": 1, "attr": 0},
+        {"name": "Clear", "bits": 3, "attr": ["001", "110"]},
+        {"bits": 8},
+    ],
+    "config": {"lanes": 4},
+}
+
+
+def test_lane_fields():
+    b = BitField()
+    b.mod = 8
+    desc = [dict(e) for e in source["reg"]]
+    lsb = 0
+    for e in desc:
+        e["lsb"] = lsb
+        lsb += e["bits"]
+        e["msb"] = lsb - 1
+    lanes = b.lane_fields(desc)
+    names = {i: [e.get("name") for e in lane] for i, lane in lanes.items()}
+    # Fields are drawn in the lanes of their lsb and msb
+    assert names == {0: ["IPO"], 1: [None, "BRK"], 2: ["BRK", "CPK", "Clear"], 3: [None]}
+
+
+def test_render_map():
+    registers = [source, {"reg": [{"name": "A", "bits": 16}, {"name": "B", "bits": 16}]}]
+    expected = [wavedrom.render(r, backend="text").tostring() for r in registers]
+    assert [d.tostring() for d in wavedrom.render_register_map(registers, backend="text")] == expected
+    # Plain lists of fields and text sources
+    fields = registers[1]["reg"]
+    svgs = [d.tostring() for d in wavedrom.render_register_map([fields, '{"reg": [{"bits": 8}]}'], backend="text")]
+    assert svgs[0] == expected[1]
+    assert svgs[1] == wavedrom.render({"reg": [{"bits": 8}]}, backend="text").tostring()
+
+
+def test_render_unchanged_source():
+    fields = [{"name": "A", "bits": 16}, {"name": "B", "bits": 16}]
+    BitField().render(fields, Options(lanes=2))
+    assert fields == [{"name": "A", "bits": 16}, {"name": "B", "bits": 16}]
+
+
+def test_plain_text_labels():
+    svg = wavedrom.render({"reg": [{"name": "a&amp;b", "bits": 4}, {"name": "<b>X</b>", "bits": 4}]}).tostring()
+    assert ">a&amp;b</tspan>" in svg
+    assert 'font-weight="bold">X</tspan>' in svg
+
+
+def test_write_register_map():
+    registers = [
+        dict(source, name="CTRL"),
+        [{"name": "A", "bits": 16}, {"name": "B", "bits": 16}],
+        {"reg": [{"name": "C", "bits": 8}], "config": {"bits": 8, "fontsize": 10}},
+    ]
+    f = io.StringIO()
+    wavedrom.write_register_map(registers, f, backend="text")
+    svg = f.getvalue()
+    xml.dom.minidom.parseString(svg)
+    assert svg.count('id="reg_') == 3
+    assert svg.count('class="regname"') == 1
+    # The default font is set once, the third register has its own
+    assert svg.count('font-family="sans-serif" font-size="14"') == 1
+    assert svg.count('font-size="10"') == 1
+    # Height of the registers, the title and the gaps in between
+    assert 'height="{}"'.format(21 + (80 + 16) * 4 + 5 + 16 + 85 + 16 + 85) in svg
+
+    # The lanes are the same as in the drawing of each register
+    font = ' font-family="sans-serif" font-size="14" font-weight="normal" text-anchor="middle"'
+    for r in registers[:2]:
+        drawing = wavedrom.render_register_map([r], backend="text")[0].tostring()
+        lanes = drawing[drawing.index("<defs />") + len("<defs />") : -len("</svg>")]
+        assert lanes.replace(font, "") in svg
+
+
+def test_write_map_generator():
+    registers = [dict(source, name="R{}".format(i)) for i in range(3)]
+    bitfield = BitField(backend="text")
+    expected, f = io.StringIO(), io.StringIO()
+    bitfield.write_map(expected, registers)
+    bitfield.write_map(f, (r for r in registers))
+    assert f.getvalue() == expected.getvalue()
+    assert f.getvalue().count('id="reg_') == 3
+
+
+def test_write_register_map_backends():
+    registers = [dict(source, name="R{}".format(i)) for i in range(3)]
+    svgs = []
+    for backend in ["svgwrite", "text"]:
+        f = io.StringIO()
+        wavedrom.write_register_map(registers, f, backend=backend)
+        svgs.append(f.getvalue())
+    assert svgs[0] == svgs[1]
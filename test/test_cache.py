@@ -0,0 +1,109 @@
+import io
+import os
+import shutil
+import time
+from glob import glob
+
+import wavedrom
+from wavedrom import RenderCache
+from wavedrom.metrics import FontMetrics, char_widths
+
+files = sorted(glob("test/files/tutorial_*.json"))
+
+
+def write(drawing):
+    f = io.StringIO()
+    drawing.write(f)
+    return f.getvalue()
+
+
+def test_cache_hits(tmpdir):
+    cache = RenderCache(str(tmpdir))
+    for f in files:
+        source = open(f).read()
+        expected = write(wavedrom.render(source))
+        assert write(cache.render(source)) == expected
+        assert write(cache.render(source, backend="text")) == expected
+    assert cache.stats == {"hits": len(files), "misses": len(files), "size": cache.size}
+    assert cache.size == sum(os.path.getsize(p) for p in glob(str(tmpdir.join("*.svg"))))
+
+    # A new cache on the same directory finds the entries
+    cache = RenderCache(str(tmpdir))
+    cache.render(open(files[0]).read())
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_cache_key():
+    cache_key = RenderCache.key
+    source = {"signal": [{"name": "clk", "wave": "p...."}]}
+    key = cache_key(source)
+    # Independent of the key order
+    assert cache_key({"signal": [{"wave": "p....", "name": "clk"}]}) == key
+    assert cache_key(source, strict_js_features=True) != key
+    assert cache_key(source, merge_bricks=True) != key
+    assert cache_key(dict(source, config={"skin": "narrow"})) != key
+
+
+def test_cache_key_metrics(monkeypatch):
+    source = {"signal": [{"name": "clk", "wave": "p...."}]}
+    key = RenderCache.key(source)
+    monkeypatch.setitem(wavedrom.metrics.font_metrics, "default", FontMetrics(char_widths, default=100))
+    assert RenderCache.key(source) != key
+    monkeypatch.setitem(wavedrom.metrics.font_metrics, "default", FontMetrics(char_widths))
+    assert RenderCache.key(source) == key
+
+
+def test_cache_eviction(tmpdir):
+    cache = RenderCache(str(tmpdir), max_size=3000)
+    cache.put("a", "x" * 1000)
+    cache.put("b", "x" * 1000)
+    cache.put("c", "x" * 1000)
+    # Make "a" the most recently used entry
+    past = time.time() - 100
+    for name, age in [("a", 0), ("b", 10), ("c", 20)]:
+        os.utime(cache.path(name), (past + age, past + age))
+    assert cache.get("a")
+    cache.put("d", "x" * 1000)
+    # Evicted down to 90% of the maximum size, the oldest entries first
+    assert cache.size == 2000
+    assert cache.get("b") is None and cache.get("c") is None
+    assert cache.get("a") and cache.get("d")
+
+    # The directory is not scanned again until the cache is full
+    scans = []
+    entries = cache.entries
+    cache.entries = lambda: scans.append(1) or entries()
+    cache.put("e", "x" * 900)
+    assert scans == []
+    cache.put("f", "x" * 200)
+    assert scans == [1] and cache.size <= 2700
+
+
+def test_cache_replace(tmpdir):
+    cache = RenderCache(str(tmpdir), max_size=3000)
+    cache.put("a", "x" * 1000)
+    cache.put("b", "x" * 1000)
+    for i in range(5):
+        cache.put("a", "x" * 500)
+    assert cache.size == 1500
+    assert cache.get("b")
+
+
+def test_cache_no_diagram(tmpdir):
+    cache = RenderCache(str(tmpdir))
+    assert cache.render({"config": {}}) is None
+    assert cache.size == 0
+
+
+def test_render_files_cache(tmpdir):
+    for f in files:
+        shutil.copy(f, str(tmpdir))
+    cache_dir = str(tmpdir.join("cache"))
+
+    results = wavedrom.render_files([str(tmpdir.join("*.json"))], jobs=2, cache_dir=cache_dir)
+    assert [r.cached for r in results] == [False] * len(files)
+    results = wavedrom.render_files([str(tmpdir.join("*.json"))], cache_dir=cache_dir)
+    assert [r.cached for r in results] == [True] * len(files)
+    for r in results:
+        assert open(r.output).read() == write(wavedrom.render(open(r.source).read()))
+    assert "cache: {} hits, 0 misses".format(len(files)) in wavedrom.batch.summary(results, 1)
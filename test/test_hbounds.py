@@ -0,0 +1,106 @@
+import re
+import xml.etree.ElementTree as ET
+
+import pytest
+
+import wavedrom
+from wavedrom.waveform import WaveDrom
+
+SVG = "{http://www.w3.org/2000/svg}"
+HREF = "{http://www.w3.org/1999/xlink}href"
+
+
+def render(source):
+    return ET.fromstring(wavedrom.render(source, backend="text").tostring())
+
+
+def bricks(root, lane=0):
+    g = root.find(".//{}g[@id='wavelane_draw_{}_0']".format(SVG, lane))
+    return [e.get(HREF)[1:] for e in g.iter(SVG + "use")]
+
+
+def texts(root, id):
+    return ["".join(t.itertext()) for t in root.find(".//{}g[@id='{}']".format(SVG, id)).iter(SVG + "text")]
+
+
+@pytest.fixture
+def w():
+    w = WaveDrom(backend="text")
+    w.lane_cache = None
+    return w
+
+
+def test_parse_config(w):
+    w.parse_config({"config": {"hbounds": [1.5, 4.5]}})
+    assert (w.lane.xmin_cfg, w.lane.xmax_cfg) == (2, 10)
+    w.parse_config({"config": {"hbounds": [4, 4]}})
+    assert w.window_right() is None
+
+
+@pytest.mark.parametrize("wave", ["x=.=.2.x", "p.......", "0.1.|.x<0.1>0", "01=.3..hlHL"])
+@pytest.mark.parametrize("hscale", [1, 2])
+def test_window_bricks(wave, hscale):
+    full = bricks(render({"signal": [{"wave": wave}], "config": {"hscale": hscale}}))
+    for h0, h1 in [(0, 2), (1, 4), (3, 100), (2, 3)]:
+        root = render({"signal": [{"wave": wave}], "config": {"hscale": hscale, "hbounds": [h0, h1]}})
+        assert bricks(root) == full[2 * h0 : 2 * h1]
+
+
+def test_window_size():
+    root = render({"signal": [{"wave": "p" + "." * 99}], "config": {"hbounds": [10, 20]}})
+    full = render({"signal": [{"wave": "p" + "." * 9}]})
+    assert root.get("width") == full.get("width")
+
+
+def test_data(w):
+    source = {"signal": [{"wave": "x=.=.=.x", "data": "a b c"}]}
+    # The window starts within "a"
+    source["config"] = {"hbounds": [2, 5]}
+    assert texts(render(source), "wavelane_draw_0_0") == ["a", "b"]
+    # and after it
+    source["config"] = {"hbounds": [3, 8]}
+    assert texts(render(source), "wavelane_draw_0_0") == ["b", "c"]
+    assert w.hidden_markers("x=.=.=.x", 0, 4) == 0
+    assert w.hidden_markers("x=.=.=.x", 0, 6) == 1
+    assert w.hidden_markers("=.=.=.x", 1, 16) == 2
+
+
+def test_ticks():
+    source = {"signal": [{"wave": "p......."}], "head": {"tick": 0}, "foot": {"tock": "a b c d e f g h"}}
+    source["config"] = {"hbounds": [2, 5]}
+    root = render(source)
+    assert texts(root, "gmarks_0") == ["2", "3", "4", "5", "c", "d", "e"]
+
+
+def test_labels_nodes_gaps():
+    source = {
+        "signal": [{"wave": "0.1.|.0.|.", "label": "a.b.c.d.e.", "node": "k.l.m.n.o."}],
+        "edge": ["k~>l", "l~>m", "m~>n"],
+        "config": {"hbounds": [3, 7]},
+    }
+    root = render(source)
+    assert [t for t in texts(root, "labels_0") if t] == ["c", "d"]
+    labels = texts(root, "wavearcs_0")
+    assert labels == ["m", "n"]
+    # The edge from k to l is left of the window, the others cross it
+    assert len(root.find(".//{}g[@id='wavearcs_0']".format(SVG)).findall(SVG + "path")) == 2
+    gaps = root.find(".//{}g[@id='wavegap_0_0']".format(SVG)).findall(SVG + "use")
+    assert [g.get("transform") for g in gaps] == ["translate(60.0)"]
+
+
+def test_long_signal(w):
+    n = 100000
+    source = {
+        "signal": [
+            {"wave": "0.1=.x2.|" * n, "data": list(range(2 * n)), "label": "a." * 5 * n, "node": ".a" * 5 * n},
+            {"wave": "p" + "." * (9 * n)},
+        ],
+        "config": {"hbounds": [450000, 450010]},
+    }
+    root = render(source)
+    assert len(bricks(root, 0)) == len(bricks(root, 1)) == 20
+    assert texts(root, "wavelane_draw_0_0") == ["100000", "100001"]
+    assert len(texts(root, "labels_0")) == 5
+    # The lanes are only read up to the window
+    assert w.lane_start("0.1=.x2.|" * n, 0, 900000) == (450000, "2", 900000)
+    assert w.lane_start("0.1=.x2.|" * n, 1, 900003) == (225000, "2", 900000)
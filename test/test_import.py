@@ -0,0 +1,65 @@
+import subprocess
+import sys
+
+import pytest
+
+import wavedrom
+from wavedrom import waveskin
+
+
+def run(code, *options):
+    return subprocess.run(
+        [sys.executable] + list(options) + ["-c", code], check=True, capture_output=True, text=True
+    )
+
+
+def test_lazy_imports():
+    out = run("import sys, wavedrom; print(' '.join(sys.modules))").stdout.split()
+    for module in ["svgwrite", "yaml", "argparse", "wavedrom.waveform", "wavedrom.skins.default", "wavedrom.batch"]:
+        assert module not in out
+
+
+def test_text_backend_without_svgwrite():
+    code = "import sys, wavedrom; wavedrom.render('{signal: [{wave: \"01\"}]}', backend='text'); print(' '.join(sys.modules))"
+    out = run(code).stdout.split()
+    assert "svgwrite" not in out
+    assert "wavedrom.skins.default" in out
+    assert "wavedrom.skins.narrow" not in out
+
+
+def test_import_time():
+    # python -X importtime reports the cumulative import time in us
+    times = []
+    for _ in range(3):
+        err = run("import wavedrom", "-X", "importtime").stderr
+        last = [l for l in err.splitlines() if l.rstrip().endswith("| wavedrom")][-1]
+        times.append(int(last.split("|")[1]))
+    # Importing the renderers, svgwrite and the skins took about 200 ms
+    assert min(times) < 100000
+
+
+def test_exports():
+    from wavedrom import WaveDrom, Assign
+
+    assert WaveDrom is wavedrom.waveform.WaveDrom
+    assert Assign is wavedrom.assign.Assign
+    assert wavedrom.BitField is wavedrom.bitfield.BitField
+    assert wavedrom.RenderCache is wavedrom.cache.RenderCache
+    assert wavedrom.tspan.JsonMLElement is wavedrom.jsonml.JsonMLElement
+    with pytest.raises(AttributeError):
+        wavedrom.nonexistent
+
+
+def test_skins():
+    assert list(waveskin.WaveSkin) == ["default", "narrow", "lowkey"]
+    assert "narrow" in waveskin.WaveSkin
+    assert waveskin.WaveSkin["narrow"][0] == "svg"
+    assert waveskin.WaveSkin.get("unknown") is None
+    waveskin.WaveSkin["custom"] = waveskin.WaveSkin["lowkey"]
+    try:
+        svg = wavedrom.render({"signal": [{"wave": "01"}], "config": {"skin": "custom"}}, backend="text").tostring()
+        expected = wavedrom.render({"signal": [{"wave": "01"}], "config": {"skin": "lowkey"}}, backend="text").tostring()
+        assert svg == expected
+    finally:
+        del waveskin.WaveSkin["custom"]
+    assert "custom" not in waveskin.WaveSkin
@@ -0,0 +1,90 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import wavedrom
+from wavedrom.waveform import LaneCache, WaveDrom
+
+
+@pytest.fixture
+def w():
+    w = WaveDrom()
+    w.lane_cache = LaneCache()
+    w.lane.hscale = 1
+    w.lane.period = 1
+    w.lane.phase = 0
+    return w
+
+
+def test_lane_cache_hits(w):
+    bricks = w.parse_wave_lane("01.x", 0)
+    assert w.lane_cache.stats == {"hits": 0, "misses": 1, "lanes": 1, "bricks": len(bricks)}
+    assert w.parse_wave_lane("01.x", 0) == bricks
+    assert w.lane_cache.hits == 1
+
+    # Stretch and phase are part of the key
+    assert w.parse_wave_lane("01.x", 1) != bricks
+    w.lane.phase = 1
+    assert w.parse_wave_lane("01.x", 0) == bricks[1:]
+    assert len(w.lane_cache) == 3
+
+
+def test_lane_cache_copies(w):
+    bricks = w.parse_wave_lane("p...", 0)
+    expected = list(bricks)
+    bricks[0] = "corrupted"
+    bricks.append("corrupted")
+    assert w.parse_wave_lane("p...", 0) == expected
+
+
+def test_lane_cache_bounded(w):
+    w.lane_cache = LaneCache(max_bricks=20)
+    a = w.parse_wave_lane("0.1.", 0)  # 8 bricks
+    w.parse_wave_lane("1.0.", 0)
+    w.parse_wave_lane("0.1.", 0)  # "0.1." is now the most recently used
+    w.parse_wave_lane("x.=.", 0)
+    assert w.lane_cache.bricks == 16
+    assert len(w.lane_cache) == 2
+    assert w.parse_wave_lane("0.1.", 0) == a
+    assert w.lane_cache.stats["misses"] == 3
+
+    # Lanes larger than the cache are not cached
+    w.parse_wave_lane("0" * 20, 0)
+    assert w.lane_cache.bricks == 16
+
+
+def test_lane_cache_disabled(w):
+    w.lane_cache = None
+    assert w.parse_wave_lane("01", 0) == ["000", "000", "0m1", "111"]
+
+
+def test_lane_cache_render():
+    source = {"signal": [{"name": "clk{}".format(i), "wave": "p......."} for i in range(10)]}
+    cache = WaveDrom.lane_cache
+    hits = cache.hits
+    wavedrom.render(source)
+    assert cache.hits >= hits + 9
+
+
+def test_lane_cache_threads(monkeypatch):
+    # A cache of a few lanes, so that the threads evict each other's lanes
+    cache = LaneCache(max_bricks=64)
+    monkeypatch.setattr(WaveDrom, "lane_cache", cache)
+    sources = [{"signal": [{"wave": "01" * (i % 7 + 1) + "x=" * (j % 5 + 1)} for j in range(8)]} for i in range(40)]
+    expected = [wavedrom.render(s, backend="text").tostring() for s in sources]
+    # Switch threads often, within the cache operations
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(5):
+                svgs = executor.map(lambda s: wavedrom.render(s, backend="text").tostring(), sources)
+                assert list(svgs) == expected
+    finally:
+        sys.setswitchinterval(interval)
+    stats = cache.stats
+    assert stats["bricks"] <= 64
+    assert stats["bricks"] == sum(len(b) for b in cache.entries.values())
+    # Evicted lanes were parsed again
+    assert stats["misses"] > len({(i % 7, j % 5) for i in range(40) for j in range(8)})
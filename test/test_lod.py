@@ -0,0 +1,99 @@
+import io
+import json
+import re
+import xml.etree.ElementTree as ET
+
+import pytest
+
+import wavedrom
+from wavedrom.cache import RenderCache
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def long_source(cycles):
+    return {
+        "signal": [
+            {"name": "clk", "wave": "p" + "." * (cycles - 1)},
+            {"name": "data", "wave": "x=" + "." * (cycles // 2 - 3) + "=.=.=0" + "." * (cycles // 2 - 5), "data": "first a b c"},
+            {"name": "idle", "wave": "0" + "." * (cycles - 2) + "1"},
+            {"name": "gaps", "wave": "0.|" * (cycles // 3)},
+        ],
+        "head": {"tick": 0},
+    }
+
+
+def lane(root, j):
+    return list(root.find(".//{}g[@id='wavelane_draw_{}_0']".format(SVG, j)))
+
+
+def render(source, **options):
+    return wavedrom.render(source, backend="text", **options).tostring()
+
+
+def test_fits():
+    source = long_source(20)
+    assert render(source, target_width=2000) == render(source)
+    assert render(source, target_width=None) == render(source)
+
+
+@pytest.mark.parametrize("cycles", [1000, 10000, 100000])
+def test_bounded(cycles):
+    svg = render(long_source(cycles), target_width=400)
+    root = ET.fromstring(svg)
+    assert float(root.get("width")) < 400 + 100
+    # The clock toggles in every column, it is one busy band
+    assert [e.tag for e in lane(root, 0)] == [SVG + "rect"]
+    assert len(lane(root, 1)) < 10 and len(lane(root, 2)) < 4
+    # Gaps are drawn at least a brick apart
+    assert len(root.find(".//{}g[@id='wavegap_3_0']".format(SVG))) <= 400 // 20 + 1
+    # At most an element per pixel column
+    assert all(len(lane(root, j)) <= 400 for j in range(4))
+    ticks = [int(t.text) for t in root.find(".//{}g[@id='gmarks_0']".format(SVG)).iter(SVG + "text")]
+    assert 4 <= len(ticks) <= 10 and ticks[0] == 0
+    assert len(set(b - a for a, b in zip(ticks, ticks[1:]))) == 1
+
+
+def test_spans():
+    root = ET.fromstring(render(long_source(10000), target_width=500))
+    idle = lane(root, 2)
+    # 0 drawn as one brick stretched to all but the last column
+    assert idle[0].get("{http://www.w3.org/1999/xlink}href") == "#000"
+    scale = re.match(r"translate\(0.0\) scale\((.*),1\)", idle[0].get("transform")).group(1)
+    assert float(scale) * 20 == pytest.approx(499)
+    assert idle[1].tag == SVG + "rect" and float(idle[1].get("x")) == pytest.approx(499)
+    data = lane(root, 1)
+    assert ["".join(e.itertext()) for e in data if e.tag == SVG + "text"] == ["first"]
+    assert [e.get("{http://www.w3.org/1999/xlink}href") for e in data if e.tag == SVG + "use"] == ["#vvv-2", "#000"]
+
+
+def test_narrow():
+    # Bricks narrowed to fit but still wider than a pixel are all drawn
+    source = {"signal": [{"wave": "01.x=.", "data": ["a"]}]}
+    root = ET.fromstring(render(source, target_width=60))
+    bricks = lane(root, 0)
+    assert [e.get("transform") for e in bricks if e.tag == SVG + "use"][:2] == [
+        "translate(0.0) scale(0.5,1)",
+        "translate(10.0) scale(0.25,1)",
+    ]
+    assert float(root.get("width")) < 100
+
+
+def test_backends():
+    source = long_source(5000)
+    source["config"] = {"hbounds": [100, 3000]}
+    source["signal"][2]["node"] = "." * 1000 + "a" + "." * 2000 + "b"
+    source["edge"] = ["a~>b"]
+    svg = render(source, target_width=300)
+    assert svg == wavedrom.render(source, target_width=300).tostring()
+    output = io.StringIO()
+    wavedrom.render_write(io.StringIO(json.dumps(source)), output, backend="text", stream=True, target_width=300)
+    assert output.getvalue().endswith(svg)
+    assert re.findall(r'y="-5">(\d+)<', svg)[:2] == ["100", "600"]
+
+
+def test_cache(tmp_path):
+    cache = RenderCache(str(tmp_path))
+    source = long_source(1000)
+    assert cache.key(source) != cache.key(source, target_width=200)
+    assert cache.render(source, target_width=200).tostring() == render(source, target_width=200)
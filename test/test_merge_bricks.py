@@ -0,0 +1,64 @@
+import io
+import xml.etree.ElementTree as ET
+from glob import glob
+
+import pytest
+
+import wavedrom
+from wavedrom import wavejson
+from wavedrom.waveform import WaveDrom
+
+files = sorted(glob("test/files/*.json"))
+
+SVG = "{http://www.w3.org/2000/svg}"
+HREF = "{http://www.w3.org/1999/xlink}href"
+
+
+def lane_bricks(svg):
+    """Brick ids and positions of all lanes, with merged runs expanded"""
+    root = ET.fromstring(svg)
+    lanes = {}
+    for g in root.iter(SVG + "g"):
+        if not g.get("id", "").startswith("wavelane_draw_"):
+            continue
+        bricks = []
+        for e in g:
+            if e.tag == SVG + "use":
+                x = float(e.get("transform", "translate(0)")[len("translate("):-1])
+                bricks.append((x, e.get(HREF)[1:]))
+            elif e.tag == SVG + "rect":
+                brick = e.get("fill")[len("url(#run-"):-1]
+                x, width = float(e.get("x")), float(e.get("width"))
+                pattern = root.find(".//{}pattern[@id='run-{}']".format(SVG, brick))
+                xs = float(pattern.get("width"))
+                bricks.extend((x + k * xs, brick) for k in range(int(width / xs)))
+        lanes[g.get("id")] = bricks
+    return lanes
+
+
+@pytest.mark.parametrize("backend", ["svgwrite", "text"])
+@pytest.mark.parametrize("file", files)
+def test_merge_bricks_files(file, backend):
+    source = wavejson.loads(open(file).read())
+    if not source.get("signal"):
+        pytest.skip("not a waveform")
+    plain = wavedrom.render(source, backend=backend).tostring()
+    merged = wavedrom.render(source, backend=backend, merge_bricks=True).tostring()
+    assert lane_bricks(merged) == lane_bricks(plain)
+
+
+def test_merge_bricks_long_lane():
+    source = {"signal": [{"name": "idle", "wave": "0" + "." * 9998 + "1"}], "config": {"hscale": 4}}
+    plain = wavedrom.render(source, backend="text").tostring()
+    merged = wavedrom.render(source, backend="text", merge_bricks=True).tostring()
+    assert lane_bricks(merged) == lane_bricks(plain)
+    assert merged.count("<use") * 1000 < plain.count("<use")
+
+
+def test_merge_bricks_stream():
+    source = wavejson.loads(open("test/files/tutorial_3.json").read())
+    drawing = io.StringIO()
+    wavedrom.render(source, merge_bricks=True).write(drawing)
+    f = io.StringIO()
+    WaveDrom(merge_bricks=True).write_waveform(f, 0, source)
+    assert f.getvalue() == drawing.getvalue()
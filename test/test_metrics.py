@@ -0,0 +1,37 @@
+from wavedrom import metrics
+from wavedrom.metrics import FontMetrics, default_font_metrics
+from wavedrom.waveform import WaveDrom
+
+
+def test_default_metrics():
+    w = WaveDrom()
+    assert w.text_width("clk") == (67 + 30 + 67) * 11 / 100
+    assert w.text_width("clk", 8) == (67 + 30 + 67) * 8 / 100
+    # Beyond the table, including the first code point past its end
+    assert w.text_width("Ȁ中") == 2 * 114 * 11 / 100
+    # Non latin-1 strings take the slow path
+    assert w.text_width("aĀ") == (74 + 89) * 11 / 100
+
+
+def test_metrics_memoized():
+    m = FontMetrics(metrics.char_widths)
+    m.width("data_bus")
+    m.width("data_bus", 8)
+    assert m.units.cache_info().hits == 1
+
+
+def test_wide_metrics():
+    m = FontMetrics([0] * 65 + [300, 200], default=50)
+    assert m.latin1 is None
+    assert m.width("ABC", 100) == 300 + 200 + 50
+
+
+def test_skin_metrics():
+    source = {"signal": [{"name": "A", "wave": "01"}], "config": {"skin": "narrow"}}
+    default = WaveDrom().render_waveform(0, source)["width"]
+    metrics.font_metrics["narrow"] = FontMetrics([1000] * 128)
+    try:
+        assert WaveDrom().render_waveform(0, source)["width"] > default
+    finally:
+        del metrics.font_metrics["narrow"]
+    assert default_font_metrics.width("A") == 89 * 11 / 100
@@ -0,0 +1,44 @@
+import io
+import re
+from glob import glob
+
+import pytest
+
+import wavedrom
+from wavedrom import wavejson
+from wavedrom.waveform import WaveDrom
+
+files = sorted(glob("test/files/*.json"))
+
+
+def split_defs(svg):
+    defs = re.search(r"<defs>.*</defs>", svg).group(0)
+    return defs, svg.replace(defs, "")
+
+
+@pytest.mark.parametrize("merge_bricks", [False, True])
+@pytest.mark.parametrize("file", files)
+def test_prune_defs_files(file, merge_bricks):
+    source = wavejson.loads(open(file).read())
+    if not source.get("signal"):
+        pytest.skip("not a waveform")
+    options = dict(backend="text", merge_bricks=merge_bricks)
+    full = wavedrom.render(source, **options).tostring()
+    pruned = wavedrom.render(source, prune_defs=True, **options).tostring()
+
+    # Only the defs differ, and every reference is still defined
+    defs, rest = split_defs(pruned)
+    assert rest == split_defs(full)[1]
+    ids = set(re.findall(r' id="([^"]*)"', pruned))
+    refs = set(re.findall(r'(?:href="#|url\(#)([^")]*)', pruned))
+    assert refs <= ids
+    assert len(defs) < len(split_defs(full)[0])
+
+
+def test_prune_defs_stream():
+    source = wavejson.loads(open("test/files/issue_14.json").read())
+    drawing = io.StringIO()
+    wavedrom.render(source, prune_defs=True).write(drawing)
+    f = io.StringIO()
+    WaveDrom(prune_defs=True).write_waveform(f, 0, source)
+    assert f.getvalue() == drawing.getvalue()
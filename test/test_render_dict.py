@@ -0,0 +1,31 @@
+import copy
+from glob import glob
+
+import pytest
+
+import wavedrom
+from wavedrom import wavejson
+
+files = sorted(glob("test/files/*.json"))
+
+
+@pytest.mark.parametrize("file", files)
+def test_render_dict(file):
+    text = open(file).read()
+    source = wavejson.loads(text)
+    original = copy.deepcopy(source)
+    assert wavedrom.render(source).tostring() == wavedrom.render(text).tostring()
+    assert source == original
+
+
+def test_render_dict_head_and_hbounds_unchanged():
+    source = {
+        "signal": [{"name": "clk", "wave": "p......."}],
+        "head": {"tick": 0, "text": "head"},
+        "foot": {"tock": 1},
+        "config": {"hbounds": [1.5, 4.5]},
+    }
+    original = copy.deepcopy(source)
+    wavedrom.render(source)
+    wavedrom.render(source)
+    assert source == original
@@ -0,0 +1,20 @@
+from glob import glob
+
+import wavedrom
+
+files = sorted(glob("test/files/*.json"))
+
+
+def test_render_many_matches_render():
+    sources = [open(f).read() for f in files]
+    outputs = wavedrom.render_many(sources)
+    assert len(outputs) == len(sources)
+    for source, out in zip(sources, outputs):
+        assert out.tostring() == wavedrom.render(source).tostring()
+
+
+def test_render_many_isolates_lane_state():
+    with_head = '{"signal": [{"name": "clk", "wave": "p..."}], "head": {"text": "T", "tick": 0}, "config": {"hscale": 2}}'
+    plain = '{"signal": [{"name": "clk", "wave": "p..."}]}'
+    outputs = wavedrom.render_many([with_head, plain])
+    assert outputs[1].tostring() == wavedrom.render(plain).tostring()
@@ -0,0 +1,105 @@
+import io
+import json
+import os
+import socket
+import tempfile
+import threading
+
+import pytest
+
+import wavedrom
+from wavedrom.server import Server, render_request, worker_renderers
+
+signal = "{signal: [{name: 'clk', wave: 'p...'}]}"
+reg = {"reg": [{"name": "A", "bits": 8}]}
+
+
+def serve(requests, jobs=1, **defaults):
+    lines = [r if isinstance(r, str) else json.dumps(r) for r in requests]
+    out = io.StringIO()
+    server = Server(jobs, **defaults)
+    try:
+        server.serve_stdio(io.StringIO("\n".join(lines) + "\n"), out)
+    finally:
+        server.close()
+    return [json.loads(l) for l in out.getvalue().splitlines()]
+
+
+def test_render_request():
+    response = render_request({"id": 7, "source": signal, "options": {"backend": "text"}})
+    assert response == {"id": 7, "svg": wavedrom.render(signal).tostring()}
+
+
+def test_renderers_bounded():
+    worker_renderers.cache_clear()
+    for width in range(100, 200):
+        assert "svg" in render_request({"source": signal, "options": {"backend": "text", "target_width": width}})
+    # Only the renderers of the latest options are kept
+    assert worker_renderers.cache_info().currsize == worker_renderers.cache_info().maxsize
+    first = render_request({"source": signal, "options": {"target_width": 199, "backend": "text"}})
+    assert worker_renderers.cache_info().hits == 1 and "svg" in first
+
+
+def test_errors():
+    responses = serve(
+        [
+            "not json",
+            "[1, 2]",
+            {"id": 1},
+            {"id": 2, "source": "{}"},
+            {"id": 3, "source": signal, "options": {"colour": "red"}},
+            {"id": 4, "source": signal},
+        ]
+    )
+    errors = {r["id"]: r.get("error") for r in responses}
+    assert errors[None].startswith("Invalid request")
+    assert [r["id"] for r in responses].count(None) == 2
+    assert "No source" in errors[1]
+    assert "no signal, assign or reg" in errors[2]
+    assert "Unknown options: colour" in errors[3]
+    assert errors[4] is None
+
+
+def test_defaults():
+    responses = serve(
+        [{"id": 1, "source": signal}, {"id": 2, "source": signal, "options": {"prune_defs": False}}],
+        prune_defs=True,
+    )
+    svgs = {r["id"]: r["svg"] for r in responses}
+    assert svgs[1] == wavedrom.render(signal, prune_defs=True).tostring()
+    assert svgs[2] == wavedrom.render(signal).tostring()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_many_requests(jobs):
+    sources = [signal, reg, {"assign": [["out", ["&", "a", "b"]]]}] * 10
+    requests = [{"id": i, "source": s, "options": {"backend": "text"}} for i, s in enumerate(sources)]
+    responses = serve(requests, jobs)
+    # Responses come in any order, matched by id
+    assert sorted(r["id"] for r in responses) == list(range(len(sources)))
+    for r in responses:
+        assert r["svg"] == wavedrom.render(sources[r["id"]], backend="text").tostring()
+
+
+def test_socket():
+    server = Server()
+    path = os.path.join(tempfile.mkdtemp(), "wavedrom.sock")
+    listener = server.listen(path)
+    thread = threading.Thread(target=listener.serve_forever)
+    thread.start()
+    try:
+        with socket.socket(socket.AF_UNIX) as client:
+            client.connect(path)
+            f = client.makefile("rw")
+            for i in range(3):
+                f.write(json.dumps({"id": i, "source": reg}) + "\n")
+            f.flush()
+            responses = [json.loads(f.readline()) for _ in range(3)]
+        assert sorted(r["id"] for r in responses) == [0, 1, 2]
+        assert responses[0]["svg"] == wavedrom.render(reg).tostring()
+    finally:
+        listener.shutdown()
+        listener.server_close()
+        thread.join()
+        server.close()
+        os.remove(path)
@@ -0,0 +1,52 @@
+import io
+from glob import glob
+
+import pytest
+
+import wavedrom
+from wavedrom import wavejson
+from wavedrom.waveform import WaveDrom
+
+files = sorted(glob("test/files/*.json"))
+
+
+def write(drawing):
+    f = io.StringIO()
+    drawing.write(f)
+    return f.getvalue()
+
+
+@pytest.mark.parametrize("strict_js_features", [False, True])
+@pytest.mark.parametrize("backend", ["svgwrite", "text"])
+@pytest.mark.parametrize("file", files)
+def test_stream_files(file, backend, strict_js_features):
+    source = wavejson.loads(open(file).read())
+    if not source.get("signal"):
+        pytest.skip("not a waveform")
+    expected = write(wavedrom.render(source, strict_js_features=strict_js_features, backend=backend))
+    f = io.StringIO()
+    WaveDrom(backend).write_waveform(f, 0, source, strict_js_features)
+    assert f.getvalue() == expected
+
+
+def test_stream_large():
+    source = {
+        "signal": [
+            {"name": "clk", "wave": "p" + "." * 499},
+            ["bus"] + [{"name": "data{}".format(i), "wave": "x=.=|" * 100, "data": "a b c", "label": ".a..{b}"}
+                       for i in range(50)],
+        ],
+        "head": {"text": "large", "tick": 0},
+    }
+    f = io.StringIO()
+    WaveDrom("text").write_waveform(f, 0, source)
+    assert f.getvalue() == write(wavedrom.render(source, backend="text"))
+
+
+@pytest.mark.parametrize("file", ["test/files/signal_0.json", "test/files/assign_xor.json", "test/files/bitfield_0.json"])
+def test_render_write_stream(file):
+    expected = io.StringIO()
+    wavedrom.render_write(open(file), expected)
+    f = io.StringIO()
+    wavedrom.render_write(open(file), f, stream=True)
+    assert f.getvalue() == expected.getvalue()
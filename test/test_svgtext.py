@@ -0,0 +1,64 @@
+import io
+from glob import glob
+
+import pytest
+
+import wavedrom
+
+files = sorted(glob("test/files/*.json"))
+
+sources = [
+    {
+        "signal": [
+            {"name": 'a&<b>"q"', "wave": "x=.|3", "data": ["<&>", "x\ny"], "node": ".a..b"},
+            {"name": "clk", "wave": "p.....", "period": 2, "phase": 0.5},
+        ],
+        "head": {
+            "text": ["tspan", ["tspan", {"class": "h1"}, "head "], "tail", ["tspan", "x"]],
+            "tick": 0,
+        },
+        "foot": {"text": "foot", "tock": 2},
+        "edge": ["a~>b <label&>"],
+    },
+    {
+        "reg": [
+            {"name": "<o>B</o><b>R<i>K</i></b>", "bits": 8, "attr": ["RO", 5]},
+            {"bits": 8, "type": 3},
+        ],
+        "config": {"lanes": 2},
+    },
+]
+
+
+def write(drawing):
+    f = io.StringIO()
+    drawing.write(f)
+    return f.getvalue()
+
+
+@pytest.mark.parametrize("file", files)
+def test_text_backend_files(file):
+    source = open(file).read()
+    assert write(wavedrom.render(source, backend="text")) == write(
+        wavedrom.render(source)
+    )
+
+
+@pytest.mark.parametrize("source", sources)
+def test_text_backend(source):
+    assert write(wavedrom.render(source, backend="text")) == write(
+        wavedrom.render(source)
+    )
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        wavedrom.render(sources[0], backend="foo")
+
+
+@pytest.mark.parametrize("file", files)
+def test_unvalidated_files(file):
+    source = open(file).read()
+    assert write(wavedrom.render(source, validate=False)) == write(
+        wavedrom.render(source)
+    )
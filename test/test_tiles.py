@@ -0,0 +1,90 @@
+import re
+import sys
+
+import pytest
+
+import wavedrom
+from wavedrom import tiles
+from wavedrom.waveform import WaveDrom
+
+source = {
+    "signal": [
+        {"name": "clk", "wave": "p" + "." * 24},
+        ["bus", {"name": "data", "wave": "x=.=.=.x" * 3, "data": [str(i) for i in range(9)]}],
+        {"name": "slow", "wave": "01" * 6, "period": 2},
+    ],
+    "head": {"text": "long", "tick": 0},
+}
+
+
+def ticks(svg):
+    return re.findall(r'<g id="gmarks_0">.*?</g>', svg, re.S)[0]
+
+
+def test_tile_bounds():
+    w = WaveDrom(backend="text")
+    assert w.tile_bounds(source, 10) == [[0, 10], [10, 20], [20, 30]]
+    assert w.tile_bounds(source, 25) == [[0, 25]]
+    assert w.cycle_count(source) == 25
+    assert w.tile_layout(source, 10) == (25, [[0, 10], [10, 20], [20, 30]])
+    wide = dict(source, config={"hscale": 2, "hbounds": [3, 4]})
+    assert w.tile_bounds(wide, 10) == [[0, 20], [20, 40], [40, 60]]
+    assert w.cycle_count(wide) == 25
+    assert [s["config"] for s in w.tile_sources(wide, 20)] == [
+        {"hscale": 2, "hbounds": [0, 40]},
+        {"hscale": 2, "hbounds": [40, 80]},
+    ]
+
+
+@pytest.mark.parametrize("hscale", [1, 2])
+def test_render_tiles(hscale):
+    tiled = dict(source, config={"hscale": hscale})
+    svgs = wavedrom.render_tiles(tiled, 10, backend="text")
+    assert len(svgs) == 3
+    for svg, start in zip(svgs, [0, 10, 20]):
+        hbounds = [start * hscale, (start + 10) * hscale]
+        expected = wavedrom.render(dict(tiled, config={"hscale": hscale, "hbounds": hbounds}), backend="text")
+        assert svg == expected.tostring()
+        # Each tile repeats the lane names and numbers the ticks from its first cycle
+        assert ">clk<" in svg and ">data<" in svg and ">bus<" in svg
+        assert re.findall(r">(\d+)<", ticks(svg))[0] == str(start)
+
+
+def test_jobs():
+    assert wavedrom.render_tiles(source, 4, jobs=2) == wavedrom.render_tiles(source, 4)
+    assert tiles.worker_state == {}
+
+
+def test_write_tiles(tmp_path, monkeypatch):
+    path = str(tmp_path / "long.html")
+    counts = []
+    cycle_count = WaveDrom.cycle_count
+    monkeypatch.setattr(WaveDrom, "cycle_count", lambda self, s: counts.append(s) or cycle_count(self, s))
+    names = wavedrom.write_tiles(source, path, 10, backend="text")
+    # One pass over the lanes sizes both the tiles and the index
+    assert len(counts) == 1
+    assert names == [str(tmp_path / "long-{:04d}.svg".format(i)) for i in [1, 2, 3]]
+    header = '<?xml version="1.0" encoding="utf-8" ?>\n'
+    assert [open(n).read() for n in names] == [header + svg for svg in wavedrom.render_tiles(source, 10, backend="text")]
+    index = open(path).read()
+    assert "<title>long</title>" in index
+    assert re.findall(r'<img src="(.*?)"', index) == ["long-0001.svg", "long-0002.svg", "long-0003.svg"]
+    assert "Cycles 10 to 19" in index
+    # The last tile ends with the waveform
+    assert "Cycles 20 to 24" in index and "Cycles 20 to 29" not in index
+
+
+def test_main(tmp_path, monkeypatch):
+    src = tmp_path / "long.json"
+    src.write_text('{signal: [{name: "clk", wave: "p' + "." * 24 + '"}]}')
+    out = tmp_path / "long.html"
+    monkeypatch.setattr(sys, "argv", ["wavedrompy", "-i", str(src), "--tile", "10", "-s", str(out)])
+    wavedrom.main()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "long-0001.svg",
+        "long-0002.svg",
+        "long-0003.svg",
+        "long.html",
+        "long.json",
+    ]
+    assert "long-0003.svg" in out.read_text()
@@ -0,0 +1,251 @@
+import io
+import json
+
+import pytest
+
+import wavedrom
+from wavedrom import vcd
+
+dump = """$date today $end
+$timescale 1ns $end
+$scope module top $end
+$var wire 1 ! clk $end
+$var wire 1 " valid $end
+$var wire 8 # data [7:0] $end
+$scope module sub $end
+$var reg 4 $ data $end
+$var real 64 % temp $end
+$upscope $end
+$upscope $end
+$enddefinitions $end
+$comment
+  ignored #5 1!
+$end
+#0
+$dumpvars
+0!
+0"
+bx #
+b0 $
+r1.5 %
+$end
+#5
+1!
+#10
+0! 1" b1010 #
+#15
+1!
+#20
+0!
+b11111111 #
+#25
+1!
+#30
+0! 0"
+bz #
+#35
+1!
+"""
+
+
+def convert(signals=None, **options):
+    return vcd.to_wavejson(io.StringIO(dump), signals, **options)["signal"]
+
+
+def test_header():
+    reader = vcd.VCDReader(io.StringIO(dump))
+    assert reader.timescale == "1ns"
+    assert [(v.name, v.width, v.type) for v in reader.vars] == [
+        ("top.clk", 1, "wire"),
+        ("top.valid", 1, "wire"),
+        ("top.data[7:0]", 8, "wire"),
+        ("top.sub.data", 4, "reg"),
+        ("top.sub.temp", 64, "real"),
+    ]
+    assert reader.find("top.data").id == "#"
+    assert reader.find("sub.data").id == "$"
+    with pytest.raises(ValueError, match="ambiguous"):
+        reader.find("data")
+    with pytest.raises(ValueError, match="not found"):
+        reader.find("ready")
+
+
+def test_clock():
+    lanes = convert(["clk", "valid", "top.data", "sub.data", "temp"], clock="clk")
+    assert lanes == [
+        {"name": "top.clk", "wave": "p..."},
+        # Sampled just before the rising edges at 5, 15, 25 and 35
+        {"name": "top.valid", "wave": "01.0"},
+        {"name": "top.data[7:0]", "wave": "x==z", "data": ["0a", "ff"]},
+        {"name": "top.sub.data", "wave": "=...", "data": ["0"]},
+        {"name": "top.sub.temp", "wave": "=...", "data": ["1.5"]},
+    ]
+    assert convert(["valid"], clock="clk", edge="negedge") == [{"name": "top.valid", "wave": "01."}]
+    # All signals but the clock
+    assert [l["name"] for l in convert(clock="top.clk")] == ["top.valid", "top.data[7:0]", "top.sub.data", "top.sub.temp"]
+
+
+def test_period():
+    lanes = convert(["valid", "top.data"], period=10)
+    assert lanes == [
+        {"name": "top.valid", "wave": "01."},
+        {"name": "top.data[7:0]", "wave": "x==", "data": ["0a", "ff"]},
+    ]
+
+
+quiet = """$scope module top $end
+$var wire 1 ! idle $end
+$var wire 1 " busy $end
+$upscope $end
+$enddefinitions $end #0
+0! 0"
+#50
+1"
+#195
+"""
+
+
+def test_period_constant():
+    # Time moves on while the sampled signal does not change
+    lanes = vcd.to_wavejson(io.StringIO(quiet), ["idle"], period=10)["signal"]
+    assert lanes == [{"name": "top.idle", "wave": "0" + "." * 18}]
+    # up to a timestamp without changes at the end
+    trailing = dump + "#100\n"
+    lanes = vcd.to_wavejson(io.StringIO(trailing), ["valid"], period=10)["signal"]
+    assert lanes == [{"name": "top.valid", "wave": "01.0" + "." * 6}]
+
+
+def test_header_rest():
+    # The body starts on the line of $enddefinitions
+    reader = vcd.VCDReader(io.StringIO(quiet))
+    assert [v.name for v in reader.vars] == ["top.idle", "top.busy"]
+    assert list(reader.changes())[:2] == [(0, "!", "0"), (0, '"', "0")]
+
+
+def test_window():
+    lanes = convert(["valid", "top.data"], clock="clk", start=1, end=3, radix="dec")
+    assert lanes == [
+        {"name": "top.valid", "wave": "1."},
+        {"name": "top.data[7:0]", "wave": "==", "data": ["10", "255"]},
+    ]
+    with pytest.raises(ValueError):
+        convert(["valid"])
+
+
+def generate(cycles):
+    yield "$scope module top $end\n$var wire 1 ! clk $end\n$var wire 16 # count $end\n"
+    yield "$upscope $end\n$enddefinitions $end\n"
+    for i in range(cycles):
+        yield "#{}\n1!\nb{:b} #\n#{}\n0!\n".format(10 * i, i, 10 * i + 5)
+
+
+class Lines(object):
+    """Iterates the lines of a dump, counting them"""
+
+    def __init__(self, lines):
+        self.lines = lines
+        self.count = 0
+
+    def __iter__(self):
+        for chunk in self.lines:
+            for line in chunk.splitlines(True):
+                self.count += 1
+                yield line
+
+
+def test_stops_at_end():
+    lines = Lines(generate(100000))
+    lanes = vcd.to_wavejson(lines, ["count"], clock="clk", start=10, end=20)["signal"]
+    # The clock starts high at #0, the first edge is at #10
+    assert lanes == [{"name": "top.count", "wave": "=" * 10, "data": ["{:04x}".format(i) for i in range(10, 20)]}]
+    # Reading stopped right after the window
+    assert lines.count < 200
+
+
+def test_render():
+    svg = wavedrom.render(vcd.to_wavejson(io.StringIO(dump), clock="clk"), backend="text").tostring()
+    assert "top.valid" in svg and ">0a<" in svg
+
+
+def test_main(tmp_path, capsys):
+    f = tmp_path / "dump.vcd"
+    f.write_text(dump)
+    vcd.main([str(f), "-c", "clk", "-g", "valid", "-g", "top.data"])
+    assert json.loads(capsys.readouterr().out)["signal"] == convert(["valid", "top.data"], clock="clk")
+    vcd.main([str(f), "-c", "clk", "--svg", str(tmp_path / "dump.svg")])
+    assert (tmp_path / "dump.svg").read_text().startswith("<?xml")
+
+
+def test_main_os_errors(tmp_path, capsys):
+    f = tmp_path / "dump.vcd"
+    f.write_text(dump)
+    missing = tmp_path / "missing"
+    for args in [
+        [str(missing / "dump.vcd")],
+        [str(f), "-c", "clk", "--index", str(missing / "dump.idx")],
+        [str(f), "-c", "clk", "--svg", str(missing / "dump.svg")],
+    ]:
+        with pytest.raises(SystemExit) as e:
+            vcd.main(args)
+        assert e.value.code == 1
+        err = capsys.readouterr().err
+        assert err.startswith("wavedrompy vcd: error: ") and str(missing) in err
+
+
+def test_index(tmp_path):
+    path = str(tmp_path / "dump.vcd")
+    with open(path, "w") as f:
+        f.writelines(generate(5000))
+    for options in [{"clock": "clk"}, {"clock": "clk", "edge": "negedge"}, {"period": 7}]:
+        index = vcd.TraceIndex(path, interval=100, **options)
+        assert len(index.checkpoints["cycle"]) > 40
+        for start, end in [(0, 10), (99, 101), (100, 300), (1234, 1240), (4990, None)]:
+            with open(path) as f:
+                expected = vcd.to_wavejson(f, ["clk", "count"], start=start, end=end, **options)
+            assert index.window(["clk", "count"], start, end) == expected
+        index.close()
+
+
+def test_index_small(tmp_path):
+    path = str(tmp_path / "dump.vcd")
+    with open(path, "w") as f:
+        f.write(dump)
+    with vcd.TraceIndex(path, clock="clk", interval=1) as index:
+        assert index.cycles == 4
+        for start in range(4):
+            assert index.window(start=start)["signal"] == convert(clock="clk", start=start)
+    assert index.buffer.closed
+
+
+def test_index_period(tmp_path):
+    path = str(tmp_path / "quiet.vcd")
+    with open(path, "w") as f:
+        f.write(quiet)
+    index = vcd.TraceIndex(path, period=10, interval=4)
+    assert index.cycles == 19
+    for signals in [["idle"], None]:
+        for start in [0, 5, 18]:
+            window = index.window(signals, start)
+            with open(path) as f:
+                assert window == vcd.to_wavejson(f, signals, period=10, start=start)
+            assert all(len(lane["wave"]) == index.cycles - start for lane in window["signal"])
+    index.close()
+
+
+def test_index_file(tmp_path, capsys):
+    path = str(tmp_path / "dump.vcd")
+    index_path = str(tmp_path / "dump.idx")
+    with open(path, "w") as f:
+        f.writelines(generate(3000))
+    built = vcd.TraceIndex.load(path, index_path, clock="clk", interval=100)
+    loaded = vcd.TraceIndex.load(path, index_path, clock="clk", interval=100)
+    assert loaded.checkpoints == built.checkpoints and loaded.cycles == built.cycles == 2999
+    assert loaded.window(["count"], 2000, 2002) == {"signal": [{"name": "top.count", "wave": "==", "data": ["07d0", "07d1"]}]}
+    # Other options build a new index
+    negedge = vcd.TraceIndex.load(path, index_path, clock="clk", edge="negedge", interval=100)
+    assert negedge.cycles == 3000
+    for index in [built, loaded, negedge]:
+        index.close()
+
+    vcd.main([path, "-c", "clk", "-g", "count", "--start", "2000", "--end", "2002", "--index", index_path])
+    assert json.loads(capsys.readouterr().out)["signal"][0]["data"] == ["07d0", "07d1"]
@@ -0,0 +1,49 @@
+import json
+from glob import glob
+
+import pytest
+import yaml
+
+from wavedrom import wavejson
+
+files = sorted(glob("test/files/*.json"))
+
+
+@pytest.mark.parametrize("file", files)
+def test_loads_matches_yaml(file):
+    text = open(file).read()
+    assert wavejson.loads(text) == yaml.load(text, Loader=yaml.FullLoader)
+
+
+def test_relaxed():
+    text = """{signal: [
+      // comment
+      {name: 'clk', wave: "p.", period: 0x2, phase: .5, data: ['a\\'b',],},
+      /* block
+         comment */
+    ]}"""
+    assert wavejson.loads_relaxed(text) == {
+        "signal": [
+            {"name": "clk", "wave": "p.", "period": 2, "phase": 0.5, "data": ["a'b"]}
+        ]
+    }
+
+
+@pytest.mark.parametrize("text", ["{a 1}", "[1 2]", "{a:}", "[1,,2]", "{a:1", "[1]]", ""])
+def test_relaxed_errors(text):
+    with pytest.raises(ValueError):
+        wavejson.loads_relaxed(text)
+
+
+def test_relaxed_deep_nesting():
+    depth = 10000
+    value = wavejson.loads_relaxed("[" * depth + "]" * depth)
+    for i in range(depth - 1):
+        value = value[0]
+    assert value == []
+
+
+def test_yaml_fallback():
+    assert wavejson.loads("{signal: [{name: clk, wave: p...}]}") == {
+        "signal": [{"name": "clk", "wave": "p..."}]
+    }
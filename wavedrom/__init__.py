@@ -2,65 +2,323 @@
 # SPDX-License-Identifier: MIT
 
 
-import argparse
+import glob
 import json
-import yaml
+import os
+import time
 import sys
+from contextlib import nullcontext
+from importlib import import_module
 
-from .waveform import WaveDrom
-from .assign import Assign
 from .version import version
-from .bitfield import BitField
+from . import wavejson
+from .renderers import Renderers as _Renderers, parse, render
+from .renderers import render_source as _render
+
+# The renderers and their dependencies (svgwrite and the skins) are only
+# imported when first used, so that importing wavedrom is fast
+_exports = {
+    "WaveDrom": "waveform",
+    "Assign": "assign",
+    "BitField": "bitfield",
+    "RenderCache": "cache",
+}
 
-import json
+
+def __getattr__(name):
+    if name in _exports:
+        value = getattr(import_module("." + _exports[name], __name__), name)
+        globals()[name] = value
+        return value
+    try:
+        # Submodules, like wavedrom.waveform
+        return import_module("." + name, __name__)
+    except ModuleNotFoundError as e:
+        if e.name != "{}.{}".format(__name__, name):
+            raise
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
 
 
 def fixQuotes(inputString):
-    # fix double quotes in the input file. opening with yaml and dumping with json fix the issues.
-    yamlCode = yaml.load(inputString, Loader=yaml.FullLoader)
-    fixedString = json.dumps(yamlCode, indent=4)
+    # fix double quotes in the input file. parsing the relaxed syntax and dumping with json fix the issues.
+    fixedString = json.dumps(wavejson.loads(inputString), indent=4)
     return fixedString
 
 
-def render(source="", output=[], strict_js_features=False):
-    source = json.loads(fixQuotes(source))
-    if source.get("signal"):
-        return WaveDrom().render_waveform(0, source, output, strict_js_features)
-    elif source.get("assign"):
-        return Assign().render(0, source, output)
-    elif source.get("reg"):
-        return BitField().renderJson(source)
+def render_many(sources, strict_js_features=False, **options):
+    """Render many wavedrom sources, returning the drawings in input order
+
+    Sources can be given as text or as already parsed dicts. The
+    `options` are those of :func:`render`.
+
+    All sources are rendered by the same set of renderers, so per-diagram
+    setup like building the skin definitions is only done once.
+    """
+    renderers = _Renderers(**options)
+    outputs = []
+    for source in sources:
+        source = parse(source)
+        outputs.append(_render(source, [], strict_js_features, renderers))
+    return outputs
+
+
+def render_tiles(source, cycles, jobs=1, strict_js_features=False, **options):
+    """Render a long waveform as tiles of `cycles` cycles, returns their SVG text
 
+    Each tile repeats the lane names and numbers the ticks from its first
+    cycle, see :meth:`WaveDrom.tile_sources`. The tiles are rendered
+    across `jobs` worker processes, 0 starts one per CPU. The `options`
+    are those of :func:`render`.
+    """
+    from . import tiles
+
+    return tiles.render_tiles(
+        parse(source), cycles, jobs, strict_js_features, **options
+    )
+
+
+def write_tiles(source, path, cycles, jobs=1, strict_js_features=False, **options):
+    """Write a long waveform as tiles of `cycles` cycles
+
+    Like :func:`render_tiles`, the tiles are written next to `path` as
+    ``<path>-0001.svg`` and so on, with an HTML document at `path` that
+    lists their cycles and shows them one per page. Returns the file names
+    of the tiles.
+    """
+    from . import tiles
+
+    return tiles.write_tiles(
+        parse(source), path, cycles, jobs, strict_js_features, **options
+    )
 
-def render_write(source, output, strict_js_features=False):
-    jinput = source.read()
-    out = render(jinput, strict_js_features=strict_js_features)
+
+def render_register_map(registers, **options):
+    """Render a register map, returning the drawings in order
+
+    `registers` is a list of bitfield sources, given as text, as dicts with
+    "reg" and an optional "config" or as plain lists of fields.
+    """
+    bitfield = _Renderers(**options).bitfield
+    return bitfield.render_map(
+        [r if isinstance(r, list) else parse(r) for r in registers]
+    )
+
+
+def write_register_map(registers, output, config=None, **options):
+    """Write a register map to the file object `output` as one SVG document
+
+    The registers are given like for :func:`render_register_map` and are
+    stacked in order, each under its "name". `config` sets the font of the
+    document. The registers are written one at a time.
+    """
+    bitfield = _Renderers(**options).bitfield
+    registers = [r if isinstance(r, list) else parse(r) for r in registers]
+    bitfield.write_map(output, registers, config)
+
+
+def render_write(
+    source, output, strict_js_features=False, stream=False, cache_dir=None, **options
+):
+    """Render the source read from file object `source` to `output`
+
+    The `options` are those of :func:`render`. With `stream` set,
+    waveforms are written to `output` lane by lane while they are
+    rendered, instead of building the whole drawing in memory first. This
+    keeps the memory use of waveforms with many lanes low. The output is
+    the same.
+
+    With `cache_dir` given, the SVG is taken from the
+    :class:`RenderCache` in that directory if it has been rendered before.
+    """
+    jinput = parse(source.read())
+    if cache_dir:
+        from .cache import RenderCache
+
+        out = RenderCache(cache_dir).render(jinput, strict_js_features, **options)
+    elif stream and jinput.get("signal"):
+        waveform = _Renderers(**options).waveform
+        waveform.write_waveform(output, 0, jinput, strict_js_features)
+        return
+    else:
+        out = render(jinput, strict_js_features=strict_js_features, **options)
     out.write(output)
 
 
-def render_file(source, output, strict_js_features=False):
-    out = open(output, "w")
-    render_write(open(source, "r"), out, strict_js_features=strict_js_features)
-    out.close()
+def render_file(source, output, strict_js_features=False, **options):
+    """Render the source file `source` to the SVG file `output`
+
+    The `options` are those of :func:`render_write`.
+    """
+    with open(source, "r") as f, open(output, "w") as out:
+        render_write(f, out, strict_js_features, **options)
+
+
+def render_files(sources, strict_js_features=False, jobs=1, **options):
+    """Render many source files, writing each SVG next to its source
+
+    Directories and glob patterns in `sources` are expanded. The files are
+    rendered across `jobs` worker processes. Errors are reported in the
+    returned results instead of aborting the batch. The `options` are
+    those of :func:`render`, with `cache_dir` given the workers share the
+    :class:`RenderCache` in that directory.
+    """
+    from . import batch
+
+    return batch.render_files(
+        batch.find_sources(sources),
+        jobs=jobs,
+        strict_js_features=strict_js_features,
+        **options
+    )
 
 
 def main():
+    import argparse
+
+    if sys.argv[1:2] == ["serve"]:
+        from .server import main as serve
+
+        return serve(sys.argv[2:])
+    if sys.argv[1:2] == ["vcd"]:
+        from .vcd import main as vcd
+
+        return vcd(sys.argv[2:])
+
     parser = argparse.ArgumentParser(description="")
     parser.add_argument(
         "--input",
         "-i",
-        help="<input wavedrom source filename>",
+        help="<input wavedrom source filename(s), directories or glob patterns>",
         required=True,
-        type=argparse.FileType("r"),
+        nargs="+",
     )
     parser.add_argument(
         "--svg",
         "-s",
         help="<output SVG image file name>",
         nargs="?",
-        type=argparse.FileType("w"),
-        default=sys.stdout,
+    )
+    parser.add_argument(
+        "--tile",
+        help="<split a waveform into tiles of this many cycles, --svg names their HTML index>",
+        type=int,
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        help="<number of worker processes for multiple inputs or tiles, 0 for one per CPU>",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "--backend",
+        help="<SVG backend, text is faster for large diagrams>",
+        choices=["svgwrite", "text"],
+        default="svgwrite",
+    )
+    parser.add_argument(
+        "--no-validate",
+        help="production mode, turn off svgwrite's validation of all attributes and elements",
+        dest="validate",
+        action="store_false",
+    )
+    parser.add_argument(
+        "--stream",
+        help="write waveforms lane by lane while rendering, for very large waveforms",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--merge-bricks",
+        help="draw runs of steady wave bricks as one pattern filled rect",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--prune-defs",
+        help="only add the skin definitions referenced by the diagram",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--target-width",
+        help="<narrow waveforms to this many pixels, collapsing cycles sharing a pixel>",
+        type=int,
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="<directory of a cache of rendered SVGs, reused across runs>",
     )
     args = parser.parse_args()
+    # The output is only opened once the options are known to be valid, so
+    # that a mistaken invocation does not truncate it
+    if args.svg == "-":
+        args.svg = None
+
+    if (
+        len(args.input) > 1
+        or os.path.isdir(args.input[0])
+        or glob.has_magic(args.input[0])
+    ):
+        for option, value in [
+            ("--svg", args.svg),
+            ("--stream", args.stream),
+            ("--tile", args.tile is not None),
+        ]:
+            if value:
+                parser.error("{} cannot be used with multiple inputs".format(option))
+        start = time.perf_counter()
+        results = render_files(
+            args.input,
+            jobs=args.jobs,
+            backend=args.backend,
+            validate=args.validate,
+            merge_bricks=args.merge_bricks,
+            prune_defs=args.prune_defs,
+            target_width=args.target_width,
+            cache_dir=args.cache_dir,
+        )
+        for r in results:
+            if r.error:
+                sys.stderr.write("{}: {}\n".format(r.source, r.error))
+        from . import batch
 
-    render_write(args.input, args.svg, False)
+        sys.stderr.write(batch.summary(results, time.perf_counter() - start) + "\n")
+        if any(r.error for r in results):
+            sys.exit(1)
+    elif args.tile is not None:
+        if args.svg is None:
+            parser.error("--tile needs --svg")
+        if args.tile < 1:
+            parser.error("--tile needs at least one cycle")
+        if args.stream:
+            parser.error("--stream cannot be used with --tile")
+        with open(args.input[0], "r") as f:
+            jinput = parse(f.read())
+        if not jinput.get("signal"):
+            parser.error("--tile only splits waveforms")
+        write_tiles(
+            jinput,
+            args.svg,
+            args.tile,
+            jobs=args.jobs,
+            backend=args.backend,
+            validate=args.validate,
+            merge_bricks=args.merge_bricks,
+            prune_defs=args.prune_defs,
+            target_width=args.target_width,
+        )
+    else:
+        options = dict(
+            backend=args.backend,
+            validate=args.validate,
+            stream=args.stream,
+            merge_bricks=args.merge_bricks,
+            prune_defs=args.prune_defs,
+            target_width=args.target_width,
+            cache_dir=args.cache_dir,
+        )
+        if args.input[0] == "-":
+            source = nullcontext(sys.stdin)
+        else:
+            source = open(args.input[0], "r")
+        with source as f:
+            with open(args.svg, "w") if args.svg else nullcontext(sys.stdout) as out:
+                render_write(f, out, **options)
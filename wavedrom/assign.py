@@ -4,41 +4,120 @@
 # Translated to Python from original file:
 # https://github.com/drom/wavedrom/blob/master/src/WaveDrom.js
 
-from collections import namedtuple
-import svgwrite
+from collections import deque
+from itertools import islice
 
 from .base import SVGBase
 
 
-class RenderState:
-    def __init__(self, x=0, y=0, xmax=0):
+class LayoutNode(object):
+    """A gate or an input of an assign tree, placed on the grid
+
+    `x` is the depth in the tree, `y` the row. Inputs have no `children`,
+    inputs referring to a shared subexpression have its root as `ref`.
+    """
+
+    __slots__ = ("name", "x", "y", "children", "ref")
+
+    def __init__(self, name, x, y=0, children=None, ref=None):
+        self.name = name
         self.x = x
         self.y = y
-        self.xmax = xmax
+        self.children = children
+        self.ref = ref
 
-    def __str__(self):
-        return "x={} y={}, xmax={}".format(self.x, self.y, self.xmax)
+    def __repr__(self):
+        return "LayoutNode({!r}, x={}, y={})".format(self.name, self.x, self.y)
 
 
-RenderObject = namedtuple("RenderObject", "name x y")
+def leaves(tree):
+    """The names of the inputs of `tree`, in no particular order"""
+    stack = [tree]
+    while stack:
+        t = stack.pop()
+        if isinstance(t, list):
+            stack.extend(islice(t, 1, None))
+        else:
+            yield t
 
 
 class Assign(SVGBase):
-    def render_tree(self, tree, state):
-        state.xmax = max(state.xmax, state.x)
-        y = state.y
-        for i in range(1, len(tree)):
-            if isinstance(tree[i], list):
-                state = self.render_tree(
-                    tree[i], RenderState(x=state.x + 1, y=state.y, xmax=state.xmax)
-                )
-            else:
-                tree[i] = RenderObject(name=tree[i], x=state.x + 1, y=state.y)
-                state.y += 2
-        tree[0] = RenderObject(name=tree[0], x=state.x, y=round((y + state.y - 2) / 2))
-        state.x -= 1
-
-        return state
+    def layout(self, trees, y=2, shared=None):
+        """Place the nodes of the assign `trees`
+
+        Inputs take two rows each, top to bottom in input order. Gates are
+        centered on their inputs. The trees are walked with an explicit
+        stack, so there is no limit on their depth, and the source is not
+        modified.
+
+        `shared` maps names to subexpressions. Inputs with one of these
+        names refer to the subexpression, which is laid out only once below
+        the trees, in the column of its leftmost reference. Its root is a
+        node named after it with the subexpression as only child, like the
+        output of a tree, and is added to the returned roots after the
+        trees.
+
+        Returns the root nodes, the next free row and the maximum depth of
+        the gates.
+        """
+        shared = shared or {}
+        refs = {name: [] for name in shared}
+        roots = []
+        xmax = 0
+
+        def place(tree, x):
+            nonlocal y, xmax
+            root = LayoutNode(tree[0], x, children=[])
+            roots.append(root)
+            # The open gates with their remaining inputs and first row
+            stack = [(root, islice(tree, 1, None), y)]
+            while stack:
+                node, inputs, ystart = stack[-1]
+                for t in inputs:
+                    if isinstance(t, list):
+                        gate = LayoutNode(t[0], node.x + 1, children=[])
+                        node.children.append(gate)
+                        xmax = max(xmax, gate.x)
+                        stack.append((gate, islice(t, 1, None), y))
+                        break
+                    leaf = LayoutNode(t, node.x + 1, y)
+                    node.children.append(leaf)
+                    if t in refs:
+                        refs[t].append(leaf)
+                    y += 2
+                else:
+                    stack.pop()
+                    node.y = round((ystart + y - 2) / 2)
+            return root
+
+        for tree in trees:
+            place(tree, 0)
+
+        # A subexpression is placed once all of its references are, that
+        # is after all subexpressions using it
+        users = dict.fromkeys(shared, 0)
+        for expr in shared.values():
+            for name in leaves(expr):
+                if name in users:
+                    users[name] += 1
+        ready = deque(name for name, count in users.items() if count == 0)
+        while ready:
+            name = ready.popleft()
+            x = max((leaf.x for leaf in refs[name]), default=1)
+            root = place([name, shared[name]], x - 1)
+            for leaf in refs[name]:
+                leaf.ref = root
+            for used in leaves(shared[name]):
+                if used in users:
+                    users[used] -= 1
+                    if users[used] == 0:
+                        ready.append(used)
+        cyclic = [name for name, count in users.items() if count]
+        if cyclic:
+            raise ValueError(
+                "Cyclic shared subexpressions: {}".format(", ".join(cyclic))
+            )
+        return roots, y, xmax
 
     def draw_body(self, type, ymin, ymax):
         circle = " M 4,0 C 4,1.1 3.1,2 2,2 0.9,2 0,1.1 0,0 c 0,-1.1 0.9,-2 2,-2 1.1,0 2,0.9 2,2 z"
@@ -131,77 +210,106 @@ class Assign(SVGBase):
 
         return ret
 
-    def draw_boxes(self, tree, xmax):
+    def draw_input(self, node, xmax):
+        fname = node.name
+        fx = 32 * (xmax - node.x)
+        fy = 8 * node.y
+        g = self.container.g(transform="translate({},{})".format(fx, fy))
+        g.add(self.element.title(fname))
+        g.add(self.element.path(d="M 2,0 a 2,2 0 1 1 -4,0 2,2 0 1 1 4,0 z"))
+        tspan = self.element.tspan(fname, x=[-4], y=[4], class_="pinname")
+        text = self.element.text("")
+        text.add(tspan)
+        g.add(text)
+        return g
+
+    def draw_reference(self, node, xmax):
+        """Draw the wire from a shared subexpression to the input `node`"""
+        source = node.ref.children[0]
+        sx = 32 * (xmax - source.x)
+        fx = 32 * (xmax - node.x)
+        fy = 8 * node.y
+        g = self.container.g()
+        g.add(self.element.title(node.name))
+        g.add(
+            self.element.path(
+                d="M {},{} {},{} {},{} {},{}".format(
+                    sx, 8 * source.y, sx + 8, 8 * source.y, sx + 8, fy, fx, fy
+                ),
+                class_="wire",
+            )
+        )
+        tspan = self.element.tspan(node.name, x=[fx - 4], y=[fy - 3], class_="pinname")
+        text = self.element.text("")
+        text.add(tspan)
+        g.add(text)
+        return g
+
+    def draw_boxes(self, root, xmax):
+        """Draw the gates and inputs of the tree of `root` in one group
+
+        They are placed at absolute positions and added side by side, so
+        deep trees do not nest elements and can be serialized by any
+        backend. Gates come before their inputs, in the order of the tree.
+        """
         ret = self.container.g()
-        spec = []
-
-        if isinstance(tree, list):
-            spec.append(tree[0].name)
-            spec.append([32 * (xmax - tree[0].x), 8 * tree[0].y])
-            for t in tree[1:]:
-                if isinstance(t, list):
-                    spec.append([32 * (xmax - t[0].x), 8 * t[0].y])
-                else:
-                    spec.append([32 * (xmax - t.x), 8 * t.y])
-
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node.ref is not None:
+                ret.add(self.draw_reference(node, xmax))
+                continue
+            if node.children is None:
+                ret.add(self.draw_input(node, xmax))
+                continue
+            spec = [node.name, [32 * (xmax - node.x), 8 * node.y]]
+            for t in node.children:
+                spec.append([32 * (xmax - t.x), 8 * t.y])
             ret.add(self.draw_gate(spec))
-
-            for t in tree[1:]:
-                ret.add(self.draw_boxes(t, xmax))
-        else:
-            fname = tree.name
-            fx = 32 * (xmax - tree.x)
-            fy = 8 * tree.y
-            g = self.container.g(transform="translate({},{})".format(fx, fy))
-            g.add(self.element.title(fname))
-            g.add(self.element.path(d="M 2,0 a 2,2 0 1 1 -4,0 2,2 0 1 1 4,0 z"))
-            tspan = self.element.tspan(fname, x=[-4], y=[4], class_="pinname")
-            text = self.element.text("")
-            text.add(tspan)
-            g.add(text)
-            ret.add(g)
-
+            stack.extend(reversed(node.children))
         return ret
 
     def render(self, index=0, source={}, output=[]):
         STYLE = ".pinname {font-size:12px; font-style:normal; font-variant:normal; font-weight:500; font-stretch:normal; text-align:center; text-anchor:end; font-family:Helvetica} .wirename {font-size:12px; font-style:normal; font-variant:normal; font-weight:500; font-stretch:normal; text-align:center; text-anchor:start; font-family:Helvetica} .wirename:hover {fill:blue} .gate {color:#000; fill:#ffc; fill-opacity: 1;stroke:#000; stroke-width:1; stroke-opacity:1} .gate:hover {fill:red !important; } .wire {fill:none; stroke:#000; stroke-width:1; stroke-opacity:1} .grid {fill:#fff; fill-opacity:1; stroke:none}"
 
-        tree = source.get("assign")
-        state = RenderState(x=0, y=2, xmax=0)
-
-        for t in tree:
-            state = self.render_tree(t, state)
-            state.x += 1
-
-        xmax = state.xmax + 3
+        trees = source.get("assign")
+        shared = source.get("shared")
+        roots, y, xmax = self.layout(trees, shared=shared)
+        xmax += 3
 
         width = 32 * (xmax + 1) + 1
-        height = 8 * (state.y + 1) - 7
+        height = 8 * (y + 1) - 7
         ilen = 4 * (xmax + 1)
-        jlen = state.y + 1
-
-        grid = self.container.g()
-
-        for i in range(ilen + 1):
-            for j in range(jlen + 1):
-                grid.add(
-                    self.element.rect(
-                        height=1,
-                        width=1,
-                        x=(i * 8 - 0.5),
-                        y=(j * 8 - 0.5),
-                        class_="grid",
-                    )
-                )
+        jlen = y + 1
+
+        # The grid of (ilen + 1) x (jlen + 1) dots, 8 apart, is a single
+        # rect filled with a pattern of one dot
+        pattern = self.container.pattern(
+            id="grid_{index}".format(index=index),
+            insert=(-0.5, -0.5),
+            size=(8, 8),
+            patternUnits="userSpaceOnUse",
+        )
+        pattern.add(self.element.rect(insert=(0, 0), size=(1, 1), class_="grid"))
+        grid = self.element.rect(
+            insert=(-0.5, -0.5),
+            size=(ilen * 8 + 1, jlen * 8 + 1),
+            fill="url(#grid_{index})".format(index=index),
+        )
 
-        for t in tree:
-            content = self.draw_boxes(t, xmax)
+        # All trees are drawn, shared subexpressions without their root
+        content = self.container.g()
+        for root in roots[: len(trees)]:
+            content.add(self.draw_boxes(root, xmax))
+        for root in roots[len(trees) :]:
+            content.add(self.draw_boxes(root.children[0], xmax))
 
         attr = {"viewBox": "0 0 {} {}".format(width, height)}
-        template = svgwrite.Drawing(
+        template = self.container.svg(
             id="svgcontent_{index}".format(index=index), size=[width, height], **attr
         )
-        template.defs.add(svgwrite.container.Style(content=STYLE))
+        template.defs.add(self.container.style(content=STYLE))
+        template.defs.add(pattern)
         g = self.container.g(transform="translate(0.5,0.5)")
         g.add(grid)
         g.add(content)
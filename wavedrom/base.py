@@ -1,26 +1,95 @@
 # Copyright wavedrompy contributors.
 # SPDX-License-Identifier: MIT
 
-import svgwrite
+from functools import partial
+
 from .attrdict import AttrDict
+from . import svgtext
 
 
-class SVGBase(object):
-    container = AttrDict(
-        {
-            "defs": svgwrite.container.Defs,
-            "g": svgwrite.container.Group,
-            "marker": svgwrite.container.Marker,
-            "use": svgwrite.container.Use,
-        }
-    )
-    element = AttrDict(
+def svgwrite_factories(debug=True):
+    """Element factories building svgwrite elements
+
+    With `debug` disabled all elements share one svgwrite parameter set
+    with validation turned off. svgwrite otherwise validates every
+    attribute and child element, which is a large part of the rendering
+    time.
+    """
+    import svgwrite
+    from svgwrite.params import Parameter
+    from .jsonml import JsonMLElement
+
+    factory = AttrDict({"_parameter": Parameter(debug=False)})
+
+    def wrap(cls):
+        return cls if debug else partial(cls, factory=factory)
+
+    return AttrDict(
         {
-            "rect": svgwrite.shapes.Rect,
-            "path": svgwrite.path.Path,
-            "text": svgwrite.text.Text,
-            "tspan": svgwrite.text.TSpan,
-            "title": svgwrite.base.Title,
-            "line": svgwrite.shapes.Line,
+            "container": AttrDict(
+                {
+                    "defs": wrap(svgwrite.container.Defs),
+                    "g": wrap(svgwrite.container.Group),
+                    "marker": wrap(svgwrite.container.Marker),
+                    "use": wrap(svgwrite.container.Use),
+                    "svg": wrap(svgwrite.Drawing),
+                    "style": wrap(svgwrite.container.Style),
+                    "pattern": wrap(svgwrite.pattern.Pattern),
+                }
+            ),
+            "element": AttrDict(
+                {
+                    "rect": wrap(svgwrite.shapes.Rect),
+                    "path": wrap(svgwrite.path.Path),
+                    "text": wrap(svgwrite.text.Text),
+                    "tspan": wrap(svgwrite.text.TSpan),
+                    # Neither of those validates
+                    "title": svgwrite.base.Title,
+                    "jsonml": JsonMLElement,
+                    "line": wrap(svgwrite.shapes.Line),
+                }
+            ),
         }
     )
+
+
+# Element factories of the output backends. "svgwrite" builds svgwrite
+# element trees, "text" uses the lightweight elements of svgtext that are
+# serialized straight to text. Importing svgwrite takes a while, its
+# factories are only built when the backend is first used.
+backend_names = ("svgwrite", "text")
+backends = {
+    "text": AttrDict({"container": svgtext.container, "element": svgtext.element}),
+}
+unvalidated = {}
+
+
+def get_factories(backend, validate=True):
+    """The element factories of `backend`, with or without validation"""
+    if backend not in backend_names:
+        raise ValueError(
+            "Unknown backend {}, choose from {}".format(
+                backend, ", ".join(sorted(backend_names))
+            )
+        )
+    if backend not in backends:
+        backends[backend] = svgwrite_factories()
+        unvalidated[backend] = svgwrite_factories(debug=False)
+    if not validate:
+        # The text backend never validates
+        return unvalidated.get(backend, backends[backend])
+    return backends[backend]
+
+
+def start_tag(element):
+    """The start tag of the empty `element`, for writing its children after"""
+    # The serialization of an empty element ends with " />"
+    return element.tostring()[:-3] + ">"
+
+
+class SVGBase(object):
+    def __init__(self, backend="svgwrite", validate=True):
+        factories = get_factories(backend, validate)
+        self.backend = backend
+        self.container = factories.container
+        self.element = factories.element
@@ -0,0 +1,132 @@
+# Copyright wavedrompy contributors.
+# SPDX-License-Identifier: MIT
+
+import glob
+import os
+import time
+import traceback
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from . import wavejson
+from .cache import RenderCache
+from .renderers import Renderers, render_source
+
+BatchResult = namedtuple("BatchResult", "source output seconds error cached")
+# cached tells if the SVG was taken from the cache, it is None without cache
+BatchResult.__new__.__defaults__ = (None,)
+
+
+def find_sources(paths, pattern="*.json"):
+    """Expand directories and glob patterns to a list of source files
+
+    Directories are searched recursively for files matching `pattern`.
+    Plain file names are passed through unchanged.
+    """
+    sources = []
+    for path in paths:
+        if os.path.isdir(path):
+            sources.extend(
+                sorted(glob.glob(os.path.join(path, "**", pattern), recursive=True))
+            )
+        elif glob.has_magic(path):
+            sources.extend(sorted(glob.glob(path, recursive=True)))
+        else:
+            sources.append(path)
+    return sources
+
+
+def output_name(source):
+    return os.path.splitext(source)[0] + ".svg"
+
+
+def render_chunk(sources, strict_js_features=False, cache_dir=None, **options):
+    """Render a list of source files, writing each SVG next to its source
+
+    Errors are recorded in the result of the failing source and do not
+    stop the remaining sources from being rendered. The `options` are
+    passed on to the renderers (e.g. the backend). With `cache_dir` given
+    the SVGs are looked up in and added to a :class:`cache.RenderCache`.
+    """
+    renderers = Renderers(**options)
+    cache = RenderCache(cache_dir) if cache_dir else None
+    results = []
+    for source in sources:
+        output = output_name(source)
+        start = time.perf_counter()
+        error = None
+        cached = None
+        try:
+            with open(source, "r") as f:
+                jinput = wavejson.loads(f.read())
+            if cache:
+                key = cache.key(jinput, strict_js_features, **options)
+                out, cached = cache.fetch(
+                    key,
+                    lambda: render_source(jinput, [], strict_js_features, renderers),
+                )
+            else:
+                out = render_source(jinput, [], strict_js_features, renderers)
+            if out is None:
+                raise ValueError("no signal, assign or reg found")
+            with open(output, "w") as f:
+                out.write(f)
+        except Exception as e:
+            error = "".join(traceback.format_exception_only(type(e), e)).strip()
+        results.append(
+            BatchResult(source, output, time.perf_counter() - start, error, cached)
+        )
+    return results
+
+
+def render_files(sources, jobs=1, strict_js_features=False, **options):
+    """Render source files across `jobs` worker processes
+
+    Each SVG is written next to its source. The results are returned in
+    input order. With `jobs` set to 0 one worker per CPU is used.
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(sources))
+    if jobs <= 1:
+        return render_chunk(sources, strict_js_features, **options)
+
+    # Several chunks per worker balance the load when a few diagrams are
+    # much bigger than the rest, while still amortizing setup per chunk
+    size = max(1, len(sources) // (jobs * 4))
+    chunks = [sources[i : i + size] for i in range(0, len(sources), size)]
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        worker = partial(render_chunk, strict_js_features=strict_js_features, **options)
+        for chunk in executor.map(worker, chunks):
+            results.extend(chunk)
+    return results
+
+
+def summary(results, seconds):
+    failed = [r for r in results if r.error]
+    lines = [
+        "rendered {} of {} files in {:.3f} s".format(
+            len(results) - len(failed), len(results), seconds
+        )
+    ]
+    if results:
+        total = sum(r.seconds for r in results)
+        slowest = max(results, key=lambda r: r.seconds)
+        lines.append(
+            "render time: {:.3f} s total, {:.1f} ms mean, {:.1f} ms max ({})".format(
+                total,
+                1000 * total / len(results),
+                1000 * slowest.seconds,
+                slowest.source,
+            )
+        )
+        cached = [r.cached for r in results if r.cached is not None]
+        if cached:
+            lines.append(
+                "cache: {} hits, {} misses".format(
+                    cached.count(True), cached.count(False)
+                )
+            )
+    return "\n".join(lines)
@@ -6,9 +6,7 @@
 
 from math import floor
 
-import svgwrite
-
-from .base import SVGBase
+from .base import SVGBase, start_tag
 from .tspan import TspanParser
 
 
@@ -48,7 +46,10 @@ def type_style(t):
 
 class BitField(SVGBase):
     def tspan_parse(self, text):
-        parser = TspanParser()
+        if text and "<" not in text and "&" not in text:
+            # Plain text, the parser would return it as a single tspan
+            return [self.element.tspan(text)]
+        parser = TspanParser(self.element.tspan)
         parser.feed(text)
         return parser.get_text()
 
@@ -200,13 +201,14 @@ class BitField(SVGBase):
             g.add(self.vline(vspace / 2))
         g.add(self.hline(hspace, 0, vspace / 2))
 
+        lsbs = {e["lsb"] for e in desc}
         i = self.index * mod
         if self.opt.vflip:
             r = range(0, mod + 1)
         else:
             r = range(mod, 0, -1)
         for j in r:
-            if j == mod or any([(e["lsb"] == i) for e in desc]):
+            if j == mod or i in lsbs:
                 g.add(self.vline((vspace / 2), j * (hspace / mod)))
             else:
                 g.add(self.vline((vspace / 16), j * (hspace / mod)))
@@ -215,7 +217,19 @@ class BitField(SVGBase):
 
         return g
 
-    def lane(self, desc):
+    def font(self, opt):
+        return dict(
+            text_anchor="middle",
+            font_size=opt.fontsize,
+            font_family=opt.fontfamily,
+            font_weight=opt.fontweight,
+        )
+
+    def lane(self, desc, font=True):
+        """Draw the lane `self.index` of the fields `desc`
+
+        Without `font` the font attributes are left to the parent element.
+        """
         x = 4.5
         if self.opt.hflip:
             i = self.index
@@ -224,16 +238,27 @@ class BitField(SVGBase):
         y = i * self.opt.vspace + 0.5
         g = self.container.g(
             transform="translate({},{})".format(x, y),
-            text_anchor="middle",
-            font_size=self.opt.fontsize,
-            font_family=self.opt.fontfamily,
-            font_weight=self.opt.fontweight,
+            **(self.font(self.opt) if font else {})
         )
 
         g.add(self.cage(desc))
         g.add(self.labels(desc))
         return g
 
+    def lane_fields(self, desc):
+        """The fields of `desc` drawn in each lane, by lane index
+
+        A field is drawn in the lanes of its lsb and of its msb.
+        """
+        lanes = {}
+        for e in desc:
+            first = floor(e["lsb"] / self.mod)
+            last = floor(e["msb"] / self.mod)
+            lanes.setdefault(first, []).append(e)
+            if last != first:
+                lanes.setdefault(last, []).append(e)
+        return lanes
+
     def get_max_attrs(self, desc):
         max_count = 0
         for e in desc:
@@ -244,7 +269,11 @@ class BitField(SVGBase):
                     max_count = max(max_count, 1)
         return max_count
 
-    def render(self, desc, opt=Options()):
+    def prepare(self, desc, opt):
+        """Set up drawing the fields `desc` with `opt`
+
+        Returns the size of the drawing and the fields by lane.
+        """
         self.opt = opt
 
         # Compute extra per-lane space needed if there are more than one attr
@@ -259,15 +288,11 @@ class BitField(SVGBase):
         width = opt.hspace + 9
         height = (opt.vspace + self.extra_attr_space) * opt.lanes + 5
 
-        template = svgwrite.Drawing()
-        template["width"] = width
-        template["height"] = height
-        template["class"] = "WaveDrom"
-        template.viewbox(0, 0, width, height)
-
         lsb = 0
         self.mod = int(opt.bits / opt.lanes)
 
+        # Work on copies of the fields, the caller's desc is not modified
+        desc = [dict(e) for e in desc]
         for e in desc:
             e["lsb"] = lsb
             e["lsbm"] = lsb % self.mod
@@ -275,15 +300,114 @@ class BitField(SVGBase):
             e["msb"] = lsb - 1
             e["msbm"] = e["msb"] % self.mod
 
+        # Each lane only looks at its own fields
+        return width, height, self.lane_fields(desc)
+
+    def template(self, width, height):
+        template = self.container.svg()
+        template["width"] = width
+        template["height"] = height
+        template["class"] = "WaveDrom"
+        template.viewbox(0, 0, width, height)
+        return template
+
+    def render(self, desc, opt=Options()):
+        width, height, lanes = self.prepare(desc, opt)
+        template = self.template(width, height)
         for i in range(opt.lanes):
             self.index = i
-            template.add(self.lane(desc))
+            template.add(self.lane(lanes.get(i, [])))
 
         return template
 
-    def renderJson(self, source):
-        opt = Options()
+    def options(self, source):
         if source.get("config"):
-            opt = Options(**source["config"])
+            return Options(**source["config"])
+        return Options()
+
+    @staticmethod
+    def register_source(register):
+        """The source of a register given as a source or a list of fields"""
+        if isinstance(register, list):
+            return {"reg": register}
+        return register
+
+    def renderJson(self, source):
+        opt = self.options(source)
         if source.get("reg"):
             return self.render(source["reg"], opt)
+
+    def render_map(self, registers):
+        """Render a register map, returning the drawings in order
+
+        The registers are given as sources with "reg" and an optional
+        "config", or as plain lists of fields.
+        """
+        return [self.renderJson(self.register_source(r)) for r in registers]
+
+    def write_map(self, fileobj, registers, config=None, gap=16):
+        """Write a register map to `fileobj` as one SVG document
+
+        The registers are given like for :meth:`render_map`, and are
+        stacked top to bottom `gap` apart. A register with a "name" gets
+        it as a title. The font given in `config` is set once for the
+        whole document, registers only carry their own font if their
+        config differs.
+
+        Each register is rendered and written on its own, so only the
+        elements of one register are held at a time. The document is sized
+        before the first register is written, so all sources of
+        `registers` are read into memory first.
+        """
+        registers = [self.register_source(r) for r in registers]
+
+        def title_space(source):
+            return round(doc.fontsize * 1.5) if source.get("name") else 0
+
+        doc = Options(**(config or {}))
+
+        # Size the document, the header has to be written first
+        width = height = 0
+        for source in registers:
+            if not source.get("reg"):
+                continue
+            opt = self.options(source)
+            extra_attrs = max(self.get_max_attrs(source["reg"]) - 1, 0)
+            width = max(width, opt.hspace + 9)
+            height += title_space(source) + gap
+            height += (opt.vspace + extra_attrs * 16) * opt.lanes + 5
+        height = max(height - gap, 0)
+
+        template = self.template(width, height)
+        style = ".regname {text-anchor:start; font-weight:bold}"
+        template.defs.add(self.container.style(content=style))
+        fileobj.write('<?xml version="1.0" encoding="utf-8" ?>\n')
+        fileobj.write(template.tostring()[: -len("</svg>")])
+        fileobj.write(start_tag(self.container.g(**self.font(doc))))
+
+        y = 0
+        for i, source in enumerate(registers):
+            if not source.get("reg"):
+                continue
+            opt = self.options(source)
+            _, reg_height, lanes = self.prepare(source["reg"], opt)
+            font = {}
+            if self.font(opt) != self.font(doc):
+                font = self.font(opt)
+            reg = self.container.g(
+                id="reg_{}".format(i), transform="translate(0,{})".format(y), **font
+            )
+            fileobj.write(start_tag(reg))
+            top = title_space(source)
+            if top:
+                title = self.get_text(source["name"], 4.5, doc.fontsize)
+                title["class"] = "regname"
+                fileobj.write(title.tostring())
+            lanes_g = self.container.g(transform="translate(0,{})".format(top))
+            fileobj.write(start_tag(lanes_g))
+            for j in range(opt.lanes):
+                self.index = j
+                fileobj.write(self.lane(lanes.get(j, []), font=False).tostring())
+            fileobj.write("</g></g>")
+            y += top + reg_height + gap
+        fileobj.write("</g></svg>")
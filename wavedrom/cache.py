@@ -0,0 +1,203 @@
+# Copyright wavedrompy contributors.
+# SPDX-License-Identifier: MIT
+
+"""On-disk cache of rendered diagrams
+
+The SVG of a diagram is stored under a hash of everything that affects
+the output: the parsed source (which includes the skin), the rendering
+options, the font metrics of the skin and the package version. The cache
+directory is bounded in size, the least recently used diagrams are
+removed first.
+"""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+
+from .metrics import default_font_metrics, font_metrics
+from .renderers import Renderers, parse, render
+from .version import version
+
+SVG_HEADER = '<?xml version="1.0" encoding="utf-8" ?>\n'
+
+
+class CachedDrawing(object):
+    """A rendered diagram read from the cache
+
+    Supports the same output methods as the drawings returned by
+    :func:`wavedrom.render`.
+    """
+
+    def __init__(self, svg, filename="noname.svg"):
+        self.svg = svg
+        self.filename = filename
+
+    def tostring(self):
+        return self.svg
+
+    def write(self, fileobj, pretty=False, indent=2):
+        fileobj.write(SVG_HEADER)
+        if pretty:
+            from svgwrite.utils import pretty_xml
+
+            fileobj.write(pretty_xml(self.svg, indent=indent))
+        else:
+            fileobj.write(self.svg)
+
+    def save(self, pretty=False, indent=2):
+        with io.open(self.filename, mode="w", encoding="utf-8") as fileobj:
+            self.write(fileobj, pretty=pretty, indent=indent)
+
+    def saveas(self, filename, pretty=False, indent=2):
+        self.filename = filename
+        self.save(pretty=pretty, indent=indent)
+
+    def _repr_svg_(self):
+        return self.svg
+
+
+class RenderCache(object):
+    """Cache of rendered SVGs in `directory`
+
+    The cache holds at most `max_size` bytes of SVG. When it grows beyond
+    that, the least recently used entries are removed until it is down to
+    `low_water` of `max_size`, so that the directory is only scanned once
+    in a while. Several processes can share one directory.
+    """
+
+    suffix = ".svg"
+    low_water = 0.9
+
+    def __init__(self, directory, max_size=256 * 2**20):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # Workers sharing the cache may create the directory concurrently
+        os.makedirs(directory, exist_ok=True)
+        self.size = sum(size for _, size, _ in self.entries())
+
+    @property
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": self.size}
+
+    @staticmethod
+    def key(source, strict_js_features=False, **options):
+        """Hash of the parsed `source` and all options changing the output
+
+        The `options` are those of :func:`wavedrom.render`. The backend
+        and validation do not change the output and are not part of the
+        key.
+        """
+        config = source.get("config") or {}
+        skin = config.get("skin", "default")
+        metrics = font_metrics.get(skin, default_font_metrics)
+        canonical = json.dumps(
+            [
+                version,
+                source,
+                skin,
+                metrics.digest,
+                bool(strict_js_features),
+                Renderers(**options).output_options,
+            ],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=repr,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + self.suffix)
+
+    def get(self, key):
+        """The SVG stored under `key`, or None"""
+        path = self.path(key)
+        try:
+            with io.open(path, encoding="utf-8") as f:
+                svg = f.read()
+            # The modification time orders the entries for eviction
+            os.utime(path, None)
+        except (IOError, OSError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return svg
+
+    def put(self, key, svg):
+        """Store `svg` under `key` and evict old entries if necessary"""
+        data = svg.encode("utf-8")
+        # Written to a temporary file first, so that concurrent readers
+        # never see a partial entry
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        path = self.path(key)
+        try:
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+        os.replace(tmp, path)
+        self.size += len(data) - replaced
+        if self.size > self.max_size:
+            self.evict()
+
+    def entries(self):
+        """The (path, size, mtime) of all entries"""
+        for name in os.listdir(self.directory):
+            if name.endswith(self.suffix):
+                path = os.path.join(self.directory, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue  # removed by another process
+                yield path, st.st_size, st.st_mtime
+
+    def evict(self):
+        """Remove the least recently used entries down to the low water mark"""
+        entries = sorted(self.entries(), key=lambda e: e[2])
+        self.size = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if self.size <= self.max_size * self.low_water:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self.size -= size
+
+    def clear(self):
+        for path, _, _ in list(self.entries()):
+            os.remove(path)
+        self.size = 0
+
+    def fetch(self, key, render):
+        """The drawing stored under `key`, or the drawing returned by `render()`
+
+        A rendered drawing is added to the cache. Returns the drawing,
+        None if `render()` returned None, and whether it was a cache hit.
+        """
+        svg = self.get(key)
+        if svg is not None:
+            return CachedDrawing(svg), True
+        drawing = render()
+        if drawing is not None:
+            svg = drawing.tostring()
+            self.put(key, svg)
+            drawing = CachedDrawing(svg)
+        return drawing, False
+
+    def render(self, source, strict_js_features=False, **options):
+        """Render `source` like :func:`wavedrom.render`, using the cache
+
+        Returns a :class:`CachedDrawing`, or None if the source contains no
+        diagram.
+        """
+        source = parse(source)
+        key = self.key(source, strict_js_features, **options)
+        drawing, _ = self.fetch(
+            key, lambda: render(source, [], strict_js_features, **options)
+        )
+        return drawing
@@ -0,0 +1,93 @@
+# Copyright wavedrompy contributors.
+# SPDX-License-Identifier: MIT
+
+"""Font metrics for estimating the width of text
+
+The widths of characters are given in 1/100 of the font size. The
+default table is the one used by WaveDrom.
+"""
+
+import hashlib
+from array import array
+from functools import lru_cache
+
+# Widths of the first 512 code points
+# fmt: off
+char_widths = array("B", [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 34, 47, 74, 74, 118, 89, 25, 44, 44, 52, 78, 37, 44, 37, 37,
+    74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 37, 37, 78, 78, 78, 74,
+    135, 89, 89, 96, 96, 89, 81, 103, 96, 37, 67, 89, 74, 109, 96, 103,
+    89, 103, 96, 89, 81, 96, 89, 127, 89, 87, 81, 37, 37, 37, 61, 74,
+    44, 74, 74, 67, 74, 74, 37, 74, 74, 30, 30, 67, 30, 112, 74, 74,
+    74, 74, 44, 67, 37, 74, 67, 95, 66, 65, 67, 44, 34, 44, 78, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    37, 43, 74, 74, 74, 74, 34, 74, 44, 98, 49, 74, 78, 0, 98, 73,
+    53, 73, 44, 44, 44, 77, 71, 37, 44, 44, 49, 74, 111, 111, 111, 81,
+    89, 89, 89, 89, 89, 89, 133, 96, 89, 89, 89, 89, 37, 37, 37, 37,
+    96, 96, 103, 103, 103, 103, 103, 78, 103, 96, 96, 96, 96, 87, 89, 81,
+    74, 74, 74, 74, 74, 74, 118, 67, 74, 74, 74, 74, 36, 36, 36, 36,
+    74, 74, 74, 74, 74, 74, 74, 73, 81, 74, 74, 74, 74, 65, 74, 65,
+    89, 74, 89, 74, 89, 74, 96, 67, 96, 67, 96, 67, 96, 67, 96, 82,
+    96, 74, 89, 74, 89, 74, 89, 74, 89, 74, 89, 74, 103, 74, 103, 74,
+    103, 74, 103, 74, 96, 74, 96, 74, 37, 36, 37, 36, 37, 36, 37, 30,
+    37, 36, 98, 59, 67, 30, 89, 67, 67, 74, 30, 74, 30, 74, 39, 74,
+    44, 74, 30, 96, 74, 96, 74, 96, 74, 80, 96, 74, 103, 74, 103, 74,
+    103, 74, 133, 126, 96, 44, 96, 44, 96, 44, 89, 67, 89, 67, 89, 67,
+    89, 67, 81, 38, 81, 50, 81, 37, 96, 74, 96, 74, 96, 74, 96, 74,
+    96, 74, 96, 74, 127, 95, 87, 65, 87, 81, 67, 81, 67, 81, 67, 30,
+    84, 97, 91, 84, 91, 84, 94, 92, 73, 104, 109, 91, 84, 81, 84, 100,
+    82, 76, 74, 103, 91, 131, 47, 40, 99, 77, 37, 79, 130, 100, 84, 104,
+    114, 87, 126, 101, 87, 84, 93, 84, 69, 84, 46, 52, 82, 52, 82, 114,
+    89, 102, 96, 100, 98, 91, 70, 88, 88, 77, 70, 85, 89, 77, 67, 84,
+    39, 65, 61, 39, 189, 173, 153, 111, 105, 61, 123, 123, 106, 89, 74, 37,
+    30, 103, 74, 96, 74, 96, 74, 96, 74, 96, 74, 96, 74, 81, 91, 81,
+    91, 81, 130, 131, 102, 84, 103, 84, 87, 78, 104, 81, 104, 81, 88, 76,
+    37, 189, 173, 153, 103, 84, 148, 90, 100, 84, 89, 74, 133, 118, 103, 81,
+])
+# fmt: on
+
+
+class FontMetrics(object):
+    """Character widths of a font
+
+    `widths` are the widths of the characters indexed by code point, in
+    1/100 of the font size. Characters beyond the table are `default`
+    wide. The widths of the last `cache_size` strings are memoized, as
+    the same lane names and labels appear over and over. The `digest`
+    identifies the widths, e.g. in the keys of cached renders.
+    """
+
+    def __init__(self, widths, default=114, cache_size=4096):
+        self.widths = array("H", widths)
+        self.default = default
+        data = self.widths.tobytes() + str(default).encode()
+        self.digest = hashlib.sha256(data).hexdigest()
+        # Strings of code points below 256 are summed by bytes.translate
+        latin1 = list(self.widths[:256]) + [default] * (256 - len(self.widths))
+        self.latin1 = bytes(latin1) if max(latin1) < 256 else None
+        self.units = lru_cache(maxsize=cache_size)(self.gen_units)
+
+    def gen_units(self, string):
+        """Width of `string` in 1/100 of the font size"""
+        if self.latin1 is not None:
+            try:
+                return sum(string.encode("latin-1").translate(self.latin1))
+            except UnicodeEncodeError:
+                pass
+        widths = self.widths
+        count = len(widths)
+        default = self.default
+        return sum(widths[o] if o < count else default for o in map(ord, string))
+
+    def width(self, string, size=11):
+        """Width of `string` in pixels at font `size`"""
+        return self.units(string) * size / 100
+
+
+default_font_metrics = FontMetrics(char_widths)
+
+# Font metrics of the skins, skins not listed use default_font_metrics
+font_metrics = {}
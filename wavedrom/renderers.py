@@ -0,0 +1,125 @@
+# Copyright wavedrompy contributors.
+# SPDX-License-Identifier: MIT
+
+"""The render entry points shared by the package and its modules
+
+The package and the modules rendering on its behalf (batch, cache,
+server and tiles) import them from here, the package imports those
+modules in turn.
+"""
+
+from collections.abc import Mapping
+
+from . import wavejson
+
+
+class Renderers(object):
+    """The renderer of each kind of diagram, created on first use
+
+    The keyword arguments are the rendering options taken by all render
+    functions of the package (:func:`render`, :func:`wavedrom.render_files`
+    and so on), which pass them on here.
+
+    The `backend` selects how the SVG is built: "svgwrite" returns an
+    svgwrite drawing, "text" a lightweight drawing that is serialized
+    directly to text (see :mod:`wavedrom.svgtext`) and is much faster for
+    large diagrams. Both produce the same output.
+
+    svgwrite validates all attributes and elements. Setting `validate` to
+    False turns this off for production use, where the sources are known
+    to render correctly.
+
+    With `merge_bricks` set, runs of the same steady wave brick (like a
+    long stretch of 0, 1, x or data) are drawn as a single rect filled with
+    a pattern of the brick instead of one element per cycle. This makes the
+    SVG of long, mostly idle waveforms much smaller and faster to display.
+
+    By default the drawing contains all definitions of the skin. With
+    `prune_defs` set only the ones referenced by the diagram are added.
+
+    Waveforms wider than `target_width` pixels are narrowed to fit. Once
+    several bricks fall into one pixel column, they are drawn as a single
+    stretched brick where the wave is steady and as a busy band where it
+    changes, so the size of the SVG is bounded by the width instead of the
+    number of cycles.
+    """
+
+    def __init__(
+        self,
+        backend="svgwrite",
+        validate=True,
+        merge_bricks=False,
+        prune_defs=False,
+        target_width=None,
+    ):
+        self.backend = backend
+        self.validate = validate
+        self.merge_bricks = merge_bricks
+        self.prune_defs = prune_defs
+        self.target_width = target_width
+        self._waveform = self._assign = self._bitfield = None
+
+    @property
+    def output_options(self):
+        """The options changing the output, the backend and validation do not"""
+        return {
+            "merge_bricks": bool(self.merge_bricks),
+            "prune_defs": bool(self.prune_defs),
+            "target_width": self.target_width,
+        }
+
+    @property
+    def waveform(self):
+        if self._waveform is None:
+            from .waveform import WaveDrom
+
+            self._waveform = WaveDrom(
+                self.backend,
+                self.validate,
+                self.merge_bricks,
+                self.prune_defs,
+                self.target_width,
+            )
+        return self._waveform
+
+    @property
+    def assign(self):
+        if self._assign is None:
+            from .assign import Assign
+
+            self._assign = Assign(self.backend, self.validate)
+        return self._assign
+
+    @property
+    def bitfield(self):
+        if self._bitfield is None:
+            from .bitfield import BitField
+
+            self._bitfield = BitField(self.backend, self.validate)
+        return self._bitfield
+
+
+def render_source(source, output, strict_js_features, renderers):
+    if source.get("signal"):
+        return renderers.waveform.render_waveform(0, source, output, strict_js_features)
+    elif source.get("assign"):
+        return renderers.assign.render(0, source, output)
+    elif source.get("reg"):
+        return renderers.bitfield.renderJson(source)
+
+
+def parse(source):
+    """Parse a source given as text, dicts are returned unchanged"""
+    if isinstance(source, Mapping):
+        return source
+    return wavejson.loads(source)
+
+
+def render(source="", output=[], strict_js_features=False, **options):
+    """Render a source given as WaveJSON text or as an already parsed dict
+
+    The `options` select the backend and how diagrams are drawn, see
+    :class:`Renderers`.
+    """
+    source = parse(source)
+    return render_source(source, output, strict_js_features, Renderers(**options))
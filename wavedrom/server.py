@@ -0,0 +1,232 @@
+# Copyright wavedrompy contributors.
+# SPDX-License-Identifier: MIT
+
+"""Long running render server
+
+Started with ``wavedrompy serve``, the server reads render requests as
+newline delimited JSON from stdin or from the connections to a Unix
+domain socket, and writes one JSON line with the response to each::
+
+    {"id": 1, "source": "{signal: [{wave: '01'}]}", "options": {"backend": "text"}}
+    {"id": 1, "svg": "<svg ...>"}
+
+The source is given as text or as a parsed object. The options are those
+of :func:`wavedrom.render` and override the defaults of the server. A
+failed request gets an "error" instead of the "svg". The requests are
+rendered by a pool of workers and answered as soon as they are done, so
+clients can send many requests at once and match the responses by "id".
+"""
+
+import functools
+import inspect
+import json
+import os
+import socketserver
+import stat
+import sys
+import threading
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from .renderers import Renderers, parse, render_source
+
+# The options of a request, those of wavedrom.render
+render_options = ("strict_js_features",) + tuple(
+    inspect.signature(Renderers).parameters
+)
+
+
+@functools.lru_cache(maxsize=16)
+def worker_renderers(options):
+    """The renderers with the sorted `options` items, reused across requests
+
+    Only the renderers of the most recently used options are kept.
+    """
+    return Renderers(**dict(options))
+
+
+def render_request(request, defaults={}):
+    """Render the source of a request, returns the response"""
+    response = {"id": request.get("id")}
+    try:
+        options = dict(defaults)
+        options.update(request.get("options") or {})
+        unknown = sorted(set(options) - set(render_options))
+        if unknown:
+            raise ValueError("Unknown options: {}".format(", ".join(unknown)))
+        if "source" not in request:
+            raise ValueError("No source given")
+        strict_js_features = options.pop("strict_js_features", False)
+        renderers = worker_renderers(tuple(sorted(options.items())))
+        drawing = render_source(
+            parse(request["source"]), [], strict_js_features, renderers
+        )
+        if drawing is None:
+            raise ValueError("no signal, assign or reg found")
+        response["svg"] = drawing.tostring()
+    except Exception as e:
+        response["error"] = "".join(traceback.format_exception_only(type(e), e))
+        response["error"] = response["error"].strip()
+    return response
+
+
+class Server(object):
+    """Render requests across `jobs` workers
+
+    With one job the requests are rendered in a thread of the server
+    process, otherwise in worker processes (0 starts one per CPU). The
+    `defaults` are the render options of requests that do not set them.
+    """
+
+    def __init__(self, jobs=1, **defaults):
+        self.defaults = defaults
+        if jobs == 1:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            self.executor = ProcessPoolExecutor(max_workers=jobs or os.cpu_count())
+
+    def handle(self, lines, write):
+        """Render the requests in `lines`, calling `write` with each response
+
+        Responses are written as soon as they are rendered, possibly out of
+        order. Returns after all requests are answered.
+        """
+        lock = threading.Lock()
+        pending = set()
+
+        def respond(response):
+            line = json.dumps(response) + "\n"
+            with lock:
+                write(line)
+
+        def done(future):
+            with lock:
+                pending.discard(future)
+            try:
+                response = future.result()
+            except Exception as e:
+                # The request could not be passed to the worker
+                response = {"id": future.id, "error": str(e)}
+            respond(response)
+
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("A request must be an object")
+            except ValueError as e:
+                respond({"id": None, "error": "Invalid request: {}".format(e)})
+                continue
+            future = self.executor.submit(render_request, request, self.defaults)
+            future.id = request.get("id")
+            with lock:
+                pending.add(future)
+            future.add_done_callback(done)
+        with lock:
+            remaining = list(pending)
+        wait(remaining)
+
+    def serve_stdio(self, stdin=sys.stdin, stdout=sys.stdout):
+        """Answer the requests read from `stdin` until it is closed"""
+
+        def write(line):
+            stdout.write(line)
+            stdout.flush()
+
+        self.handle(stdin, write)
+
+    def listen(self, path):
+        """A socket server answering the connections to the socket at `path`
+
+        A stale socket at `path` is replaced.
+        """
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                server.handle(self.rfile, lambda line: self.wfile.write(line.encode()))
+
+        if os.path.exists(path) and stat.S_ISSOCK(os.stat(path).st_mode):
+            os.remove(path)
+        listener = socketserver.ThreadingUnixStreamServer(path, Handler)
+        listener.daemon_threads = True
+        return listener
+
+    def serve_socket(self, path):
+        """Answer the requests to the socket at `path` until interrupted"""
+        with self.listen(path) as listener:
+            try:
+                listener.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os.remove(path)
+
+    def close(self):
+        self.executor.shutdown()
+
+
+def main(args=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="wavedrompy serve",
+        description="Render newline delimited JSON requests from stdin or a socket",
+    )
+    parser.add_argument(
+        "--socket",
+        help="<path of a Unix domain socket to listen on instead of stdin>",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        help="<number of worker processes, 0 for one per CPU>",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "--backend",
+        help="<default SVG backend, text is faster for large diagrams>",
+        choices=["svgwrite", "text"],
+        default="svgwrite",
+    )
+    parser.add_argument(
+        "--no-validate",
+        help="production mode, turn off svgwrite's validation by default",
+        dest="validate",
+        action="store_false",
+    )
+    parser.add_argument(
+        "--merge-bricks",
+        help="draw runs of steady wave bricks as one pattern filled rect by default",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--prune-defs",
+        help="only add the skin definitions referenced by the diagram by default",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--target-width",
+        help="<narrow waveforms to this many pixels by default>",
+        type=int,
+    )
+    args = parser.parse_args(args)
+
+    server = Server(
+        args.jobs,
+        backend=args.backend,
+        validate=args.validate,
+        merge_bricks=args.merge_bricks,
+        prune_defs=args.prune_defs,
+        target_width=args.target_width,
+    )
+    try:
+        if args.socket:
+            server.serve_socket(args.socket)
+        else:
+            server.serve_stdio()
+    finally:
+        server.close()
@@ -0,0 +1,8 @@
+# Copyright wavedrompy contributors.
+# SPDX-License-Identifier: MIT
+
+"""The waveform skins, one module per skin
+
+Each module defines the skin as `skin` in JsonML. They are imported on
+first use through :data:`wavedrom.waveskin.WaveSkin`.
+"""
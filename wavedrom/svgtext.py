@@ -0,0 +1,368 @@
+# Copyright wavedrompy contributors.
+# SPDX-License-Identifier: MIT
+
+"""Lightweight SVG elements serialized directly to text
+
+This is a drop-in replacement for the subset of svgwrite used by the
+renderers. Elements only hold their attributes and children, there is no
+validation and no ElementTree is built. Serialization writes the SVG text
+straight into a buffer and produces the same output as svgwrite.
+"""
+
+import io
+
+from six import string_types
+
+from .attrdict import AttrDict
+
+
+def escape_cdata(text):
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def escape_attrib(text):
+    text = escape_cdata(text)
+    if '"' in text:
+        text = text.replace('"', "&quot;")
+    if "\r" in text:
+        text = text.replace("\r", "&#13;")
+    if "\n" in text:
+        text = text.replace("\n", "&#10;")
+    if "\t" in text:
+        text = text.replace("\t", "&#09;")
+    return text
+
+
+def iterflatlist(values):
+    for value in values:
+        if hasattr(value, "__iter__") and not isinstance(value, string_types):
+            for item in iterflatlist(value):
+                yield item
+        else:
+            yield value
+
+
+def strlist(values, separator=","):
+    if isinstance(values, string_types):
+        return values
+    return separator.join([str(v) for v in iterflatlist(values) if v is not None])
+
+
+class Element(object):
+    __slots__ = ("attribs", "elements", "text", "tail")
+    elementname = None
+
+    def __init__(self, **extra):
+        self.attribs = {}
+        self.elements = []
+        self.text = None
+        self.tail = None
+        self.update(extra)
+
+    def update(self, attribs):
+        for key, value in attribs.items():
+            self.attribs[key.rstrip("_").replace("_", "-")] = value
+
+    def __getitem__(self, key):
+        return self.attribs[key]
+
+    def __setitem__(self, key, value):
+        self.attribs[key] = value
+
+    def add(self, element):
+        self.elements.append(element)
+        return element
+
+    def translate(self, tx, ty=None):
+        self._add_transformation("translate({})".format(strlist([tx, ty])))
+
+    def rotate(self, angle, center=None):
+        self._add_transformation("rotate({})".format(strlist([angle, center])))
+
+    def scale(self, sx, sy=None):
+        self._add_transformation("scale({})".format(strlist([sx, sy])))
+
+    def _add_transformation(self, transform):
+        old = self.attribs.get("transform", "")
+        self.attribs["transform"] = "{} {}".format(old, transform).strip()
+
+    def viewbox(self, minx=0, miny=0, width=0, height=0):
+        self.attribs["viewBox"] = strlist([minx, miny, width, height])
+
+    def write_xml(self, write):
+        """Write the serialized element by calling `write` with text parts
+
+        The tree is walked with an explicit stack, so deeply nested
+        drawings (like large assign trees) do not hit the recursion limit.
+        """
+        # Holds the elements still to write and the text following them
+        stack = [self]
+        while stack:
+            element = stack.pop()
+            if isinstance(element, string_types):
+                write(element)
+                continue
+            if element.elementname is None:
+                element.write_xml(write)
+                continue
+            write("<" + element.elementname)
+            for key, value in sorted(element.attribs.items()):
+                if value is not None:
+                    value = str(value)
+                    if value:
+                        write(' {}="{}"'.format(key, escape_attrib(value)))
+            if element.tail:
+                stack.append(escape_cdata(element.tail))
+            if element.text or element.elements:
+                write(">")
+                if element.text:
+                    write(escape_cdata(element.text))
+                stack.append("</{}>".format(element.elementname))
+                stack.extend(reversed(element.elements))
+            else:
+                write(" />")
+
+    def tostring(self):
+        buffer = []
+        self.write_xml(buffer.append)
+        return "".join(buffer)
+
+    def _repr_svg_(self):
+        return self.tostring()
+
+
+class Group(Element):
+    __slots__ = ()
+    elementname = "g"
+
+
+class Defs(Element):
+    __slots__ = ()
+    elementname = "defs"
+
+
+class Marker(Element):
+    __slots__ = ()
+    elementname = "marker"
+
+    def __init__(self, insert=None, size=None, orient=None, **extra):
+        super(Marker, self).__init__(**extra)
+        if insert is not None:
+            self.attribs["refX"] = insert[0]
+            self.attribs["refY"] = insert[1]
+        if size is not None:
+            self.attribs["markerWidth"] = size[0]
+            self.attribs["markerHeight"] = size[1]
+        if orient is not None:
+            self.attribs["orient"] = orient
+
+
+class Use(Element):
+    __slots__ = ()
+    elementname = "use"
+
+    def __init__(self, href, insert=None, size=None, **extra):
+        super(Use, self).__init__(**extra)
+        self.attribs["xlink:href"] = href
+        if insert is not None:
+            self.attribs["x"] = insert[0]
+            self.attribs["y"] = insert[1]
+        if size is not None:
+            self.attribs["width"] = size[0]
+            self.attribs["height"] = size[1]
+
+
+class Pattern(Element):
+    __slots__ = ()
+    elementname = "pattern"
+
+    def __init__(self, insert=None, size=None, **extra):
+        super(Pattern, self).__init__(**extra)
+        if insert is not None:
+            self.attribs["x"], self.attribs["y"] = insert
+        if size is not None:
+            self.attribs["width"], self.attribs["height"] = size
+
+
+class CDATA(Element):
+    __slots__ = ()
+
+    def write_xml(self, write):
+        write("<![CDATA[{}]]>".format(self.text))
+
+
+class Style(Element):
+    __slots__ = ()
+    elementname = "style"
+
+    def __init__(self, content="", **extra):
+        super(Style, self).__init__(**extra)
+        self.attribs["type"] = "text/css"
+        if content:
+            cdata = CDATA()
+            cdata.text = content
+            self.elements.append(cdata)
+
+
+class Rect(Element):
+    __slots__ = ()
+    elementname = "rect"
+
+    def __init__(self, insert=(0, 0), size=(1, 1), rx=None, ry=None, **extra):
+        super(Rect, self).__init__(**extra)
+        self.attribs["x"], self.attribs["y"] = insert
+        self.attribs["width"], self.attribs["height"] = size
+        if rx is not None:
+            self.attribs["rx"] = rx
+        if ry is not None:
+            self.attribs["ry"] = ry
+
+
+class Line(Element):
+    __slots__ = ()
+    elementname = "line"
+
+    def __init__(self, start=(0, 0), end=(0, 0), **extra):
+        super(Line, self).__init__(**extra)
+        self.attribs["x1"], self.attribs["y1"] = start
+        self.attribs["x2"], self.attribs["y2"] = end
+
+
+class Path(Element):
+    __slots__ = ()
+    elementname = "path"
+
+    def __init__(self, d=None, **extra):
+        super(Path, self).__init__(**extra)
+        self.attribs["d"] = strlist([d], " ")
+
+
+class TSpan(Element):
+    __slots__ = ()
+    elementname = "tspan"
+
+    def __init__(
+        self, text, insert=None, x=None, y=None, dx=None, dy=None, rotate=None, **extra
+    ):
+        super(TSpan, self).__init__(**extra)
+        self.text = str(text)
+        if insert is not None:
+            x = [insert[0]]
+            y = [insert[1]]
+        for key, value in (("x", x), ("y", y), ("dx", dx), ("dy", dy)):
+            if value is not None:
+                self.attribs[key] = strlist(list(iterflatlist(value)), " ")
+        if rotate is not None:
+            self.attribs["rotate"] = strlist(list(iterflatlist(rotate)), " ")
+
+
+class Text(TSpan):
+    __slots__ = ()
+    elementname = "text"
+
+
+class Title(Element):
+    __slots__ = ()
+    elementname = "title"
+
+    def __init__(self, text):
+        super(Title, self).__init__()
+        self.text = str(text)
+
+
+class JsonMLElement(Element):
+    """Element generated from jsonml, see :class:`jsonml.JsonMLElement`"""
+
+    __slots__ = ("elementname",)
+
+    def __init__(self, source, **extra):
+        super(JsonMLElement, self).__init__()
+        if not isinstance(source, (list, tuple)):
+            raise ValueError("JsonML must be a list")
+        if len(source) == 0:
+            raise ValueError("JsonML cannot be an empty list")
+        if not isinstance(source[0], string_types):
+            raise ValueError("JsonML tagname must be string")
+        self.elementname = source[0]
+        children = source[1:]
+        if children and isinstance(children[0], dict):
+            self.attribs.update(children[0])
+            children = children[1:]
+        self.attribs.update(extra)
+        last = None
+        for c in children:
+            if isinstance(c, string_types):
+                if last is None:
+                    self.text = (self.text or "") + c
+                else:
+                    last.tail = (last.tail or "") + c
+            else:
+                last = JsonMLElement(c)
+                self.elements.append(last)
+
+
+class Drawing(Element):
+    __slots__ = ("defs", "filename")
+    elementname = "svg"
+
+    def __init__(self, filename="noname.svg", size=("100%", "100%"), **extra):
+        super(Drawing, self).__init__(**extra)
+        self.filename = filename
+        if size is not None:
+            self.attribs["width"], self.attribs["height"] = size
+        self.defs = self.add(Defs())
+
+    def write_xml(self, write):
+        self.attribs["xmlns"] = "http://www.w3.org/2000/svg"
+        self.attribs["xmlns:xlink"] = "http://www.w3.org/1999/xlink"
+        self.attribs["xmlns:ev"] = "http://www.w3.org/2001/xml-events"
+        self.attribs["baseProfile"] = "full"
+        self.attribs["version"] = "1.1"
+        super(Drawing, self).write_xml(write)
+
+    def write(self, fileobj, pretty=False, indent=2):
+        fileobj.write('<?xml version="1.0" encoding="utf-8" ?>\n')
+        if pretty:
+            from svgwrite.utils import pretty_xml
+
+            fileobj.write(pretty_xml(self.tostring(), indent=indent))
+        else:
+            self.write_xml(fileobj.write)
+
+    def save(self, pretty=False, indent=2):
+        with io.open(self.filename, mode="w", encoding="utf-8") as fileobj:
+            self.write(fileobj, pretty=pretty, indent=indent)
+
+    def saveas(self, filename, pretty=False, indent=2):
+        self.filename = filename
+        self.save(pretty=pretty, indent=indent)
+
+
+container = AttrDict(
+    {
+        "defs": Defs,
+        "g": Group,
+        "marker": Marker,
+        "use": Use,
+        "svg": Drawing,
+        "style": Style,
+        "pattern": Pattern,
+    }
+)
+element = AttrDict(
+    {
+        "rect": Rect,
+        "path": Path,
+        "text": Text,
+        "tspan": TSpan,
+        "title": Title,
+        "line": Line,
+        "jsonml": JsonMLElement,
+    }
+)
@@ -0,0 +1,133 @@
+# Copyright wavedrompy contributors.
+# SPDX-License-Identifier: MIT
+
+"""Render long waveforms as tiles of a fixed number of cycles
+
+Each tile is the waveform cut to its cycles with config.hbounds, so it
+repeats the lane names and groups and numbers the ticks from its first
+cycle. The tiles are rendered across worker processes and written as one
+SVG file each, with an HTML document showing them one per page.
+"""
+
+import html
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .cache import CachedDrawing
+from .renderers import Renderers
+
+# The source and renderer of the tiles rendered by a worker
+worker_state = {}
+
+
+def init_worker(source, strict_js_features, options):
+    worker_state["source"] = source
+    worker_state["strict_js_features"] = strict_js_features
+    worker_state["waveform"] = Renderers(**options).waveform
+
+
+def render_tile(hbounds):
+    """Render the tile with `hbounds` of the source of the worker to text"""
+    source = worker_state["source"]
+    config = dict(source.get("config") or {}, hbounds=hbounds)
+    drawing = worker_state["waveform"].render_waveform(
+        0, dict(source, config=config), [], worker_state["strict_js_features"]
+    )
+    return drawing.tostring()
+
+
+def render_tiles(source, cycles, jobs=1, strict_js_features=False, **options):
+    """Render the waveform `source` as tiles of `cycles` cycles
+
+    Returns the SVG text of each tile in order. The tiles are rendered
+    across `jobs` worker processes, 0 starts one per CPU. The `options`
+    are passed on to the renderers (e.g. the backend).
+    """
+    return render_layout(source, cycles, jobs, strict_js_features, **options)[1]
+
+
+def render_layout(source, cycles, jobs=1, strict_js_features=False, **options):
+    """Like :func:`render_tiles`, also returns the cycles of the waveform
+
+    Returns the cycle count of `source` and the SVG text of its tiles.
+    """
+    if cycles < 1:
+        raise ValueError("A tile needs at least one cycle")
+    count, tiles = Renderers(**options).waveform.tile_layout(source, cycles)
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(tiles))
+    if jobs <= 1:
+        init_worker(source, strict_js_features, options)
+        try:
+            return count, [render_tile(hbounds) for hbounds in tiles]
+        finally:
+            worker_state.clear()
+
+    # The source is passed to each worker once instead of with every tile
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=init_worker,
+        initargs=(source, strict_js_features, options),
+    ) as executor:
+        size = max(1, len(tiles) // (jobs * 4))
+        return count, list(executor.map(render_tile, tiles, chunksize=size))
+
+
+def tile_name(path, index):
+    return "{}-{:04d}.svg".format(os.path.splitext(path)[0], index + 1)
+
+
+def write_index(output, title, names, cycles, count):
+    """Write the HTML document showing the tiles `names` one per page
+
+    The tiles are `cycles` cycles long, the last one ends with the
+    `count` cycles of the waveform.
+    """
+    title = html.escape(title)
+    output.write(
+        "<!DOCTYPE html>\n"
+        '<html>\n<head>\n<meta charset="utf-8">\n'
+        "<title>{}</title>\n"
+        "<style>\n"
+        ".tile {{ break-after: page; page-break-after: always; }}\n"
+        ".tile img {{ max-width: 100%; }}\n"
+        "</style>\n"
+        "</head>\n<body>\n<h1>{}</h1>\n<ol>\n".format(title, title)
+    )
+    labels = [
+        "Cycles {} to {}".format(i * cycles, min((i + 1) * cycles, count) - 1)
+        for i in range(len(names))
+    ]
+    for i, label in enumerate(labels):
+        output.write('<li><a href="#tile-{}">{}</a></li>\n'.format(i + 1, label))
+    output.write("</ol>\n")
+    for i, (name, label) in enumerate(zip(names, labels)):
+        output.write(
+            '<section class="tile" id="tile-{}">\n<h2>{}</h2>\n'
+            '<img src="{}" alt="{}">\n</section>\n'.format(
+                i + 1, label, html.escape(name), label
+            )
+        )
+    output.write("</body>\n</html>\n")
+
+
+def write_tiles(source, path, cycles, jobs=1, strict_js_features=False, **options):
+    """Write the tiles of `cycles` cycles of the waveform `source`
+
+    The tiles are written next to `path` as ``<path>-0001.svg`` and so on
+    and the HTML document showing them is written to `path`. Returns the
+    file names of the tiles.
+    """
+    count, svgs = render_layout(source, cycles, jobs, strict_js_features, **options)
+    names = [tile_name(path, i) for i in range(len(svgs))]
+    for name, svg in zip(names, svgs):
+        # Written with the XML declaration like any other drawing
+        CachedDrawing(svg, name).save()
+    head = source.get("head") or {}
+    title = head.get("text") if isinstance(head, dict) else None
+    if not isinstance(title, str):
+        title = os.path.splitext(os.path.basename(path))[0]
+    with open(path, "w") as f:
+        write_index(f, title, [os.path.basename(name) for name in names], cycles, count)
+    return names
@@ -0,0 +1,611 @@
+# Copyright wavedrompy contributors.
+# SPDX-License-Identifier: MIT
+
+"""Convert value change dumps (VCD) to WaveJSON
+
+The dump is read line by line and only the selected signals are kept,
+so memory use does not depend on the size of the dump. The signals are
+sampled on the edges of a clock (or every `period` time units) and
+written as wave strings, with "." for repeated values and the values of
+buses in "data"::
+
+    with open("sim.vcd") as f:
+        source = vcd.to_wavejson(f, ["top.valid", "top.data"], clock="top.clk")
+    wavedrom.render(source)
+
+Values are sampled just before the edge, like a flip-flop would: changes
+at the time of the edge show up in the next cycle.
+
+Windows of large dumps are read faster through a :class:`TraceIndex`,
+which resumes sampling from a checkpoint close to the window::
+
+    index = vcd.TraceIndex.load("sim.vcd", "sim.idx", clock="top.clk")
+    source = index.window(["top.valid"], start=2000000, end=2000200)
+"""
+
+import json
+import mmap
+import os
+from bisect import bisect_right
+from collections import namedtuple
+from contextlib import contextmanager
+from itertools import chain
+
+Var = namedtuple("Var", ["name", "id", "width", "type"])
+
+# Commands of the dump body whose content is skipped
+skipped_commands = {"$comment"}
+
+
+class VCDReader(object):
+    """Streaming reader of a value change dump in `fileobj`
+
+    The header with the variable definitions is read on construction.
+    The value changes are read by iterating :meth:`changes`.
+    """
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.vars = []
+        self.timescale = None
+        # The body following $enddefinitions on the last line of the header
+        self.rest = ""
+        self.read_header()
+
+    def commands(self):
+        """The commands of the header as (keyword, [tokens])"""
+        command = None
+        tokens = []
+        for line in self.fileobj:
+            words = line.split()
+            for i, token in enumerate(words):
+                if command is None:
+                    command = token
+                    tokens = []
+                elif token == "$end":
+                    yield command, tokens
+                    if command == "$enddefinitions":
+                        self.rest = " ".join(words[i + 1 :])
+                        return
+                    command = None
+                else:
+                    tokens.append(token)
+
+    def read_header(self):
+        scopes = []
+        for command, tokens in self.commands():
+            if command == "$scope":
+                scopes.append(tokens[1])
+            elif command == "$upscope":
+                scopes.pop()
+            elif command == "$var":
+                type, width, id, reference = tokens[:4]
+                # A bit select like [7:0] may follow the reference
+                name = ".".join(scopes + [reference + "".join(tokens[4:])])
+                self.vars.append(Var(name, id, int(width), type))
+            elif command == "$timescale":
+                self.timescale = "".join(tokens)
+
+    def find(self, name):
+        """The variable called `name`, or with a unique suffix `name`
+
+        The bit select of vectors (like "[7:0]") can be left out.
+        """
+
+        def names(var):
+            yield var.name
+            if var.name.endswith("]"):
+                yield var.name[: var.name.rindex("[")]
+
+        for var in self.vars:
+            if name in names(var):
+                return var
+        suffix = "." + name
+        found = [v for v in self.vars if any(n.endswith(suffix) for n in names(v))]
+        if len(found) == 1:
+            return found[0]
+        if found:
+            raise ValueError(
+                "Signal {} is ambiguous: {}".format(
+                    name, ", ".join(v.name for v in found)
+                )
+            )
+        raise ValueError("Signal {} not found in the dump".format(name))
+
+    def body(self):
+        """The lines of the dump after the header"""
+        return chain([self.rest], self.fileobj)
+
+    def changes(self, ids=None, marks=False):
+        """The value changes as (time, id, value), see :func:`value_changes`"""
+        return value_changes(self.body(), ids, marks)
+
+
+def value_changes(lines, ids=None, marks=False):
+    """The value changes in `lines` of a dump body as (time, id, value)
+
+    With `ids` given, only the changes of these variables are returned.
+    Scalar values are "0", "1", "x" or "z", vectors the bits without the
+    leading "b", reals the number without the "r". The time is None for
+    the initial values before the first timestamp. With `marks`, the
+    timestamps starting a line are returned too, as (time, None, None).
+    """
+    time = None
+    skip = False
+    vector = None
+    for line in lines:
+        for token in line.split():
+            if skip:
+                skip = token != "$end"
+                continue
+            if vector is not None:
+                if ids is None or token in ids:
+                    yield time, token, vector.lower()
+                vector = None
+                continue
+            c = token[0]
+            if c == "#":
+                time = int(token[1:])
+                if marks and line.split(None, 1)[0] == token:
+                    yield time, None, None
+            elif c in "01xXzZ":
+                id = token[1:]
+                if ids is None or id in ids:
+                    yield time, id, c.lower()
+            elif c in "bBrR":
+                vector = token[1:]
+            elif c == "$":
+                skip = token in skipped_commands
+            # Other tokens, like the $end of $dumpvars, are ignored
+
+
+def vector_value(bits, width):
+    """The `bits` of a vector extended to `width` as in the dump"""
+    if len(bits) < width:
+        fill = bits[0] if bits[0] in "xz" else "0"
+        bits = fill * (width - len(bits)) + bits
+    return bits
+
+
+radixes = {
+    "hex": lambda v, width: "{:0{}x}".format(v, (width + 3) // 4),
+    "dec": lambda v, width: str(v),
+    "bin": lambda v, width: "{:0{}b}".format(v, width),
+}
+
+
+class Lane(object):
+    """The wave of a sampled signal"""
+
+    def __init__(self, var, radix="hex"):
+        self.var = var
+        self.format = radixes[radix]
+        self.wave = []
+        self.data = []
+        # Not a value, the first sample is always drawn
+        self.last = ()
+
+    def add(self, value):
+        if value == self.last:
+            self.wave.append(".")
+            return
+        self.last = value
+        if value is None:
+            self.wave.append("x")
+        elif self.var.type == "real":
+            self.wave.append("=")
+            self.data.append(value)
+        elif self.var.width == 1 and len(value) == 1:
+            self.wave.append(value)
+        else:
+            bits = vector_value(value, self.var.width)
+            if "x" in bits:
+                self.wave.append("x")
+            elif bits == "z" * len(bits):
+                self.wave.append("z")
+            elif "z" in bits:
+                self.wave.append("x")
+            else:
+                self.wave.append("=")
+                self.data.append(self.format(int(bits, 2), self.var.width))
+
+    def lane(self):
+        lane = {"name": self.var.name, "wave": "".join(self.wave)}
+        if self.data:
+            lane["data"] = self.data
+        return lane
+
+
+class Sampler(object):
+    """Turns value changes into the samples of cycles
+
+    The samples are taken just before the `edge` of the variable with the
+    id `clock`, or every `period` time units. The state can be copied to
+    resume sampling in the middle of a dump.
+    """
+
+    def __init__(self, clock=None, edge="posedge", period=None):
+        if (clock is None) == (period is None):
+            raise ValueError("Sample either on a clock or every period")
+        self.clock = clock
+        self.level = {"posedge": "1", "negedge": "0"}[edge]
+        self.period = period
+        self.values = {}  # the values up to the current time
+        self.staged = {}  # the changes at the current time
+        self.cycle = 0
+        self.time = None
+        self.edge_seen = False
+        # Sample k shows the values from k * period up to the next sample
+        self.next_sample = period
+
+    def advance(self, time):
+        """Move on to `time`, yields the cycles sampled on the way
+
+        The sampled values are in :attr:`values` when a cycle is yielded.
+        """
+        if self.clock is not None:
+            if self.edge_seen:
+                yield self.cycle
+                self.cycle += 1
+            self.values.update(self.staged)
+        else:
+            self.values.update(self.staged)
+            while time is not None and self.next_sample <= time:
+                yield self.cycle
+                self.cycle += 1
+                self.next_sample += self.period
+        self.staged.clear()
+        self.edge_seen = False
+        self.time = time
+
+    def change(self, id, value):
+        self.staged[id] = value
+        if id == self.clock:
+            # The initial value of the clock is not an edge
+            previous = self.values.get(id, value)
+            self.edge_seen = previous != value and value == self.level
+
+    def finish(self):
+        """Yields the cycle of an edge pending at the end of the dump"""
+        if self.edge_seen:
+            yield self.cycle
+            self.cycle += 1
+            self.edge_seen = False
+
+    def samples(self, changes):
+        """Yields the cycles sampled from the value `changes`
+
+        Timestamps given as (time, None, None) only move time on.
+        """
+        for time, id, value in changes:
+            if time != self.time:
+                yield from self.advance(time)
+            if id is not None:
+                self.change(id, value)
+        yield from self.finish()
+
+
+def make_lanes(reader, signals, clock, radix):
+    """The lanes of the `signals` of a reader, all but `clock` if None"""
+    if signals is None:
+        clock_var = reader.find(clock) if clock is not None else None
+        signals = [v.name for v in reader.vars if v != clock_var]
+    return [Lane(reader.find(name), radix) for name in signals]
+
+
+def draw(sampler, changes, lanes, edge="posedge", start=0, end=None):
+    """Add the cycles sampled from `changes` to the `lanes`, returns the WaveJSON
+
+    Only the cycles from `start` up to `end` (not included) are drawn,
+    reading the changes stops at `end`.
+    """
+    # The clock itself is drawn as a clock, not sampled
+    clock_lanes = [l for l in lanes if l.var.id == sampler.clock]
+    sampled = [l for l in lanes if l not in clock_lanes]
+    for cycle in sampler.samples(changes):
+        if end is not None and cycle >= end:
+            break
+        if cycle >= start:
+            for lane in sampled:
+                lane.add(sampler.values.get(lane.var.id))
+            for lane in clock_lanes:
+                lane.wave.append("." if lane.wave else "pn"[edge == "negedge"])
+        if end is not None and cycle + 1 >= end:
+            break
+    return {"signal": [lane.lane() for lane in lanes]}
+
+
+def sample(
+    reader,
+    signals=None,
+    clock=None,
+    edge="posedge",
+    period=None,
+    start=0,
+    end=None,
+    radix="hex",
+):
+    """Sample the `signals` of a :class:`VCDReader`, returns the WaveJSON
+
+    The signals are sampled on each `edge` ("posedge" or "negedge") of
+    `clock`, or without a clock every `period` time units. Only the cycles
+    from `start` up to `end` (not included) are returned, reading stops at
+    `end`. Bus values are written to "data" in the `radix` "hex", "dec"
+    or "bin".
+    """
+    clock_id = reader.find(clock).id if clock is not None else None
+    sampler = Sampler(clock_id, edge, period)
+    lanes = make_lanes(reader, signals, clock, radix)
+    ids = set(lane.var.id for lane in lanes)
+    if clock_id is not None:
+        ids.add(clock_id)
+    # Time moves on at every timestamp, also while the signals do not change
+    changes = reader.changes(ids, marks=period is not None)
+    return draw(sampler, changes, lanes, edge, start, end)
+
+
+def to_wavejson(fileobj, signals=None, clock=None, **options):
+    """Read a dump from `fileobj` and sample it, see :func:`sample`"""
+    return sample(VCDReader(fileobj), signals, clock, **options)
+
+
+class MappedLines(object):
+    """The lines of a memory mapped dump from `offset`, read like a file
+
+    :attr:`offset` is the offset of the line read last.
+    """
+
+    def __init__(self, buffer, offset=0):
+        self.buffer = buffer
+        self.position = offset
+        self.offset = offset
+
+    def __iter__(self):
+        buffer = self.buffer
+        size = len(buffer)
+        while self.position < size:
+            end = buffer.find(b"\n", self.position) + 1 or size
+            self.offset = self.position
+            self.position = end
+            yield buffer[self.offset : end].decode("latin-1")
+
+
+class TraceIndex(object):
+    """Random access to the cycles of the dump at `path`
+
+    The dump is sampled once on a clock or every period (see
+    :func:`sample`), keeping a checkpoint every `interval` cycles with the
+    offset of the timestamp in the dump and the values of all variables.
+    :meth:`window` starts reading at the last checkpoint before the
+    window, so it takes time proportional to the window and not to the
+    dump. The dump is read through a memory map.
+
+    Indexes are saved with :meth:`save` and loaded with :meth:`load`.
+    Closing the index, or leaving it as a context manager, releases the
+    memory map.
+    """
+
+    def __init__(
+        self,
+        path,
+        clock=None,
+        edge="posedge",
+        period=None,
+        interval=1024,
+        checkpoints=None,
+        cycles=None,
+    ):
+        self.path = path
+        self.options = {
+            "clock": clock,
+            "edge": edge,
+            "period": period,
+            "interval": interval,
+        }
+        with open(path, "rb") as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with self.closed_on_error():
+            self.reader = VCDReader(MappedLines(self.buffer))
+            self.clock = self.reader.find(clock).id if clock is not None else None
+            # The states to resume sampling from, per field and checkpoint
+            self.checkpoints = checkpoints
+            self.cycles = cycles
+            if checkpoints is None:
+                self.build()
+
+    def sampler(self):
+        return Sampler(self.clock, self.options["edge"], self.options["period"])
+
+    def build(self):
+        sampler = self.sampler()
+        lines = self.reader.fileobj
+        ids = sorted(set(v.id for v in self.reader.vars))
+        self.checkpoints = {
+            "offset": [],
+            "time": [],
+            "cycle": [],
+            "next_sample": [],
+            "values": {id: [] for id in ids},
+        }
+
+        def checkpoint(offset):
+            for key, value in [
+                ("offset", offset),
+                ("time", sampler.time),
+                ("cycle", sampler.cycle),
+                ("next_sample", sampler.next_sample),
+            ]:
+                self.checkpoints[key].append(value)
+            for id in ids:
+                self.checkpoints["values"][id].append(sampler.values.get(id))
+
+        # Sampling starts right after the header
+        checkpoint(lines.position)
+        next_checkpoint = self.options["interval"]
+        for time, id, value in value_changes(self.reader.body(), marks=True):
+            if time != sampler.time:
+                for cycle in sampler.advance(time):
+                    pass
+            if id is not None:
+                sampler.change(id, value)
+            elif sampler.cycle >= next_checkpoint and not sampler.staged:
+                # A new timestamp starting a line, nothing is pending here
+                checkpoint(lines.offset)
+                next_checkpoint = sampler.cycle + self.options["interval"]
+        for cycle in sampler.finish():
+            pass
+        self.cycles = sampler.cycle
+
+    def window(self, signals=None, start=0, end=None, radix="hex"):
+        """The WaveJSON of the `signals` from cycle `start` up to `end`
+
+        The arguments are those of :func:`sample`.
+        """
+        lanes = make_lanes(self.reader, signals, self.options["clock"], radix)
+        ids = set(lane.var.id for lane in lanes)
+        if self.clock is not None:
+            ids.add(self.clock)
+        checkpoints = self.checkpoints
+        i = bisect_right(checkpoints["cycle"], start) - 1
+        sampler = self.sampler()
+        sampler.time = checkpoints["time"][i]
+        sampler.cycle = checkpoints["cycle"][i]
+        sampler.next_sample = checkpoints["next_sample"][i]
+        for id in ids:
+            value = checkpoints["values"][id][i]
+            if value is not None:
+                sampler.values[id] = value
+        lines = MappedLines(self.buffer, checkpoints["offset"][i])
+        if i == 0:
+            lines = chain([self.reader.rest], lines)
+        changes = value_changes(lines, ids, marks=self.clock is None)
+        return draw(sampler, changes, lanes, self.options["edge"], start, end)
+
+    def stat(self):
+        # Identifies the version of the dump the index was built from
+        st = os.stat(self.path)
+        return [st.st_size, st.st_mtime_ns]
+
+    def save(self, index_path):
+        """Write the index to the JSON file `index_path`"""
+        index = dict(self.options)
+        index.update(
+            {
+                "stat": self.stat(),
+                "cycles": self.cycles,
+                "checkpoints": self.checkpoints,
+            }
+        )
+        with open(index_path, "w") as f:
+            json.dump(index, f)
+
+    @classmethod
+    def load(cls, path, index_path, **options):
+        """The index of the dump at `path` saved at `index_path`
+
+        The index is built and saved if it is missing, or if it was built
+        from another version of the dump or with other `options`.
+        """
+        index = cls(path, checkpoints={}, cycles=0, **options)
+        try:
+            with open(index_path) as f:
+                saved = json.load(f)
+            current = saved["stat"] == index.stat() and all(
+                saved[key] == value for key, value in index.options.items()
+            )
+        except (OSError, ValueError, KeyError):
+            current = False
+        if current:
+            index.checkpoints = saved["checkpoints"]
+            index.cycles = saved["cycles"]
+        else:
+            with index.closed_on_error():
+                index.build()
+                index.save(index_path)
+        return index
+
+    def close(self):
+        self.buffer.close()
+
+    @contextmanager
+    def closed_on_error(self):
+        try:
+            yield
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(args=None):
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(
+        prog="wavedrompy vcd",
+        description="Convert a value change dump to WaveJSON or SVG",
+    )
+    parser.add_argument("input", help="<VCD file name, - for stdin>")
+    parser.add_argument(
+        "--signal",
+        "-g",
+        help="<signal to sample, by full or unique partial name, all if none given>",
+        action="append",
+        dest="signals",
+    )
+    parser.add_argument("--clock", "-c", help="<clock to sample the signals on>")
+    parser.add_argument(
+        "--negedge", help="sample on the falling clock edge", action="store_true"
+    )
+    parser.add_argument(
+        "--period", "-p", help="<sample every period time units>", type=int
+    )
+    parser.add_argument("--start", help="<first cycle to convert>", type=int, default=0)
+    parser.add_argument("--end", help="<cycle to stop at>", type=int)
+    parser.add_argument(
+        "--radix", help="<radix of bus values>", choices=sorted(radixes), default="hex"
+    )
+    parser.add_argument(
+        "--svg", "-s", help="<render to this SVG file instead of writing WaveJSON>"
+    )
+    parser.add_argument(
+        "--index",
+        "-x",
+        help="<index file for random access to the cycles, built if missing or outdated>",
+    )
+    args = parser.parse_args(args)
+    if args.index and args.input == "-":
+        parser.error("An index needs a VCD file, not stdin")
+
+    edge = "negedge" if args.negedge else "posedge"
+    window = dict(start=args.start, end=args.end, radix=args.radix)
+    try:
+        if args.index:
+            with TraceIndex.load(
+                args.input, args.index, clock=args.clock, edge=edge, period=args.period
+            ) as index:
+                source = index.window(args.signals, **window)
+        else:
+            f = sys.stdin if args.input == "-" else open(args.input, "r")
+            with f:
+                source = to_wavejson(
+                    f, args.signals, args.clock, edge=edge, period=args.period, **window
+                )
+        if args.svg:
+            from . import render
+
+            render(source, backend="text").saveas(args.svg)
+        else:
+            json.dump(source, sys.stdout)
+            sys.stdout.write("\n")
+    except ValueError as e:
+        parser.error(str(e))
+    except OSError as e:
+        # Unreadable dumps and unwritable index or output files
+        sys.stderr.write("{}: error: {}\n".format(parser.prog, e))
+        sys.exit(1)
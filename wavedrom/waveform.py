@@ -8,21 +8,276 @@
 import sys
 import math
 import re
-from itertools import chain
-import svgwrite
+import threading
+from bisect import bisect_right
+from itertools import chain, groupby
 from .attrdict import AttrDict
-from collections import deque
+from collections import deque, OrderedDict
 
 from six import string_types
 
-from wavedrom.tspan import JsonMLElement
-from . import waveskin, css
-from .base import SVGBase
+from . import waveskin
+from .base import SVGBase, start_tag
+from .metrics import default_font_metrics, font_metrics
+
+# Bricks that stay at the same level for the whole cycle
+steady_bricks = frozenset(
+    ["000", "111", "xxx", "ddd", "uuu", "zzz"]
+    + ["vvv-{}".format(i) for i in range(2, 10)]
+)
+
+sharpedge_clk = {"p": "pclk", "n": "nclk", "P": "Pclk", "N": "Nclk"}
+sharpedge_sig = {"h": "pclk", "l": "nclk", "H": "Pclk", "L": "Nclk"}
+sharpedge = dict(sharpedge_clk, **sharpedge_sig)
+
+# level: logical levels of symbols at wave
+level = {
+    "=": "v",
+    "2": "v",
+    "3": "v",
+    "4": "v",
+    "5": "v",
+    "6": "v",
+    "7": "v",
+    "8": "v",
+    "9": "v",
+    "h": "1",
+    "H": "1",
+    "l": "0",
+    "L": "0",
+}
+# translevel: Those are the levels at the end of a cycle (special for clocks)
+translevel = dict(level, p="0", P="0", n="1", N="1")
+# data: Modifiers of wavebricks that add data
+data = {
+    "=": "-2",
+    "2": "-2",
+    "3": "-3",
+    "4": "-4",
+    "5": "-5",
+    "6": "-6",
+    "7": "-7",
+    "8": "-8",
+    "9": "-9",
+}
+# clkinvert: The inverse brick to clock symbols
+clkinvert = {"p": "nclk", "n": "pclk", "P": "nclk", "N": "pclk"}
+# xclude: Those are actually identical levels, no transition
+xclude = {
+    "hp": "111",
+    "Hp": "111",
+    "ln": "000",
+    "Ln": "000",
+    "nh": "111",
+    "Nh": "111",
+    "pl": "000",
+    "Pl": "000",
+}
+# stretcher: The brick a brick continues with when stretched
+stretcher = {
+    "Pclk": "111",
+    "Nclk": "000",
+    "pclk": "111",
+    "nclk": "000",
+    "0": "000",
+    "1": "111",
+    "x": "xxx",
+    "d": "ddd",
+    "u": "uuu",
+    "z": "zzz",
+    "2": "vvv-2",
+    "3": "vvv-3",
+    "4": "vvv-4",
+    "5": "vvv-5",
+    "6": "vvv-6",
+    "7": "vvv-7",
+    "8": "vvv-8",
+    "9": "vvv-9",
+}
+
+
+def steady_brick(brick):
+    """The brick following `brick` when a cycle is stretched"""
+    if brick in stretcher:
+        return stretcher[brick]
+    elif brick[2] in stretcher:
+        return stretcher[brick[2]]
+    else:
+        return stretcher[brick[-1]]
+
+
+def gen_cycle_bricks(prev, this):
+    """Bricks of a cycle of `this` following `prev`
+
+    Returns a tuple (head, unit, clock). A cycle repeated `repeat` times is
+    drawn as head + unit * repeat, `clock` tells if `this` is a clock.
+    """
+    if this in sharpedge:
+        if prev is None:
+            if this in sharpedge_clk:
+                first = sharpedge[this]
+            else:
+                first = level.get(this, this) * 3
+        else:
+            first = xclude.get(prev + this, sharpedge[this])
+
+        if this in sharpedge_clk:
+            return [first, clkinvert[this]], [first, clkinvert[this]], True
+        value = level.get(this, this) * 3
+        return [first, value], [value, value], False
+
+    if prev is None:
+        transition = level.get(this, this) * 3 + data.get(this, "")
+    else:
+        transition = (
+            translevel.get(prev, prev)
+            + "m"
+            + level.get(this, this)
+            + data.get(prev, "")
+            + data.get(this, "")
+        )
+    value = level.get(this, this) * 3 + data.get(this, "")
+    return [transition, value], [value, value], False
+
+
+# Bricks of all cycles of the wave symbols, keyed by (prev, this). Other
+# symbols are added when they are first seen.
+symbols = "pnPNhlHL01xzud=23456789"
+brick_table = dict(
+    ((prev, this), gen_cycle_bricks(prev, this))
+    for prev in [None] + list(symbols)
+    for this in symbols
+)
+# Bricks of cycles stretched by hscale and period, keyed by
+# (prev, this, stretch)
+stretched_bricks = {}
+
+
+def cycle_bricks(prev, this):
+    try:
+        return brick_table[prev, this]
+    except KeyError:
+        bricks = brick_table[prev, this] = gen_cycle_bricks(prev, this)
+        return bricks
+
+
+# Runs of repeated cycles in waves
+repeat_chars = re.compile(r"[.|]*")
+
+# Bricks of the value of data, find_lane_markers() labels their runs
+marker_bricks = frozenset("vvv-{}".format(i) for i in range(2, 10))
+
+
+def brick_slice(head, unit, step, start, stop):
+    """Bricks `start` up to `stop` of ``(head + unit * repeat)[::step]``"""
+    bricks = []
+    for j in range(start, stop):
+        i = j * step
+        bricks.append(head[i] if i < len(head) else unit[(i - len(head)) % len(unit)])
+    return bricks
+
+
+class LaneCache(object):
+    """Bounded LRU cache of the bricks of parsed wave lanes
+
+    Clocks, resets and idle buses repeat across lanes and diagrams. The
+    cache holds the bricks as tuples, so callers can't modify the cached
+    entries. It holds at most `max_bricks` bricks in total, when it grows
+    beyond that the least recently used lanes are removed. It can be used
+    from several threads.
+    """
+
+    def __init__(self, max_bricks=2**20):
+        self.max_bricks = max_bricks
+        self.entries = OrderedDict()
+        self.bricks = 0
+        self.hits = 0
+        self.misses = 0
+        # The renderers of all threads share the cache
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def stats(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "lanes": len(self.entries),
+                "bricks": self.bricks,
+            }
+
+    def get(self, key):
+        with self.lock:
+            try:
+                bricks = self.entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return bricks
+
+    def put(self, key, bricks):
+        if len(bricks) > self.max_bricks:
+            return
+        with self.lock:
+            if key in self.entries:
+                self.bricks -= len(self.entries.pop(key))
+            self.entries[key] = bricks
+            self.bricks += len(bricks)
+            while self.bricks > self.max_bricks:
+                self.bricks -= len(self.entries.popitem(last=False)[1])
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bricks = 0
+            self.hits = 0
+            self.misses = 0
+
+
+# Parsed lanes shared by all renderers
+lane_cache = LaneCache()
 
 
 class WaveDrom(SVGBase):
-    def __init__(self):
+    # Cache of parse_wave_lane(), None to turn caching off
+    lane_cache = lane_cache
+
+    def __init__(
+        self,
+        backend="svgwrite",
+        validate=True,
+        merge_bricks=False,
+        prune_defs=False,
+        target_width=None,
+    ):
+        super(WaveDrom, self).__init__(backend, validate)
         self.font_width = 7
+        # Merge runs of steady bricks into one rect filled with a pattern
+        # of the brick, instead of one <use> per brick
+        self.merge_bricks = merge_bricks
+        # Only add the skin definitions referenced by the diagram
+        self.prune_defs = prune_defs
+        # Draw the waves at most this many pixels wide, see fit_width()
+        self.target_width = target_width
+        # Skin <defs> children, built once per skin and shared by all
+        # drawings rendered with this instance
+        self.skin_defs = {}
+        self.brick_patterns = {}
+        self.reset()
+
+    def reset(self):
+        """Reset the per-diagram lane state
+
+        The state in ``self.lane`` is filled while rendering a diagram.
+        It is reset before each diagram so that one instance can render
+        many diagrams without leaking settings (head, foot, hscale, ...)
+        from one diagram into the next.
+        """
         self.lane = AttrDict(
             {
                 "xs": 20,  # tmpgraphlane0.width
@@ -39,6 +294,13 @@ class WaveDrom(SVGBase):
                 "ym": 15,  # tmptextlane0.y - y0
                 "xlabel": 6,  # tmptextlabel.x - xg
                 "xmax": 1,
+                # Bricks shown by config.hbounds
+                "xmin_cfg": 0,
+                "xmax_cfg": sys.maxsize,
+                # Bricks per pixel column once the waves are narrowed to
+                # the target width, 0 when they are drawn at full width
+                "lod": 0,
+                "xbrick": 20,  # width of the brick definitions
                 "scale": 1,
                 "head": {},
                 "foot": {},
@@ -47,27 +309,6 @@ class WaveDrom(SVGBase):
 
     @staticmethod
     def stretch_bricks(wave, stretch):
-        stretcher = {
-            "Pclk": "111",
-            "Nclk": "000",
-            "pclk": "111",
-            "nclk": "000",
-            "0": "000",
-            "1": "111",
-            "x": "xxx",
-            "d": "ddd",
-            "u": "uuu",
-            "z": "zzz",
-            "2": "vvv-2",
-            "3": "vvv-3",
-            "4": "vvv-4",
-            "5": "vvv-5",
-            "6": "vvv-6",
-            "7": "vvv-7",
-            "8": "vvv-8",
-            "9": "vvv-9",
-        }
-
         if stretch == -0.5:
             # This is the only valid non-integer value, it essentially means halfing down. Further subsampling
             # does not work I think..
@@ -75,118 +316,89 @@ class WaveDrom(SVGBase):
         else:
             stretch = int(stretch)
 
-            def getBrick(w):
-                if w in stretcher:
-                    return stretcher[w]
-                elif w[2] in stretcher:
-                    return stretcher[w[2]]
-                else:
-                    return stretcher[w[-1]]
-
             if stretch > 0:
                 return list(
-                    chain.from_iterable(([w] + [getBrick(w)] * stretch for w in wave))
+                    chain.from_iterable(
+                        ([w] + [steady_brick(w)] * stretch for w in wave)
+                    )
                 )
             else:
                 return wave
 
-    def gen_wave_brick(self, prev=None, this=None, stretch=0, repeat=0, subcycle=False):
-        sharpedge_clk = {"p": "pclk", "n": "nclk", "P": "Pclk", "N": "Nclk"}
-        sharpedge_sig = {"h": "pclk", "l": "nclk", "H": "Pclk", "L": "Nclk"}
-        sharpedge = sharpedge_clk.copy()
-        sharpedge.update(sharpedge_sig)
-
-        # level: logical levels of symbols at wave
-        level = {
-            "=": "v",
-            "2": "v",
-            "3": "v",
-            "4": "v",
-            "5": "v",
-            "6": "v",
-            "7": "v",
-            "8": "v",
-            "9": "v",
-            "h": "1",
-            "H": "1",
-            "l": "0",
-            "L": "0",
-        }
-        # translevel: Those are the levels at the end of a cycle (special for clocks)
-        translevel = level.copy()
-        translevel.update({"p": "0", "P": "0", "n": "1", "N": "1"})
-        # data: Modifiers of wavebricks that add data
-        data = {
-            "=": "-2",
-            "2": "-2",
-            "3": "-3",
-            "4": "-4",
-            "5": "-5",
-            "6": "-6",
-            "7": "-7",
-            "8": "-8",
-            "9": "-9",
-        }
-        # clkinvert: The inverse brick to clock symbols
-        clkinvert = {"p": "nclk", "n": "pclk", "P": "nclk", "N": "pclk"}
-        # xclude: Those are actually identical levels, no transition
-        xclude = {
-            "hp": "111",
-            "Hp": "111",
-            "ln": "000",
-            "Ln": "000",
-            "nh": "111",
-            "Nh": "111",
-            "pl": "000",
-            "Pl": "000",
-        }
-
-        if this in sharpedge.keys():
-            if prev is None:
-                if this in sharpedge_clk.keys():
-                    first = sharpedge[this]
-                else:
-                    first = level.get(this, this) * 3
-            else:
-                first = xclude.get(prev + this, sharpedge[this])
-
-            if this in sharpedge_clk.keys():
-                wave = [first, clkinvert[this]] * (1 + repeat)
-            else:
-                wave = [first] + [level.get(this, this) * 3] * (2 * repeat + 1)
-        else:
-            if prev is None:
-                transition = level.get(this, this) * 3 + data.get(this, "")
-            else:
-                transition = (
-                    translevel.get(prev, prev)
-                    + "m"
-                    + level.get(this, this)
-                    + data.get(prev, "")
-                    + data.get(this, "")
-                )
-            value = level.get(this, this) * 3 + data.get(this, "")
-            wave = [transition, value] + [value, value] * repeat
+    def wave_brick_parts(
+        self, prev=None, this=None, stretch=0, repeat=0, subcycle=False
+    ):
+        """The bricks of :meth:`gen_wave_brick` as (head, unit, repeat, length, step)
 
+        The bricks are ``(head + unit * repeat)[0:length:step]``, this
+        describes them without building the list.
+        """
+        if stretch == -0.5:
+            head, unit, clock = cycle_bricks(prev, this)
+            length = len(head) + len(unit) * repeat
+            if subcycle:
+                length = min(length, repeat + 1)
+            # Clocks keep their full resolution
+            return head, unit, repeat, length, 1 if clock else 2
+
+        stretch = max(int(stretch), 0)
+        try:
+            head, unit = stretched_bricks[prev, this, stretch]
+        except KeyError:
+            head, unit, clock = cycle_bricks(prev, this)
+            head = self.stretch_bricks(head, stretch)
+            unit = self.stretch_bricks(unit, stretch)
+            stretched_bricks[prev, this, stretch] = (head, unit)
+
+        length = len(head) + len(unit) * repeat
         if subcycle:
-            wave = wave[0 : repeat + 1]
-
-        if not (stretch == -0.5 and this in sharpedge_clk.keys()):
-            wave = self.stretch_bricks(wave, stretch)
+            # Each brick was expanded to 1 + stretch bricks
+            length = min(length, (repeat + 1) * (1 + stretch))
+        return head, unit, repeat, length, 1
 
-        return wave
+    def gen_wave_brick(self, prev=None, this=None, stretch=0, repeat=0, subcycle=False):
+        head, unit, repeat, length, step = self.wave_brick_parts(
+            prev, this, stretch, repeat, subcycle
+        )
+        return (head + unit * repeat)[0:length:step]
 
     def parse_wave_lane(self, text, stretch=0):
-        R = []
-
-        Stack = deque(text)
-
-        This = None
+        """Bricks of the wave `text`, stretched by `stretch`
+
+        The bricks of the first ``lane.phase`` half cycles are dropped, and
+        only the bricks in the window of ``config.hbounds`` are kept. The
+        results are memoized in :attr:`lane_cache`, the returned list is a
+        copy that can be modified freely.
+        """
+        phase = max(int(math.ceil(self.lane.phase)), 0)
+        width = self.lane.xmax_cfg - self.lane.xmin_cfg
+        if self.lane_cache is None or not isinstance(text, string_types):
+            return self.gen_wave_lane(text, stretch, phase, width)
+        key = (text, stretch, phase, width)
+        bricks = self.lane_cache.get(key)
+        if bricks is None:
+            bricks = tuple(self.gen_wave_lane(text, stretch, phase, width))
+            self.lane_cache.put(key, bricks)
+        return list(bricks)
+
+    def wave_groups(self, text, stretch=0, start=0, prev=None):
+        """The parts of the bricks of each cycle of `text` and its repeats
+
+        Reading starts at `start`, following the value `prev`. See
+        :meth:`wave_brick_parts`.
+        """
+        i = start
+        end = len(text)
+        # Long runs of repeats are skipped at once in strings
+        repeats = isinstance(text, string_types) and repeat_chars.match
+
+        This = prev
         subCycle = False
 
-        while len(Stack) > 0:
+        while i < end:
             Top = This
-            This = Stack.popleft()
+            This = text[i]
+            i += 1
             repeat = 0
             if This == "|":
                 This = "x"
@@ -194,53 +406,142 @@ class WaveDrom(SVGBase):
                 subCycle = True
                 This = Top
                 Top = None
-                if Stack[0] in [".", "|"]:
-                    Stack.popleft()
+                if text[i] in [".", "|"]:
+                    i += 1
                 else:
                     continue
             if This == ">":
                 subCycle = False
                 This = Top
                 Top = None
-                if Stack and Stack[0] in [".", "|"]:
-                    Stack.popleft()
+                if i < end and text[i] in [".", "|"]:
+                    i += 1
                 else:
                     continue
-            while Stack and Stack[0] in [".", "|"]:
-                Stack.popleft()
+            if repeats:
+                j = repeats(text, i).end()
+                repeat += j - i
+                i = j
+            while i < end and text[i] in [".", "|"]:
+                i += 1
                 repeat += 1
-            R.extend(self.gen_wave_brick(Top, This, stretch, repeat, subCycle))
-
-        for i in range(int(math.ceil(self.lane.phase))):
-            R = R[1:]
+            yield self.wave_brick_parts(Top, This, stretch, repeat, subCycle)
 
+    @staticmethod
+    def lane_start(text, stretch=0, phase=0):
+        """Where to start reading `text` for the bricks from `phase` on
+
+        Returns (index, prev, count): the cycle at `index` follows the
+        value `prev` and starts at brick `count`. Without subcycles all
+        cycles have the same number of bricks, the cycles before `phase`
+        are then skipped without reading them one by one.
+        """
+        if (
+            phase <= 0
+            or stretch == -0.5
+            or not isinstance(text, string_types)
+            or not text
+            or text[0] in ".|"
+            or "<" in text
+            or ">" in text
+        ):
+            return 0, None, 0
+        bricks = 2 * (1 + max(int(stretch), 0))
+        # The last value at or before the cycle of brick `phase`
+        index = len(text[: phase // bricks + 1].rstrip(".|")) - 1
+        prefix = text[:index].rstrip(".|")
+        return index, prefix[-1] if prefix else None, index * bricks
+
+    def gen_wave_lane(self, text, stretch=0, phase=0, width=sys.maxsize):
+        """Bricks `phase` up to `phase` + `width` of the wave `text`
+
+        Only the bricks in the window are built, the wave is not read
+        beyond it.
+        """
+        R = []
+        stop = phase + width
+        start, prev, count = self.lane_start(text, stretch, phase)
+        for head, unit, repeat, length, step in self.wave_groups(
+            text, stretch, start, prev
+        ):
+            n = (length + step - 1) // step
+            first = max(phase - count, 0)
+            last = min(n, stop - count)
+            if first == 0 and last == n:
+                R.extend((head + unit * repeat)[0:length:step])
+            elif first < last:
+                R.extend(brick_slice(head, unit, step, first, last))
+            count += n
+            if count >= stop:
+                break
         return R
 
-    def parse_wave_lanes(self, sig=""):
+    def wave_length(self, text, stretch=0):
+        """The number of bricks of the wave `text`"""
+        return sum(
+            (length + step - 1) // step
+            for head, unit, repeat, length, step in self.wave_groups(text, stretch)
+        )
+
+    def hidden_markers(self, text, stretch=0, phase=0):
+        """The number of data markers hidden in the first `phase` bricks
+
+        A marker continued by the first visible brick is not hidden.
+        """
+        start, prev, count = self.lane_start(text, stretch, phase)
+        # Each data cycle skipped by lane_start() shows one marker
+        markers = sum(text.count(c, 0, start) for c in data) if start else 0
+        last = prev in data  # the last hidden brick is a marker
+        for head, unit, repeat, length, step in self.wave_groups(
+            text, stretch, start, prev
+        ):
+            n = (length + step - 1) // step
+            hidden = phase - count
+            # Past the head, all bricks of a cycle are the same
+            for brick in brick_slice(
+                head, unit, step, 0, min(n, hidden, len(head) + 1)
+            ):
+                marker = brick in marker_bricks
+                if marker and not last:
+                    markers += 1
+                last = marker
+            if hidden < n:
+                first = brick_slice(head, unit, step, hidden, hidden + 1)[0]
+                if last and first in marker_bricks:
+                    markers -= 1
+                break
+            count += n
+        return markers
+
+    def parse_lane(self, sigx):
         def data_extract(e):
             tmp = e.get("data")
             if tmp is not None:
                 tmp = tmp.split() if isinstance(tmp, string_types) else tmp
             return tmp
 
-        content = []
-        for sigx in sig:
-            self.lane.period = sigx.get("period", 1)
-            self.lane.phase = sigx.get("phase", 0) * 2
-            sub_content = []
-            sub_content.append([sigx.get("name", " "), sigx.get("phase", 0)])
-            if sigx.get("wave"):
-                sub_content.append(
-                    self.parse_wave_lane(
-                        sigx["wave"], self.lane.period * self.lane.hscale - 1
-                    )
-                )
-            else:
-                sub_content.append(None)
-            sub_content.append(data_extract(sigx))
-            content.append(sub_content)
+        self.lane.period = sigx.get("period", 1)
+        # The lanes start at the first brick of config.hbounds
+        self.lane.phase = sigx.get("phase", 0) * 2 + self.lane.xmin_cfg
+        stretch = self.lane.period * self.lane.hscale - 1
+        sub_content = []
+        sub_content.append(
+            [sigx.get("name", " "), sigx.get("phase", 0) + self.lane.xmin_cfg // 2]
+        )
+        data = data_extract(sigx)
+        if sigx.get("wave"):
+            sub_content.append(self.parse_wave_lane(sigx["wave"], stretch))
+            phase = int(math.ceil(self.lane.phase))
+            if data and phase > 0:
+                # Drop the data of the hidden markers
+                data = data[self.hidden_markers(sigx["wave"], stretch, phase) :]
+        else:
+            sub_content.append(None)
+        sub_content.append(data)
+        return sub_content
 
-        return content
+    def parse_wave_lanes(self, sig=""):
+        return [self.parse_lane(sigx) for sigx in sig]
 
     def find_lane_markers(self, lanetext=""):
 
@@ -248,16 +549,7 @@ class WaveDrom(SVGBase):
         gcount = 0
         ret = []
         for idx, val in enumerate(lanetext):
-            if val in [
-                "vvv-2",
-                "vvv-3",
-                "vvv-4",
-                "vvv-5",
-                "vvv-6",
-                "vvv-7",
-                "vvv-8",
-                "vvv-9",
-            ]:
+            if val in marker_bricks:
                 lcount += 1
             else:
                 if lcount != 0:
@@ -273,10 +565,16 @@ class WaveDrom(SVGBase):
 
     def render_lane_uses(self, val, g):
         if val[1]:
-            for i in range(len(val[1])):
-                b = self.container.use(href="#{}".format(val[1][i]))
-                b.translate(i * self.lane.xs)
-                g.add(b)
+            if self.lane.lod:
+                self.render_lod_uses(val, g)
+                return
+            if self.merge_bricks:
+                self.render_brick_runs(val[1], g)
+            else:
+                for i in range(len(val[1])):
+                    b = self.container.use(href="#{}".format(val[1][i]))
+                    b.translate(i * self.lane.xs)
+                    g.add(b)
 
             if val[2] and len(val[2]):
                 labels = self.find_lane_markers(val[1])
@@ -291,568 +589,169 @@ class WaveDrom(SVGBase):
                             title["xml:space"] = "preserve"
                             g.add(title)
 
-    def text_width(self, string, size=11):
-        chars = [
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            34,
-            47,
-            74,
-            74,
-            118,
-            89,
-            25,
-            44,
-            44,
-            52,
-            78,
-            37,
-            44,
-            37,
-            37,
-            74,
-            74,
-            74,
-            74,
-            74,
-            74,
-            74,
-            74,
-            74,
-            74,
-            37,
-            37,
-            78,
-            78,
-            78,
-            74,
-            135,
-            89,
-            89,
-            96,
-            96,
-            89,
-            81,
-            103,
-            96,
-            37,
-            67,
-            89,
-            74,
-            109,
-            96,
-            103,
-            89,
-            103,
-            96,
-            89,
-            81,
-            96,
-            89,
-            127,
-            89,
-            87,
-            81,
-            37,
-            37,
-            37,
-            61,
-            74,
-            44,
-            74,
-            74,
-            67,
-            74,
-            74,
-            37,
-            74,
-            74,
-            30,
-            30,
-            67,
-            30,
-            112,
-            74,
-            74,
-            74,
-            74,
-            44,
-            67,
-            37,
-            74,
-            67,
-            95,
-            66,
-            65,
-            67,
-            44,
-            34,
-            44,
-            78,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            37,
-            43,
-            74,
-            74,
-            74,
-            74,
-            34,
-            74,
-            44,
-            98,
-            49,
-            74,
-            78,
-            0,
-            98,
-            73,
-            53,
-            73,
-            44,
-            44,
-            44,
-            77,
-            71,
-            37,
-            44,
-            44,
-            49,
-            74,
-            111,
-            111,
-            111,
-            81,
-            89,
-            89,
-            89,
-            89,
-            89,
-            89,
-            133,
-            96,
-            89,
-            89,
-            89,
-            89,
-            37,
-            37,
-            37,
-            37,
-            96,
-            96,
-            103,
-            103,
-            103,
-            103,
-            103,
-            78,
-            103,
-            96,
-            96,
-            96,
-            96,
-            87,
-            89,
-            81,
-            74,
-            74,
-            74,
-            74,
-            74,
-            74,
-            118,
-            67,
-            74,
-            74,
-            74,
-            74,
-            36,
-            36,
-            36,
-            36,
-            74,
-            74,
-            74,
-            74,
-            74,
-            74,
-            74,
-            73,
-            81,
-            74,
-            74,
-            74,
-            74,
-            65,
-            74,
-            65,
-            89,
-            74,
-            89,
-            74,
-            89,
-            74,
-            96,
-            67,
-            96,
-            67,
-            96,
-            67,
-            96,
-            67,
-            96,
-            82,
-            96,
-            74,
-            89,
-            74,
-            89,
-            74,
-            89,
-            74,
-            89,
-            74,
-            89,
-            74,
-            103,
-            74,
-            103,
-            74,
-            103,
-            74,
-            103,
-            74,
-            96,
-            74,
-            96,
-            74,
-            37,
-            36,
-            37,
-            36,
-            37,
-            36,
-            37,
-            30,
-            37,
-            36,
-            98,
-            59,
-            67,
-            30,
-            89,
-            67,
-            67,
-            74,
-            30,
-            74,
-            30,
-            74,
-            39,
-            74,
-            44,
-            74,
-            30,
-            96,
-            74,
-            96,
-            74,
-            96,
-            74,
-            80,
-            96,
-            74,
-            103,
-            74,
-            103,
-            74,
-            103,
-            74,
-            133,
-            126,
-            96,
-            44,
-            96,
-            44,
-            96,
-            44,
-            89,
-            67,
-            89,
-            67,
-            89,
-            67,
-            89,
-            67,
-            81,
-            38,
-            81,
-            50,
-            81,
-            37,
-            96,
-            74,
-            96,
-            74,
-            96,
-            74,
-            96,
-            74,
-            96,
-            74,
-            96,
-            74,
-            127,
-            95,
-            87,
-            65,
-            87,
-            81,
-            67,
-            81,
-            67,
-            81,
-            67,
-            30,
-            84,
-            97,
-            91,
-            84,
-            91,
-            84,
-            94,
-            92,
-            73,
-            104,
-            109,
-            91,
-            84,
-            81,
-            84,
-            100,
-            82,
-            76,
-            74,
-            103,
-            91,
-            131,
-            47,
-            40,
-            99,
-            77,
-            37,
-            79,
-            130,
-            100,
-            84,
-            104,
-            114,
-            87,
-            126,
-            101,
-            87,
-            84,
-            93,
-            84,
-            69,
-            84,
-            46,
-            52,
-            82,
-            52,
-            82,
-            114,
-            89,
-            102,
-            96,
-            100,
-            98,
-            91,
-            70,
-            88,
-            88,
-            77,
-            70,
-            85,
-            89,
-            77,
-            67,
-            84,
-            39,
-            65,
-            61,
-            39,
-            189,
-            173,
-            153,
-            111,
-            105,
-            61,
-            123,
-            123,
-            106,
-            89,
-            74,
-            37,
-            30,
-            103,
-            74,
-            96,
-            74,
-            96,
-            74,
-            96,
-            74,
-            96,
-            74,
-            96,
-            74,
-            81,
-            91,
-            81,
-            91,
-            81,
-            130,
-            131,
-            102,
-            84,
-            103,
-            84,
-            87,
-            78,
-            104,
-            81,
-            104,
-            81,
-            88,
-            76,
-            37,
-            189,
-            173,
-            153,
-            103,
-            84,
-            148,
-            90,
-            100,
-            84,
-            89,
-            74,
-            133,
-            118,
-            103,
-            81,
-        ]
-
-        return (
-            sum([(chars[ord(c)] if ord(c) <= len(chars) else 114) for c in string])
-            * size
-            / 100
-        )
+    def fit_width(self, bricks):
+        """Narrow the bricks so that `bricks` of them fit the target width
 
-    def render_wave_lane(self, content="", index=0):
-        xmax = 0
-        xgmax = 0
-        glengths = []
-        groups = []
+        Once the bricks are narrower than a pixel, ``self.lane.lod`` of
+        them make up a pixel column, see :meth:`render_lod_uses`.
+        """
+        if not self.target_width or bricks * self.lane.xs <= self.target_width:
+            return
+        self.lane.xbrick = self.lane.xs
+        self.lane.xs = float(self.target_width) / bricks
+        self.lane.lod = int(math.ceil(1 / self.lane.xs))
+
+    def render_lod_uses(self, val, g):
+        """Render the bricks of a lane narrowed by :meth:`fit_width`
+
+        The bricks are taken ``self.lane.lod`` at a time, one pixel column.
+        Columns of a single brick are drawn as that brick stretched to the
+        column, runs of them as one brick when it is steady. Columns where
+        the wave changes are merged into a busy band. Data is only labeled
+        where its run is wide enough for the text. The number of elements
+        is bounded by the target width instead of the number of cycles.
+        """
+        bricks = val[1]
+        step = self.lane.lod
+        xs = self.lane.xs
+        spans = []
+        for start in range(0, len(bricks), step):
+            column = bricks[start : start + step]
+            brick = column[0]
+            if column.count(brick) != len(column):
+                brick = None
+            end = start + len(column)
+            steady = brick is None or brick in steady_bricks
+            if spans and spans[-1][2] == brick and steady:
+                spans[-1][1] = end
+            else:
+                spans.append([start, end, brick])
+
+        for start, end, brick in spans:
+            if brick is None:
+                g.add(
+                    self.element.rect(
+                        insert=(start * xs, 0),
+                        size=((end - start) * xs, self.lane.ys),
+                        fill="#ccc",
+                        stroke="#000",
+                        stroke_width=0.5,
+                    )
+                )
+            else:
+                b = self.container.use(href="#{}".format(brick))
+                b.translate(start * xs)
+                b.scale((end - start) * xs / self.lane.xbrick, 1)
+                g.add(b)
 
-        for j, val in enumerate(content):
-            name = val[0][0].strip()
-            if name is not None:
-                dy = self.lane.y0 + j * self.lane.yo
-                g = self.container.g(id="wavelane_{j}_{index}".format(j=j, index=index))
-                g.translate(0, dy)
+        data = val[2]
+        if data:
+            # The first brick of each run of data, counted like
+            # find_lane_markers()
+            starts = [
+                i
+                for i, (prev, this) in enumerate(zip(chain([None], bricks), bricks))
+                if this in marker_bricks and prev not in marker_bricks
+            ]
+            for start, end, brick in spans:
+                if brick not in marker_bricks:
+                    continue
+                k = bisect_right(starts, start) - 1
+                if k >= len(data):
+                    break
+                if self.text_width(str(data[k])) > (end - start) * xs:
+                    continue
                 title = self.element.text(
-                    "", x=[self.lane.tgo], y=[self.lane.ym], text_anchor="end"
+                    "",
+                    x=[(start + end) * xs / 2],
+                    y=[self.lane.ym],
+                    text_anchor="middle",
                 )
-                title.add(self.element.tspan(name))
+                title.add(self.element.tspan(data[k]))
                 title["xml:space"] = "preserve"
-                title["class"] = "info"
                 g.add(title)
 
-                glengths.append(self.text_width(name))
-
-                xoffset = val[0][1]
-                xoffset = (
-                    math.ceil(2 * xoffset) - 2 * xoffset
-                    if xoffset > 0
-                    else -2 * xoffset
+    def render_brick_runs(self, bricks, g):
+        """Render bricks, merging runs of a steady brick into one rect
+
+        The rect is filled with the brick's pattern from
+        :meth:`gen_brick_patterns`. It is a bit higher than the brick so
+        that strokes on the upper and lower edge are not clipped.
+        """
+        margin = self.lane.ys // 2
+        i = 0
+        for brick, run in groupby(bricks):
+            count = sum(1 for _ in run)
+            if count > 1 and brick in steady_bricks:
+                g.add(
+                    self.element.rect(
+                        insert=(i * self.lane.xs, -margin),
+                        size=(count * self.lane.xs, self.lane.ys + 2 * margin),
+                        fill="url(#run-{})".format(brick),
+                    )
                 )
-                gg = self.container.g(
-                    id="wavelane_draw_{j}_{index}".format(j=j, index=index)
+            else:
+                for k in range(i, i + count):
+                    b = self.container.use(href="#{}".format(brick))
+                    b.translate(k * self.lane.xs)
+                    g.add(b)
+            i += count
+
+    def gen_brick_patterns(self, ids):
+        """Patterns tiling each of the steady bricks in `ids`"""
+        margin = self.lane.ys // 2
+        patterns = []
+        for brick in ids:
+            if brick in steady_bricks:
+                pattern = self.container.pattern(
+                    id="run-{}".format(brick),
+                    insert=(0, -margin),
+                    size=(self.lane.xs, self.lane.ys + 2 * margin),
+                    patternUnits="userSpaceOnUse",
                 )
-                gg.translate(xoffset * self.lane.xs, 0)
+                pattern.add(self.container.use(href="#{}".format(brick)))
+                patterns.append(pattern)
+        return patterns
 
-                self.render_lane_uses(val, gg)
+    def text_width(self, string, size=11):
+        metrics = font_metrics.get(self.lane.get("skin"), default_font_metrics)
+        return metrics.width(string, size)
+
+    def render_lane_group(self, j, val, index):
+        """Render lane `j` from its parsed content `val` to a group"""
+        name = val[0][0].strip()
+        dy = self.lane.y0 + j * self.lane.yo
+        g = self.container.g(id="wavelane_{j}_{index}".format(j=j, index=index))
+        g.translate(0, dy)
+        title = self.element.text(
+            "", x=[self.lane.tgo], y=[self.lane.ym], text_anchor="end"
+        )
+        title.add(self.element.tspan(name))
+        title["xml:space"] = "preserve"
+        title["class"] = "info"
+        g.add(title)
+
+        xoffset = val[0][1]
+        xoffset = math.ceil(2 * xoffset) - 2 * xoffset if xoffset > 0 else -2 * xoffset
+        gg = self.container.g(id="wavelane_draw_{j}_{index}".format(j=j, index=index))
+        gg.translate(xoffset * self.lane.xs, 0)
 
-                if val[1] and len(val[1]) > xmax:
-                    xmax = len(val[1])
+        self.render_lane_uses(val, gg)
+
+        g.add(gg)
+        return g
 
-                g.add(gg)
-                groups.append(g)
+    def render_wave_lane(self, content="", index=0):
+        xmax = 0
+        xgmax = 0
+        glengths = []
+        groups = []
+
+        for j, val in enumerate(content):
+            groups.append(self.render_lane_group(j, val, index))
+            glengths.append(self.text_width(val[0][0].strip()))
+            if val[1] and len(val[1]) > xmax:
+                xmax = len(val[1])
         self.lane.xmax = xmax
         self.lane.xg = xgmax + 20
         return (glengths, groups)
@@ -870,10 +769,10 @@ class WaveDrom(SVGBase):
             if isinstance(cxt[anchor]["text"], string_types):
                 tmark.add(self.element.tspan(cxt[anchor]["text"]))
             else:
-                tmark.add(JsonMLElement(cxt[anchor]["text"]))
+                tmark.add(self.element.jsonml(cxt[anchor]["text"]))
             g.add(tmark)
 
-    def ticktock(self, g, cxt, ref1, ref2, x, dx, y, length):
+    def ticktock(self, g, cxt, ref1, ref2, x, dx, y, length, every=1):
         L = []
 
         if cxt.get(ref1) is None or cxt[ref1].get(ref2) is None:
@@ -883,13 +782,11 @@ class WaveDrom(SVGBase):
 
         if isinstance(val, string_types):
             val = val.split()
-        elif isinstance(val, (int, float, bool)):
-            offset = int(val)
-            val = []
-            for i in range(length):
-                val.append(i + offset)
 
-        if type(val) is list:
+        if isinstance(val, (int, float, bool)):
+            offset = int(val)
+            L = [i + offset for i in range(length)]
+        elif type(val) is list:
             if len(val) == 0:
                 return
             elif len(val) == 1:
@@ -918,7 +815,7 @@ class WaveDrom(SVGBase):
         else:
             return
 
-        for i in range(length):
+        for i in range(0, length, every):
             tmp = L[i]
             tmark = self.element.text(tmp, x=[i * dx + x], y=[y], text_anchor="middle")
             tmark["class"] = "muted"
@@ -940,10 +837,11 @@ class WaveDrom(SVGBase):
         mmstep = mstep * self.lane.xs
         marks = int(self.lane.xmax / mstep)
         gy = len(content) * int(self.lane.yo)
+        every = self.mark_step(mmstep)
 
         g = self.container.g(id="gmarks_{}".format(index))
 
-        for i in range(marks + 1):
+        for i in range(0, marks + 1, every):
             gg = self.element.path(
                 id="gmark_{i}_{index}".format(i=i, index=index),
                 d="m {dx},0 0,{gy}".format(dx=i * mmstep, gy=gy),
@@ -953,81 +851,116 @@ class WaveDrom(SVGBase):
 
         self.captext(g, self.lane, "head", -33 if (self.lane.yh0 > 0) else -13)
         self.captext(g, self.lane, "foot", gy + (45 if (self.lane.yf0 > 0) else 25))
-        self.ticktock(g, self.lane, "head", "tick", 0, mmstep, -5, marks + 1)
-        self.ticktock(g, self.lane, "head", "tock", mmstep / 2, mmstep, -5, marks)
-        self.ticktock(g, self.lane, "foot", "tick", 0, mmstep, gy + 15, marks + 1)
-        self.ticktock(g, self.lane, "foot", "tock", mmstep / 2, mmstep, gy + 15, marks)
+        self.ticktock(g, self.lane, "head", "tick", 0, mmstep, -5, marks + 1, every)
+        self.ticktock(
+            g, self.lane, "head", "tock", mmstep / 2, mmstep, -5, marks, every
+        )
+        self.ticktock(
+            g, self.lane, "foot", "tick", 0, mmstep, gy + 15, marks + 1, every
+        )
+        self.ticktock(
+            g, self.lane, "foot", "tock", mmstep / 2, mmstep, gy + 15, marks, every
+        )
 
         return g
 
+    def mark_step(self, mmstep, spacing=50):
+        """Every how many cycles the marks and ticks are drawn
+
+        Every cycle, unless the waves are narrowed to the target width and
+        marks `mmstep` apart would be closer than `spacing`. Then every
+        2nd, 5th, 10th, 20th, ... cycle.
+        """
+        scale = 1
+        while self.lane.lod:
+            for step in [1, 2, 5]:
+                if step * scale * mmstep >= spacing:
+                    return step * scale
+            scale *= 10
+        return 1
+
     def render_labels(self, root, source, index):
         if source:
             gg = self.container.g(id="labels_{index}".format(index=index))
 
             for idx, val in enumerate(source):
-                self.lane.period = val.get("period", 1)
-                self.lane.phase = val.get("phase", 0) * 2
+                gg.add(self.render_lane_labels(idx, val, index))
+            root.add(gg)
 
-                dy = self.lane.y0 + idx * self.lane.yo
-                g = self.container.g(id="labels_{i}_{index}".format(i=idx, index=index))
-                g.translate(0, dy)
+    def render_lane_labels(self, idx, val, index):
+        """Render the labels of lane `idx` to a group"""
+        self.lane.period = val.get("period", 1)
+        self.lane.phase = val.get("phase", 0) * 2 + self.lane.xmin_cfg
 
-                label = val.get("label")
-                if label:
-                    pos = 0
-                    for l in re.findall(
-                        r"([\.\w]|(?:\{\w+\}))(?:\((\d*\.?\d+)\))?", label
-                    ):
-                        if l[0] == ".":
-                            pos += 1
-                            continue
+        dy = self.lane.y0 + idx * self.lane.yo
+        g = self.container.g(id="labels_{i}_{index}".format(i=idx, index=index))
+        g.translate(0, dy)
 
-                        text = l[0]
-                        try:
-                            offset = float(l[1])
-                        except ValueError:
-                            offset = 0
+        label = val.get("label")
+        if label:
+            pos = 0
+            step = 2 * self.lane.period * self.lane.hscale
+            if re.match(r"[\.\w]*$", label):
+                # One cycle per character, start close to the window
+                pos = self.first_visible(step)
+            right = self.window_right()
+            for m in re.finditer(
+                r"([\.\w]|(?:\{\w+\}))(?:\((\d*\.?\d+)\))?", label[pos:]
+            ):
+                l = m.groups("")
+                if right is not None and right < self.lane.xs * (
+                    pos * step - self.lane.phase
+                ):
+                    # Offsets only move labels further right
+                    break
+                if l[0] == ".":
+                    pos += 1
+                    continue
 
-                        m = re.match(r"\{(\w+)\}", l[0])
-                        if m:
-                            text = m.group(1)
-                        x = int(
-                            float(self.lane.xs)
-                            * (
-                                2 * (pos + offset) * self.lane.period * self.lane.hscale
-                                - self.lane.phase
-                            )
-                            + float(self.lane.xlabel)
-                        )
-                        y = (
-                            int(
-                                idx * self.lane.yo
-                                + self.lane.y0
-                                + float(self.lane.ys) * 0.5
-                            )
-                            - dy
-                        )
+                text = l[0]
+                try:
+                    offset = float(l[1])
+                except ValueError:
+                    offset = 0
+
+                m = re.match(r"\{(\w+)\}", l[0])
+                if m:
+                    text = m.group(1)
+                x = int(
+                    float(self.lane.xs)
+                    * (
+                        2 * (pos + offset) * self.lane.period * self.lane.hscale
+                        - self.lane.phase
+                    )
+                    + float(self.lane.xlabel)
+                )
+                if not self.in_window(x):
+                    pos += 1
+                    continue
+                y = (
+                    int(idx * self.lane.yo + self.lane.y0 + float(self.lane.ys) * 0.5)
+                    - dy
+                )
 
-                        lwidth = len(text) * self.font_width
-                        lx = float(x) - float(lwidth) / 2
-                        ly = int(y) - 5
-                        underlabel = self.element.rect(
-                            insert=(lx, ly), size=(lwidth, 8), style="fill:#FFF;"
-                        )
-                        g.add(underlabel)
-                        lx = float(x)
-                        ly = int(y) + 2
-                        label = self.element.text(
-                            text,
-                            style="font-size:8px;",
-                            text_anchor="middle",
-                            x=[lx],
-                            y=[ly],
-                        )
-                        g.add(label)
-                        pos += 1
-                gg.add(g)
-            root.add(gg)
+                lwidth = len(text) * self.font_width
+                lx = float(x) - float(lwidth) / 2
+                ly = int(y) - 5
+                underlabel = self.element.rect(
+                    insert=(lx, ly), size=(lwidth, 8), style="fill:#FFF;"
+                )
+                g.add(underlabel)
+                lx = float(x)
+                ly = int(y) + 2
+                label = self.element.text(
+                    text,
+                    style="font-size:8px;",
+                    text_anchor="middle",
+                    x=[lx],
+                    y=[ly],
+                )
+                g.add(label)
+                pos += 1
+        return g
 
     def arc_shape(self, Edge, frm, to):
         dx = float(to.x) - float(frm.x)
@@ -1265,6 +1198,42 @@ class WaveDrom(SVGBase):
         g.add(label)
         return g
 
+    @staticmethod
+    def node_positions(text):
+        """The nodes of `text` as (name, position in cycles)
+
+        The names are in the order they first appear, with the position of
+        their last node.
+        """
+        if "<" not in text and ">" not in text:
+            # One cycle per node, only the last node of each name is looked up
+            names = sorted(set(text) - set("."), key=text.index)
+            return [(name, text.rfind(name)) for name in names]
+        positions = {}
+        pos = 0
+        step = 1
+        for eventname in text:
+            if eventname == "<":
+                step = 0.25
+                continue
+            elif eventname == ">":
+                step = 1
+                continue
+            if eventname != ".":
+                positions[eventname] = pos
+            pos += step
+        return list(positions.items())
+
+    def first_visible(self, step):
+        """The first of items `step` bricks apart that can be in the window
+
+        The items start at brick ``-lane.phase``. Without config.hbounds
+        all items are drawn.
+        """
+        if self.window_right() is None:
+            return 0
+        return max(int(self.lane.phase // step) - 1, 0)
+
     def render_arcs(self, source, index, top):
         Edge = AttrDict({"words": [], "frm": 0, "shape": "", "to": 0, "label": ""})
         Events = AttrDict({})
@@ -1272,21 +1241,10 @@ class WaveDrom(SVGBase):
         if source:
             for idx, val in enumerate(source):
                 self.lane.period = val.get("period", 1)
-                self.lane.phase = val.get("phase", 0) * 2
+                self.lane.phase = val.get("phase", 0) * 2 + self.lane.xmin_cfg
                 text = val.get("node")
                 if text:
-                    Stack = list(text)
-                    Stack.reverse()
-                    pos = 0
-                    step = 1
-                    while len(Stack) > 0:
-                        eventname = Stack.pop()
-                        if eventname == "<":
-                            step = 0.25
-                            continue
-                        elif eventname == ">":
-                            step = 1
-                            continue
+                    for eventname, pos in self.node_positions(text):
                         x = int(
                             float(self.lane.xs)
                             * (
@@ -1300,9 +1258,7 @@ class WaveDrom(SVGBase):
                             + self.lane.y0
                             + float(self.lane.ys) * 0.5
                         )
-                        if eventname != ".":
-                            Events[eventname] = AttrDict({"x": str(x), "y": str(y)})
-                        pos += step
+                        Events[eventname] = AttrDict({"x": str(x), "y": str(y)})
 
             gg = self.container.g(id="wavearcs_{index}".format(index=index))
 
@@ -1316,6 +1272,13 @@ class WaveDrom(SVGBase):
                     Edge.shape = Edge.words[0][1:-1]
                     frm = AttrDict(Events[Edge.frm])
                     to = AttrDict(Events[Edge.to])
+                    if (
+                        not self.in_window(int(frm.x))
+                        and not self.in_window(int(to.x))
+                        and (int(frm.x) < 0) == (int(to.x) < 0)
+                    ):
+                        # Both ends are on the same side of the window
+                        continue
 
                     shapeProps = self.arc_shape(Edge, frm, to)
                     gg.add(self.render_arc(Edge, frm, to, shapeProps))
@@ -1330,7 +1293,7 @@ class WaveDrom(SVGBase):
 
             for k in Events:
                 if k.islower() or k.isdigit():
-                    if int(Events[k].x) > 0:
+                    if int(Events[k].x) > 0 and self.in_window(int(Events[k].x)):
                         gg.add(
                             self.render_label(
                                 AttrDict({"x": Events[k].x, "y": Events[k].y}), k
@@ -1354,44 +1317,58 @@ class WaveDrom(SVGBase):
         self.lane.xmin_cfg = 0
         self.lane.xmax_cfg = sys.maxsize
         if source and "config" in source and "hbounds" in source["config"]:
-            if len(source["config"]["hbounds"]) == 2:
-                source["config"]["hbounds"][0] = math.floor(
-                    source["config"]["hbounds"][0]
-                )
-                source["config"]["hbounds"][1] = math.ceil(
-                    source["config"]["hbounds"][0]
-                )
-                if source["config"]["hbounds"][0] < source["config"]["hbounds"][1]:
-                    self.lane.xmin_cfg = 2 * source["config"]["hbounds"][0]
-                    self.lane.xmax_cfg = 2 * source["config"]["hbounds"][1]
-
+            hbounds = source["config"]["hbounds"]
+            if len(hbounds) == 2:
+                # The cycles from hbounds[0] up to hbounds[1], in bricks
+                hbounds = [int(math.floor(hbounds[0])), int(math.ceil(hbounds[1]))]
+                if hbounds[0] < hbounds[1]:
+                    self.lane.xmin_cfg = 2 * hbounds[0]
+                    self.lane.xmax_cfg = 2 * hbounds[1]
+
+        # head and foot are copied, the source is never modified
         self.lane.yh0 = 0
         self.lane.yh1 = 0
         if source and source.get("head"):
-            self.lane.head = source["head"]
+            self.lane.head = self.shift_ticks(source["head"])
             if "tick" in source["head"] or "tock" in source["head"]:
                 self.lane.yh0 = 20
-            if "tick" in source["head"]:
-                source["head"]["tick"] += self.lane.xmin_cfg / 2
-            if "tock" in source["head"]:
-                source["head"]["tock"] += self.lane.xmin_cfg / 2
             if source.get("head").get("text"):
                 self.lane.yh1 = 46
-                self.lane.head["text"] = source["head"]["text"]
 
         self.lane.yf0 = 0
         self.lane.yf1 = 0
         if source and source.get("foot"):
-            self.lane.foot = source["foot"]
+            self.lane.foot = self.shift_ticks(source["foot"])
             if "tick" in source["foot"] or "tock" in source["foot"]:
                 self.lane.yf0 = 20
-            if "tick" in source["foot"]:
-                source["foot"]["tick"] += self.lane.xmin_cfg / 2
-            if "tock" in source["foot"]:
-                source["foot"]["tock"] += self.lane.xmin_cfg / 2
             if source.get("foot").get("text"):
                 self.lane.yf1 = 46
-                self.lane.foot["text"] = source["foot"]["text"]
+
+    def shift_ticks(self, cxt):
+        ret = dict(cxt)
+        # The number of ticks left of the window
+        shift = self.lane.xmin_cfg // (2 * self.lane.hscale)
+        for ref in ["tick", "tock"]:
+            val = ret.get(ref)
+            if isinstance(val, (int, float)):
+                ret[ref] = val + shift
+            elif shift and isinstance(val, string_types + (list,)):
+                val = val.split() if isinstance(val, string_types) else val
+                if len(val) > 2:
+                    # A label per tick, those of the hidden ticks are dropped
+                    ret[ref] = val[shift:]
+        return ret
+
+    def window_right(self):
+        """The right edge of the window of config.hbounds, None without one"""
+        if self.lane.xmax_cfg == sys.maxsize:
+            return None
+        return (self.lane.xmax_cfg - self.lane.xmin_cfg) * self.lane.xs
+
+    def in_window(self, x):
+        """Whether `x` is inside the window of config.hbounds"""
+        right = self.window_right()
+        return right is None or 0 <= x <= right
 
     def rec(self, tmp=[], state={}):
         name = None
@@ -1449,22 +1426,59 @@ class WaveDrom(SVGBase):
             return ret
 
         skinname = source.get("config", {"skin": "default"}).get("skin", "default")
-        skin = waveskin.WaveSkin.get(skinname, waveskin.WaveSkin["default"])
+        if skinname not in waveskin.WaveSkin:
+            skinname = "default"
+        skin = waveskin.WaveSkin[skinname]
 
-        template = svgwrite.Drawing(id="svgcontent_{index}".format(index=index))
+        template = self.container.svg(id="svgcontent_{index}".format(index=index))
         if index == 0:
-            template.add(template.style(skin[2][2]))
-            [template.defs.add(get_container(e)) for e in skin[3][1:]]
             self.lane.xs = int(skin[3][1][2][1]["width"])
             self.lane.ys = int(skin[3][1][2][1]["height"])
             self.lane.xlabel = int(skin[3][1][2][1]["x"])
             self.lane.ym = int(skin[3][1][2][1]["y"])
+            if skinname not in self.skin_defs:
+                self.skin_defs[skinname] = [get_container(e) for e in skin[3][1:]]
+            if self.merge_bricks and skinname not in self.brick_patterns:
+                ids = [e[1].get("id") for e in skin[3][1:]]
+                self.brick_patterns[skinname] = self.gen_brick_patterns(ids)
+            template.add(self.container.style(skin[2][2]))
+            if not self.prune_defs:
+                self.add_skin_defs(template, skinname)
+        self.lane.skin = skinname
 
         template["class"] = "WaveDrom"
         template["overflow"] = "hidden"
 
         return template
 
+    def add_skin_defs(self, template, skinname, refs=None):
+        """Add the definitions of the skin to the drawing
+
+        With `refs` given, only the definitions with an id in `refs` (see
+        :meth:`collect_refs`) are added.
+        """
+        defs = self.skin_defs[skinname]
+        if self.merge_bricks:
+            defs = defs + self.brick_patterns[skinname]
+        if refs is not None:
+            refs = refs | set("run-" + r for r in refs)
+            defs = [e for e in defs if e["id"] in refs]
+        [template.defs.add(e) for e in defs]
+
+    def edge_refs(self, source):
+        """Ids of the definitions referenced by the edges of `source`"""
+        return set(["arrowhead", "arrowtail"]) if source.get("edge") else set()
+
+    def collect_refs(self, refs, sigx, val):
+        """Add the ids of the definitions used by a lane to `refs`
+
+        `sigx` is the source of the lane and `val` its parsed content.
+        """
+        if val[1]:
+            refs.update(val[1])
+        if "|" in sigx.get("wave", ""):
+            refs.add("gap")
+
     def insert_svg_template(self, index=0, parent=[], source={}):
         e = waveskin.WaveSkin["default"]
 
@@ -1507,17 +1521,24 @@ class WaveDrom(SVGBase):
         xmax = 0
 
         if source.get("signal"):
+            self.reset()
             template = self.another_template(index, source)
-            waves = template.g(id="waves_{index}".format(index=index))
-            lanes = template.g(id="lanes_{index}".format(index=index))
-            groups = template.g(id="groups_{index}".format(index=index))
+            waves = self.container.g(id="waves_{index}".format(index=index))
+            lanes = self.container.g(id="lanes_{index}".format(index=index))
+            groups = self.container.g(id="groups_{index}".format(index=index))
             self.parse_config(source)
             ret = AttrDict(
                 {"x": 0, "y": 0, "xmax": 0, "width": [], "lanes": [], "groups": []}
             )
             self.rec(source["signal"], ret)  # parse lanes
             content = self.parse_wave_lanes(ret.lanes)
-            (glengths, lanegroups) = self.render_wave_lane(content, index)
+            self.fit_width(max([len(val[1]) for val in content if val[1]] + [0]))
+            if self.prune_defs and index == 0:
+                refs = self.edge_refs(source)
+                for sigx, val in zip(ret.lanes, content):
+                    self.collect_refs(refs, sigx, val)
+                self.add_skin_defs(template, self.lane.skin, refs)
+            glengths, lanegroups = self.render_wave_lane(content, index)
             for i, val in enumerate(glengths):
                 xmax = max(xmax, (val + ret.width[i]))
             marks = self.render_marks(content, index)
@@ -1533,30 +1554,157 @@ class WaveDrom(SVGBase):
             lanes.add(gaps)
 
             self.render_groups(groups, ret.groups, index)
-            self.lane.xg = (
-                int(math.ceil(float(xmax - self.lane.tgo) / float(self.lane.xs)))
-                * self.lane.xs
-            )
-            width = self.lane.xg + self.lane.xs * (self.lane.xmax + 1)
-            height = (
-                len(content) * self.lane.yo
-                + self.lane.yh0
-                + self.lane.yh1
-                + self.lane.yf0
-                + self.lane.yf1
-            )
-            template["width"] = width
-            template["height"] = height
-            template.viewbox(0, 0, width, height)
-            dx = self.lane.xg + 0.5
-            dy = float(self.lane.yh0) + float(self.lane.yh1) + 0.5
-            lanes.translate(dx, dy)
+            lanes.translate(*self.resize(template, len(content), xmax))
 
             waves.add(lanes)
             waves.add(groups)
             template.add(waves)
             return template
 
+    def cycle_count(self, source):
+        """The number of cycles of the waveform `source`
+
+        The cycles of the whole diagram, hbounds already in the config are
+        ignored.
+        """
+        self.reset()
+        config = dict(source.get("config") or {})
+        config.pop("hbounds", None)
+        self.parse_config(dict(source, config=config))
+        ret = AttrDict(
+            {"x": 0, "y": 0, "xmax": 0, "width": [], "lanes": [], "groups": []}
+        )
+        self.rec(source["signal"], ret)
+        bricks = 0
+        for sigx in ret.lanes:
+            if sigx.get("wave"):
+                stretch = sigx.get("period", 1) * self.lane.hscale - 1
+                phase = max(int(math.ceil(sigx.get("phase", 0) * 2)), 0)
+                bricks = max(bricks, self.wave_length(sigx["wave"], stretch) - phase)
+        # A cycle is 2 * hscale bricks
+        step = 2 * self.lane.hscale
+        return (bricks + step - 1) // step
+
+    def tile_layout(self, source, cycles):
+        """The cycle count of `source` and the hbounds of its tiles
+
+        Returns the :meth:`cycle_count` and the :meth:`tile_bounds` of
+        `source` in one pass over its lanes.
+        """
+        count = self.cycle_count(source)
+        # hbounds count two bricks, a cycle is hscale of them
+        hscale = self.lane.hscale
+        bounds = [
+            [start * hscale, (start + cycles) * hscale]
+            for start in range(0, count, cycles)
+        ]
+        return count, bounds
+
+    def tile_bounds(self, source, cycles):
+        """The config.hbounds of the tiles of `cycles` cycles of `source`
+
+        The tiles cover the whole diagram, hbounds already in the config
+        are ignored.
+        """
+        return self.tile_layout(source, cycles)[1]
+
+    def tile_sources(self, source, cycles):
+        """Split the waveform `source` into tiles of `cycles` cycles
+
+        Returns the source of each tile: `source` with config.hbounds set
+        to the cycles of the tile. The tiles repeat the lane names and
+        groups and number the ticks from their first cycle.
+        """
+        config = source.get("config") or {}
+        return [
+            dict(source, config=dict(config, hbounds=hbounds))
+            for hbounds in self.tile_bounds(source, cycles)
+        ]
+
+    def resize(self, template, count, xmax):
+        """Size the drawing for `count` lanes with names up to `xmax` wide
+
+        Returns the offset of the lanes in the drawing.
+        """
+        self.lane.xg = (
+            int(math.ceil(float(xmax - self.lane.tgo) / float(self.lane.xs)))
+            * self.lane.xs
+        )
+        width = self.lane.xg + self.lane.xs * (self.lane.xmax + 1)
+        height = (
+            count * self.lane.yo
+            + self.lane.yh0
+            + self.lane.yh1
+            + self.lane.yf0
+            + self.lane.yf1
+        )
+        template["width"] = width
+        template["height"] = height
+        template.viewbox(0, 0, width, height)
+        dx = self.lane.xg + 0.5
+        dy = float(self.lane.yh0) + float(self.lane.yh1) + 0.5
+        return dx, dy
+
+    def write_waveform(self, fileobj, index=0, source={}, strict_js_features=False):
+        """Render a waveform straight to `fileobj`
+
+        Produces the same SVG as writing the drawing of
+        :meth:`render_waveform`, but the lanes are rendered and written one
+        at a time instead of building the whole drawing in memory first.
+        Memory use stays about constant in the number of lanes. The wave of
+        each lane is parsed twice, once to size the drawing and once to
+        render it.
+        """
+        self.reset()
+        template = self.another_template(index, source)
+        self.parse_config(source)
+        ret = AttrDict(
+            {"x": 0, "y": 0, "xmax": 0, "width": [], "lanes": [], "groups": []}
+        )
+        self.rec(source["signal"], ret)
+
+        # Size the drawing, the header has to be written first
+        xmax = 0
+        bricks = 0
+        refs = self.edge_refs(source)
+        for i, sigx in enumerate(ret.lanes):
+            val = self.parse_lane(sigx)
+            xmax = max(xmax, self.text_width(val[0][0].strip()) + ret.width[i])
+            if val[1]:
+                bricks = max(bricks, len(val[1]))
+            self.collect_refs(refs, sigx, val)
+        self.lane.xmax = bricks
+        self.fit_width(bricks)
+        if self.prune_defs and index == 0:
+            self.add_skin_defs(template, self.lane.skin, refs)
+        lanes = self.container.g(id="lanes_{index}".format(index=index))
+        lanes.translate(*self.resize(template, len(ret.lanes), xmax))
+
+        fileobj.write('<?xml version="1.0" encoding="utf-8" ?>\n')
+        fileobj.write(template.tostring()[: -len("</svg>")])
+        fileobj.write(start_tag(self.container.g(id="waves_{}".format(index))))
+        fileobj.write(start_tag(lanes))
+        if ret.lanes and not strict_js_features:
+            fileobj.write(start_tag(self.container.g(id="labels_{}".format(index))))
+            for idx, val in enumerate(ret.lanes):
+                fileobj.write(self.render_lane_labels(idx, val, index).tostring())
+            fileobj.write("</g>")
+        fileobj.write(self.render_marks(ret.lanes, index).tostring())
+        for j, sigx in enumerate(ret.lanes):
+            val = self.parse_lane(sigx)
+            fileobj.write(self.render_lane_group(j, val, index).tostring())
+        if ret.lanes:
+            fileobj.write(self.render_arcs(ret.lanes, index, source).tostring())
+            fileobj.write(start_tag(self.container.g(id="wavegaps_{}".format(index))))
+            for idx, val in enumerate(ret.lanes):
+                fileobj.write(self.render_lane_gaps(idx, val, index).tostring())
+            fileobj.write("</g>")
+        fileobj.write("</g>")
+        groups = self.container.g(id="groups_{index}".format(index=index))
+        self.render_groups(groups, ret.groups, index)
+        fileobj.write(groups.tostring())
+        fileobj.write("</g></svg>")
+
     def render_groups(self, root=[], groups=[], index=0):
         for i, val in enumerate(groups):
             dx = groups[i]["x"] + 0.5
@@ -1595,9 +1743,23 @@ class WaveDrom(SVGBase):
         subCycle = False
 
         if wave:
-            Stack = deque(wave)
-            pos = 0
+            start = 0
+            if "<" not in wave and ">" not in wave:
+                # One cycle per character, start close to the window
+                start = self.first_visible(2 * self.lane.period * self.lane.hscale)
+            Stack = deque(wave[start:])
+            pos = 2 * self.lane.period * start
+            right = self.window_right()
+            # Narrowed to the target width, gaps closer than a brick to the
+            # last one would be drawn over it
+            last = None
             while len(Stack):
+                if right is not None and right < float(self.lane.xs) * (
+                    (pos - self.lane.period) * float(self.lane.hscale)
+                    - float(self.lane.phase)
+                ):
+                    # The remaining gaps are right of the window
+                    break
                 next = Stack.popleft()
                 if next == "<":
                     subCycle = True
@@ -1619,30 +1781,37 @@ class WaveDrom(SVGBase):
                             (pos - self.lane.period) * float(self.lane.hscale)
                             - float(self.lane.phase)
                         )
-                    b = self.container.use(href="#gap")
-                    b.translate(dx)
-                    g.add(b)
+                    if self.lane.lod and last is not None:
+                        if dx < last + self.lane.xbrick:
+                            continue
+                    if self.in_window(dx):
+                        last = dx
+                        b = self.container.use(href="#gap")
+                        b.translate(dx)
+                        g.add(b)
 
     def render_gaps(self, source, index):
         if source:
             gg = self.container.g(id="wavegaps_{index}".format(index=index))
 
             for idx, val in enumerate(source):
-                self.lane.period = val.get("period", 1)
-                self.lane.phase = int(val.get("phase", 0) * 2) + self.lane.xmin_cfg
+                gg.add(self.render_lane_gaps(idx, val, index))
 
-                dy = self.lane.y0 + idx * self.lane.yo
-                g = self.container.g(
-                    id="wavegap_{i}_{index}".format(i=idx, index=index)
-                )
-                g.translate(0, dy)
+            return gg
 
-                if "wave" in val:
-                    self.render_gap_uses(val["wave"], g)
+    def render_lane_gaps(self, idx, val, index):
+        """Render the gaps of lane `idx` to a group"""
+        self.lane.period = val.get("period", 1)
+        self.lane.phase = int(val.get("phase", 0) * 2) + self.lane.xmin_cfg
 
-                gg.add(g)
+        dy = self.lane.y0 + idx * self.lane.yo
+        g = self.container.g(id="wavegap_{i}_{index}".format(i=idx, index=index))
+        g.translate(0, dy)
 
-            return gg
+        if "wave" in val:
+            self.render_gap_uses(val["wave"], g)
+
+        return g
 
     def convert_to_svg(self, root):
         svg_output = ""
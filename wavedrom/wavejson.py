@@ -0,0 +1,181 @@
+# Copyright wavedrompy contributors.
+# SPDX-License-Identifier: MIT
+
+"""Parsing of WaveJSON sources
+
+WaveJSON is usually written as JavaScript object literals rather than
+strict JSON: keys are unquoted, strings use single quotes and lists have
+trailing commas. :func:`loads` tries the fastest parser that can handle
+the input:
+
+1. strict JSON with the C accelerated :func:`json.loads`,
+2. the relaxed (JSON5 style) parser :func:`loads_relaxed`,
+3. YAML, which also accepts unquoted string values.
+"""
+
+import json
+import re
+
+_skip = re.compile(r"(?:\s+|//[^\n]*|/\*.*?\*/)*", re.S)
+_key = re.compile(r"[^\s:,{}\[\]\"'/]+")
+_number = re.compile(
+    r"[+-]?(?:0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|Infinity|NaN)"
+)
+_string = {
+    '"': re.compile(r'"((?:[^"\\]|\\.)*)"', re.S),
+    "'": re.compile(r"'((?:[^'\\]|\\.)*)'", re.S),
+}
+_escape = re.compile(r"\\(?:u([0-9a-fA-F]{4})|x([0-9a-fA-F]{2})|(\r\n|.))", re.S)
+_escapes = {
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "v": "\v",
+    "0": "\0",
+    "\n": "",
+    "\r": "",
+    "\r\n": "",
+    "\u2028": "",
+    "\u2029": "",
+}
+_constants = {"true": True, "false": False, "null": None}
+_closing = {"[": "]", "{": "}"}
+
+
+def _unescape(match):
+    if match.group(1):
+        return chr(int(match.group(1), 16))
+    if match.group(2):
+        return chr(int(match.group(2), 16))
+    return _escapes.get(match.group(3), match.group(3))
+
+
+def _error(text, pos, expected):
+    return ValueError(
+        "Expecting {} at position {}: {!r}".format(expected, pos, text[pos : pos + 20])
+    )
+
+
+def _parse_string(text, pos):
+    match = _string[text[pos]].match(text, pos)
+    if not match:
+        raise _error(text, pos, "string")
+    return _escape.sub(_unescape, match.group(1)), match.end()
+
+
+def _parse_key(text, pos):
+    if text[pos : pos + 1] in _string:
+        return _parse_string(text, pos)
+    match = _key.match(text, pos)
+    if not match:
+        raise _error(text, pos, "property name")
+    return match.group(0), match.end()
+
+
+def _parse_scalar(text, pos):
+    if text[pos : pos + 1] in _string:
+        return _parse_string(text, pos)
+    match = _number.match(text, pos)
+    if match:
+        token = match.group(0)
+        if "x" in token or "X" in token:
+            return int(token, 16), match.end()
+        if token.lstrip("+-") in ("Infinity", "NaN"):
+            return float(token.replace("Infinity", "inf")), match.end()
+        if token.lstrip("+-").isdigit():
+            return int(token), match.end()
+        return float(token), match.end()
+    match = _key.match(text, pos)
+    if match and match.group(0) in _constants:
+        return _constants[match.group(0)], match.end()
+    raise _error(text, pos, "value")
+
+
+def loads_relaxed(text):
+    """Parse JSON5 style WaveJSON
+
+    In addition to JSON this accepts unquoted keys, single quoted strings,
+    trailing commas, comments and hexadecimal numbers. The parser is not
+    recursive, so deeply nested sources (like large assign trees) do not
+    hit the recursion limit.
+
+    :raises ValueError: if the text is not valid relaxed JSON
+    """
+    stack = []  # open containers
+    keys = []  # pending keys of the open objects
+    pos = _skip.match(text, 0).end()
+    while True:
+        # Parse a value, descending into containers until a scalar or an
+        # empty container is found
+        c = text[pos : pos + 1]
+        if c in _closing:
+            stack.append((c, {} if c == "{" else []))
+            pos = _skip.match(text, pos + 1).end()
+            if text[pos : pos + 1] != _closing[c]:
+                if c == "{":
+                    key, pos = _parse_key(text, pos)
+                    pos = _skip.match(text, pos).end()
+                    if text[pos : pos + 1] != ":":
+                        raise _error(text, pos, "':'")
+                    keys.append(key)
+                    pos = _skip.match(text, pos + 1).end()
+                continue
+            value = stack.pop()[1]
+            pos += 1
+        else:
+            value, pos = _parse_scalar(text, pos)
+
+        # Store the value in its container and close all containers
+        # that end here
+        while True:
+            pos = _skip.match(text, pos).end()
+            if not stack:
+                if pos != len(text):
+                    raise _error(text, pos, "end of input")
+                return value
+            opening, container = stack[-1]
+            if opening == "{":
+                container[keys.pop()] = value
+            else:
+                container.append(value)
+            c = text[pos : pos + 1]
+            if c == ",":
+                pos = _skip.match(text, pos + 1).end()
+                c = text[pos : pos + 1]
+                if c != _closing[opening]:
+                    break
+            if c != _closing[opening]:
+                raise _error(text, pos, "',' or '{}'".format(_closing[opening]))
+            value = stack.pop()[1]
+            pos += 1
+
+        if opening == "{":
+            key, pos = _parse_key(text, pos)
+            pos = _skip.match(text, pos).end()
+            if text[pos : pos + 1] != ":":
+                raise _error(text, pos, "':'")
+            keys.append(key)
+            pos = _skip.match(text, pos + 1).end()
+
+
+def loads(text):
+    """Parse a WaveJSON source to Python objects
+
+    Strict JSON is handled by :func:`json.loads`, WaveJSON's relaxed
+    dialect by :func:`loads_relaxed`. Only if both fail the source is
+    parsed as YAML.
+    """
+    try:
+        return json.loads(text)
+    except (ValueError, RecursionError):
+        # json.loads recurses for nested lists, loads_relaxed does not
+        pass
+    try:
+        return loads_relaxed(text)
+    except ValueError:
+        pass
+    import yaml
+
+    return yaml.load(text, Loader=yaml.FullLoader)